@@ -1,11 +1,112 @@
 #!/usr/bin/env python3
 
-from .inflection import inflector
-from .errors import custom_errors
-from pathlib import Path
-import json
+from .backends import JSONBackend
+from .inflection import inflector, context
+from .errors import custom_errors, selector_errors
+from .fuzzy import canonical, folding
+from .lexicon import KEYS, lexicon, freeze, thaw
+from .cache import LRUCache
+from .paradigm import Paradigm
+from .timers import timers
+from .transliteration import Transliterator, stem_pairs
+from bisect import bisect_right
+from timeit import default_timer as timer
 import re
 
+# regex patterns for Persian and IPA alternative and 
+# regular forms, respectively
+PATTERNS = [re.compile(r'(\w{2,}ان)(ی)?(د)?(ن)?'),
+            re.compile(r'(.+)(ید)?(ن)?\b'),
+            re.compile(r'(\w+[ɒuiæeo]?[bpfvtdszʃʒʤʧcɈxGhʔ\
+                                mnrlj]{1,3}ɒn)i?d?(æn)?\b'),
+            re.compile(r'(.+)(id)?(æn)?\b')]
+
+# the number of recent distinct items whose profiles profile_many keeps for
+# their duplicates
+MEMO = 1024
+
+# the routes of profile_many keyed by the regularity of the profiles
+ROUTES = {'Alternative': 'alternative', 'Regular': 'regular', '': 'unmatched'}
+
+# the separator of the words joined by searching; no pattern matches across
+# it, as "." and the character class of the IPA alternative pattern do not
+# match NUL and nothing but NUL could end a match before a newline
+SEPARATOR = '\x00\n'
+
+# the transliterators built from the irregulars, keyed by the lexicon version
+TRANSLITERATORS = {}
+
+
+def searching(pattern, words, templates):
+    """
+    Search and substitute a pattern in every word with a few regex calls
+
+    The words are joined into a single buffer, so every call scans all of
+    them at once; the results are the same as calling `search` and `sub`
+    on every word.
+
+    Parameters
+    ----------
+    pattern : Pattern
+        a compiled pattern
+    words : list
+        the words
+    templates : list
+        the replacement templates
+
+    Returns
+    -------
+    tuple
+        a list of booleans telling if the pattern is found in every word,
+        and a list of the substituted words for every template
+    """
+    # words containing the separator are searched one by one
+    odd = {n for n, word in enumerate(words) if '\x00' in word or '\n' in word}
+    if odd:
+        clean = [n for n in range(len(words)) if n not in odd]
+        found, subs = [None] * len(words), [[None] * len(words) for _ in templates]
+        batch = searching(pattern, [words[n] for n in clean], templates)
+        for m, n in enumerate(clean):
+            found[n] = batch[0][m]
+            for sub, batched in zip(subs, batch[1]):
+                sub[n] = batched[m]
+        for n in odd:
+            found[n] = pattern.search(words[n]) is not None
+            for sub, template in zip(subs, templates):
+                sub[n] = pattern.sub(template, words[n])
+        return found, subs
+
+    buffer = SEPARATOR.join(words)
+    starts, position = [], 0
+    for word in words:
+        starts.append(position)
+        position += len(word) + len(SEPARATOR)
+    found = [False] * len(words)
+    for match in pattern.finditer(buffer):
+        found[bisect_right(starts, match.start()) - 1] = True
+    subs = [pattern.sub(template, buffer).split(SEPARATOR)
+            for template in templates]
+    return found, subs
+
+
+def transliterator():
+    """
+    Get the transliterator built from `CPVI.IPA` and the stems of irregulars
+
+    It is built on first call and again whenever the data files change.
+
+    Returns
+    -------
+    Transliterator
+        the transliterator shared by the whole process
+    """
+    version = lexicon.version
+    shared = TRANSLITERATORS.get(version)
+    if shared is None:
+        shared = TRANSLITERATORS.setdefault(
+            version, Transliterator(CPVI.IPA, stem_pairs(lexicon.irregulars)))
+    return shared
+
 class CPVI():
     """
     A class used to identify and inflect a given verb stem (present or past) 
@@ -20,6 +121,13 @@ class CPVI():
     profile : dict of dicts
         a nested dictionary containing properties and inflected forms of 
         a given verb
+    cache : LRUCache or None
+        the cache of profiles keyed by (word, API_form, space), or None if
+        caching is disabled
+    transliterate : bool
+        if True, the IPA forms of verbs passed without one are guessed
+    backend : Backend
+        the store that irregular verbs are found in
     """
     IPA = {'b': 'ب', 'p': 'پ', 'f': 'ف', 'v': 'و', 't': ['ت', 'ط'], 'd': 'د',
             's': ['س', 'ص', 'ث'], 'z': ['ز', 'ض', 'ظ', 'ذ'], 'ʃ': 'ش', 'ʒ': 'ژ',
@@ -28,10 +136,27 @@ class CPVI():
             'l': 'ل', 'j': 'ی', 'ɒ': ['آ', 'ا'], 'u': 'او', 'i': 'ی',
             'æ': 'فتحه', 'e': 'کسره', 'o': 'ضمه'}
     
-    def __init__(self) -> None:
-        pass
+    def __init__(self, cache_size=0, transliterate=False, backend=None) -> None:
+        """
+        Parameters
+        ----------
+        cache_size : int, optional
+            the maximum number of profiles kept in the cache; the default
+            value 0 disables caching
+        transliterate : bool, optional
+            if True, the API_form of regular and alternative verbs passed
+            without one is guessed by `transliterator()`, so that their IPA
+            paradigms are inflected too
+        backend : Backend, optional
+            the store of irregular verbs, like a `SQLiteBackend`; the
+            default value None reads them from the data files
+        """
+        self.cache = LRUCache(cache_size) if cache_size else None
+        self.transliterate = transliterate
+        self.backend = backend if backend is not None else JSONBackend()
     
-    def profiling(self, word, API_form='', space='\u200c'):
+    def profiling(self, word, API_form='', space='\u200c', select=None,
+                  lazy=False, compact=False, objective=False):
         """
         Get the properties of the verb passed as the word
 
@@ -41,6 +166,21 @@ class CPVI():
             a string in Persian alphabet used to return the Persian form of stems
         API_form : str, optional
             a string in IPA alphabet used to return the IPA form of stems
+        space : str, optional
+            either space (" "), ZWNJ (\\u200c), or empty string ("")
+        select : dict, optional
+            a dictionary mapping layers of the paradigm (formality, alphabet,
+            polarity, tense, and aspect) to a value or a list of values;
+            only the selected branches are inflected
+        lazy : bool, optional
+            if True, every formality, alphabet, and polarity branch of the
+            paradigm is inflected the first time it is accessed
+        compact : bool, optional
+            if True, the paradigm is returned as a read-only `Paradigm`
+            that stores the forms in flat arrays
+        objective : bool, optional
+            if True, the profile gets an objective paradigm containing the
+            forms with object clitics, expanded on first access
         
         Returns
         -------
@@ -49,15 +189,42 @@ class CPVI():
         """
         # raise errors
         custom_errors(API_form, space)
+        selector_errors(select)
 
-        # get the directory path
-        dir_path = Path(__file__).parents[0]
-        path = f'{dir_path}/data/irregulars.json'
+        if compact:
+            profile = self.profiling(word, API_form, space, select,
+                                     objective=objective)
+            profile['paradigm'] = Paradigm(profile['paradigm'])
+            return profile
 
-        # open & load irregulars
-        with open(path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        
+        start = timers.enabled and timer()
+
+        # partial profiles are not cached
+        if self.cache is None or select or lazy or objective:
+            profile = self._profiling(word, API_form, space, select, lazy,
+                                      objective=objective,
+                                      guess=self.transliterate)
+        else:
+            # the cache keeps a frozen copy and callers get their own copies,
+            # so mutating a returned profile could not change the cache
+            key = (word, API_form, space)
+            profile = self.cache.get(key)
+            if profile is not None:
+                profile = thaw(profile)
+            else:
+                profile = self._profiling(word, API_form, space,
+                                          guess=self.transliterate)
+                self.cache.put(key, freeze(profile))
+
+        if start:
+            timers.since('profiling', start)
+        return profile
+
+    def _profiling(self, word, API_form, space, select=None, lazy=False,
+                   table=None, objective=False, guess=False):
+        """
+        Get the properties of the verb without checking the arguments
+        """
         # make shorthands for the dictionary keys
         fp_past = 'formal Persian past stem'
         fp_pres = 'formal Persian present stem'
@@ -68,34 +235,29 @@ class CPVI():
         ia_past = 'informal IPA past stem'
         ia_pres = 'informal IPA present stem'
 
-        # search through irregulars and return the word's profile
-        for entry in data:
-            if (word == entry or
-                word == data[entry][fp_past] or
-                word == data[entry][fp_pres] or
-                word == data[entry][ip_past] or
-                word == data[entry][ip_pres]):
-                return inflector(data[entry], space)
-            # if the entry is a dual verb look for the word in lists
-            elif data[entry]['present dual']:
-                if (word in data[entry][fp_pres] or
-                    word in data[entry][ip_pres]):
-                    return inflector(data[entry], space)
-            elif data[entry]['past dual']:
-                if (word in data[entry][fp_past] or
-                    word in data[entry][ip_past]):
-                    return inflector(data[entry], space)
-        
+        # look the word up in the surface-form index of irregulars
+        start = timers.enabled and timer()
+        backend = self.backend
+        entry = backend.find(word)
+        if start:
+            timers.since('lookup', start)
+        if entry is not None:
+            profile = backend.get(entry)
+            # serve the paradigm from the precomputed artifact if it is built
+            paradigm = backend.paradigm(entry, space)
+            if paradigm is not None:
+                profile['paradigm'] = paradigm
+            return inflector(profile, space, select, lazy, table, objective)
+
         # make a profile frame
-        profile = {key: '' for key in data['دانستن'].keys()}
+        start = timers.enabled and timer()
+        profile = dict.fromkeys(KEYS, '')
+        word = folding(word)
+        if guess and API_form == '':
+            API_form = transliterator().transliterate(word)
 
-        # regex patterns for Persian and IPA alternative and 
-        # regular forms, respectively
-        pat = [re.compile(r'(\w{2,}ان)(ی)?(د)?(ن)?'),
-                re.compile(r'(.+)(ید)?(ن)?\b'),
-                re.compile(r'(\w+[ɒuiæeo]?[bpfvtdszʃʒʤʧcɈxGhʔ\
-                                mnrlj]{1,3}ɒn)i?d?(æn)?\b'),
-                re.compile(r'(.+)(id)?(æn)?\b')]
+        # regex patterns are compiled once at import time
+        pat = PATTERNS
 
         # Alternative Persian form
         if pat[0].search(word):
@@ -131,7 +293,9 @@ class CPVI():
 
         # Alternative IPA form
         if API_form == '':
-            return inflector(profile, space)
+            if start:
+                timers.since('regex', start)
+            return inflector(profile, space, select, lazy, table, objective)
 
         elif pat[2].search(API_form):
             # IPA
@@ -152,7 +316,260 @@ class CPVI():
                 profile[fa_past] = pat[3].sub(r'\1id', API_form)
             profile[ia_pres] = profile[fa_pres]
             profile[ia_past] = profile[fa_past]
-        return inflector(profile, space)
+        if start:
+            timers.since('regex', start)
+        return inflector(profile, space, select, lazy, table, objective)
+
+    def stats(self):
+        """
+        Get the stage timers and the counters of the cache
+
+        The timers are process-wide and off by default; turn them on with
+        `timers.enable()` from CPVI.timers.
+
+        Returns
+        -------
+        dict
+            a dictionary containing whether the timers are enabled, the
+            calls, seconds, and mean seconds of every stage, and the
+            counters and hit rate of the cache, or None if caching is
+            disabled
+        """
+        cache = None
+        if self.cache is not None:
+            cache = self.cache.info()
+            lookups = cache['hits'] + cache['misses']
+            cache['hit rate'] = cache['hits'] / lookups if lookups else None
+        return {'enabled': timers.enabled, 'stages': timers.snapshot(),
+                'cache': cache}
+
+    def profile_many(self, items, space='\u200c', report=None, memo=MEMO):
+        """
+        Get the properties of every verb passed in items
+
+        The space is checked once for the whole batch and the profiles of
+        the most recent distinct items are kept for their duplicates, so the
+        memory does not grow with the number of distinct items. The profiles
+        are the same as the ones returned by calling `profiling` on every
+        item.
+
+        Parameters
+        ----------
+        items : iterable
+            an iterable of words or (word, API_form) tuples
+        space : str, optional
+            either space (" "), ZWNJ (\\u200c), or empty string ("")
+        report : dict, optional
+            a dictionary that is filled with the routes (irregular,
+            alternative, regular, or unmatched) mapped to the lists of
+            (word, API_form) tuples that took them
+        memo : int, optional
+            the number of distinct items whose profiles are kept for their
+            duplicates; 0 profiles every item
+
+        Yields
+        ------
+        dict
+            the profile of every item, in the order of items
+        """
+        # raise errors
+        custom_errors('', space)
+
+        profiles = LRUCache(memo) if memo else None
+        reported = set()
+        table = context(space)
+        for item in items:
+            word, API_form = (item, '') if isinstance(item, str) else item
+            key = (word, API_form)
+            profile = profiles.get(key) if profiles is not None else None
+            if profile is None:
+                custom_errors(API_form)
+                profile = self._profiling(word, API_form, space, table=table,
+                                          guess=self.transliterate)
+                # every distinct item is reported once
+                if report is not None and key not in reported:
+                    reported.add(key)
+                    route = ('irregular' if self.lookup(word) is not None
+                             else ROUTES[profile['regularity']])
+                    report.setdefault(route, []).append(key)
+                # keep a frozen copy for the duplicates
+                if profiles is not None:
+                    profiles.put(key, freeze(profile))
+                yield profile
+            else:
+                yield thaw(profile)
+
+    def derive_many(self, items):
+        """
+        Get the properties and stems of every verb passed in items, without
+        inflecting them
+
+        The regular and alternative patterns are searched and substituted
+        in all the words at once instead of word by word. The profiles are
+        the same as the ones returned by `profiling`, except that the
+        paradigm is an empty string.
+
+        Parameters
+        ----------
+        items : iterable
+            an iterable of words or (word, API_form) tuples
+
+        Returns
+        -------
+        list
+            the profiles of the items, in the order of items
+        """
+        backend = self.backend
+
+        # make shorthands for the dictionary keys
+        fp_past = 'formal Persian past stem'
+        fp_pres = 'formal Persian present stem'
+        ip_past = 'informal Persian past stem'
+        ip_pres = 'informal Persian present stem'
+        fa_past = 'formal IPA past stem'
+        fa_pres = 'formal IPA present stem'
+        ia_past = 'informal IPA past stem'
+        ia_pres = 'informal IPA present stem'
+
+        # irregulars are looked up, and the other words are derived together
+        profiles, words, forms, rest = [], [], [], []
+        for item in items:
+            word, API_form = (item, '') if isinstance(item, str) else item
+            custom_errors(API_form)
+            entry = backend.find(word)
+            if entry is not None:
+                profile = backend.get(entry)
+                profile['paradigm'] = ''
+            else:
+                profile = dict.fromkeys(KEYS, '')
+                rest.append(profile)
+                words.append(folding(word))
+                forms.append(API_form)
+            profiles.append(profile)
+
+        # guess the missing IPA forms of the whole batch at once
+        if self.transliterate:
+            missing = [n for n, API_form in enumerate(forms) if API_form == '']
+            guesses = transliterator().transliterate_many(
+                [words[n] for n in missing])
+            for n, guess in zip(missing, guesses):
+                forms[n] = guess
+
+        # Persian forms
+        alternative, (present, past, dual) = searching(
+            PATTERNS[0], words, [r'\1', r'\1د', r'\1ید'])
+        others = [n for n, found in enumerate(alternative) if not found]
+        regular, (stem, vowel, consonant) = searching(
+            PATTERNS[1], [words[n] for n in others], [r'\1', r'\1ئید', r'\1ید'])
+        for n, profile in enumerate(rest):
+            if not alternative[n]:
+                continue
+            profile['regularity'] = 'Alternative'
+            profile['transitivity'] = 'transitive'
+            profile['lexical aspect'] = 'action'
+            profile['present dual'] = False
+            profile['past dual'] = True
+            profile[fp_pres] = present[n]
+            profile[fp_past] = [past[n], dual[n]]
+            profile[ip_pres] = f'{present[n][:-2]}ون'
+            profile[ip_past] = [f'{profile[ip_pres]}د',
+                                f'{profile[ip_pres]}ید']
+        for m, n in enumerate(others):
+            if not regular[m]:
+                continue
+            profile = rest[n]
+            profile['regularity'] = 'Regular'
+            profile['transitivity'] = 'unknown'
+            profile['lexical aspect'] = 'unknown'
+            profile['past dual'] = False
+            profile['present dual'] = False
+            profile[fp_pres] = stem[m]
+            # stems ended in vowels
+            profile[fp_past] = vowel[m] if stem[m][-1] in 'اوی' else consonant[m]
+            profile[ip_pres] = profile[fp_pres]
+            profile[ip_past] = profile[fp_past]
+
+        # IPA forms
+        given = [n for n, API_form in enumerate(forms) if API_form != '']
+        alternative, (present, past, dual) = searching(
+            PATTERNS[2], [forms[n] for n in given], [r'\1', r'\1d', r'\1id'])
+        others = [m for m, found in enumerate(alternative) if not found]
+        regular, (stem, vowel, consonant) = searching(
+            PATTERNS[3], [forms[given[m]] for m in others], [r'\1', r'\1ʔid', r'\1id'])
+        for m, n in enumerate(given):
+            if not alternative[m]:
+                continue
+            profile = rest[n]
+            profile[fa_pres] = present[m]
+            profile[fa_past] = [past[m], dual[m]]
+            profile[ia_pres] = f'{present[m][:-2]}un'
+            profile[ia_past] = [f'{profile[ia_pres]}d',
+                                f'{profile[ia_pres]}id']
+        for k, m in enumerate(others):
+            if not regular[k]:
+                continue
+            profile = rest[given[m]]
+            profile[fa_pres] = stem[k]
+            # stems ended in vowels
+            profile[fa_past] = vowel[k] if stem[k][-1] in 'æɒouie' else consonant[k]
+            profile[ia_pres] = profile[fa_pres]
+            profile[ia_past] = profile[fa_past]
+        return profiles
+
+    def lookup(self, word, distance=0):
+        """
+        Find the irregular verb that the word is its gerund or one of its stems
+
+        Arabic Yeh and Kaf, diacritics, and ZWNJ or spaces (like می گفت)
+        are ignored; pass a distance to accept misspellings too.
+
+        Parameters
+        ----------
+        word : str
+            a string in Persian alphabet
+        distance : int, optional
+            the largest number of edits between the word and a form of the
+            verb; the default value 0 accepts spelling variants only
+
+        Returns
+        -------
+        str or None
+            the gerund of the irregular verb, or None if the word is not
+            a form of an irregular verb
+        """
+        entry = self.backend.find(word)
+        if entry is None and distance:
+            suggestions = self.suggest(word, distance)
+            if suggestions:
+                entry = suggestions[0][0]
+        return entry
+
+    def suggest(self, word, distance=1):
+        """
+        Find the irregular verbs that have a form close to the word
+
+        Only the irregulars of the data files are searched, whatever the
+        backend is.
+
+        Parameters
+        ----------
+        word : str
+            a string in Persian alphabet
+        distance : int, optional
+            the largest number of edits (insertions, deletions,
+            substitutions, and transpositions) between the canonical keys
+            of the word and a form; either 1 or 2
+
+        Returns
+        -------
+        list
+            (gerund, distance) tuples sorted by the distance
+        """
+        normalized = lexicon.normalized
+        suggestions = {}
+        for key, edits in lexicon.neighborhood.search(canonical(word), distance):
+            suggestions.setdefault(normalized[key], edits)
+        return list(suggestions.items())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+from .backends import JSONBackend, SQLiteBackend
+from .build import build
+from .export import export
+from .lexicon import lexicon
+from .server import serve, SPACES
+from .snapshot import convert
+from .tagger import tag
+from .update import update
+import argparse
+import json
+import sys
+
+
+def reading(path):
+    """
+    Read a file of verbs, one "word" or "word<TAB>IPA" per line
+
+    Parameters
+    ----------
+    path : str
+        the path of the file
+
+    Yields
+    ------
+    str or tuple
+        the word, or the (word, API_form) tuple of every line
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            fields = line.rstrip('\n').split('\t')
+            if not fields[0].strip():
+                continue
+            yield tuple(fields[:2]) if len(fields) > 1 else fields[0]
+
+
+def main(argv=None):
+    """
+    Run the command line interface
+
+    Parameters
+    ----------
+    argv : list, optional
+        the arguments; the default value None uses sys.argv
+    """
+    parser = argparse.ArgumentParser(prog='python -m CPVI',
+        description='Comprehensive Persian Verb Inflector')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    tagger = commands.add_parser('tag',
+        help='write a JSON line for every verb form of a UTF-8 corpus')
+    tagger.add_argument('corpus', help='the path of the corpus')
+    tagger.add_argument('-o', '--output', help='the path of the JSON lines')
+    tagger.add_argument('--offset', type=int, default=0,
+        help='the byte offset to resume from')
+    tagger.add_argument('--verbs',
+        help='a file of other verbs to index, one "word[<TAB>IPA]" per line')
+
+    builder = commands.add_parser('build',
+        help='precompute the paradigms of the irregular verbs')
+    builder.add_argument('-o', '--output', help='the path of the artifact')
+
+    updater = commands.add_parser('update',
+        help='apply a change set to the irregulars and rebuild the '
+             'paradigms that depend on it')
+    updater.add_argument('changes', help='a JSON file mapping gerunds to '
+        'their new properties, or to null to remove them')
+
+    store = commands.add_parser('store',
+        help='add, change, or remove verbs in an SQLite lexicon')
+    store.add_argument('database', help='the path of the database')
+    store.add_argument('changes', nargs='?', help='a JSON file mapping '
+        'gerunds to their properties, or to null to remove them')
+    store.add_argument('--irregulars', action='store_true',
+        help='add the irregulars of the data files too')
+    store.add_argument('--no-paradigms', action='store_true',
+        help='inflect the verbs on every call instead of precomputing them')
+
+    exporter = commands.add_parser('export',
+        help='write every inflected form as a row')
+    exporter.add_argument('verbs', nargs='?',
+        help='a file of verbs, one "word[<TAB>IPA]" per line; the default '
+             'is every irregular verb')
+    exporter.add_argument('-o', '--output', help='the path of the rows')
+    exporter.add_argument('-f', '--format', default='csv',
+        choices=['csv', 'tsv', 'jsonl'], help='the format of the rows')
+    exporter.add_argument('--space', default='zwnj', choices=list(SPACES),
+        help='the space put between the parts of the forms')
+    exporter.add_argument('--transliterate', action='store_true',
+        help='guess the IPA forms of the verbs given without one')
+    exporter.add_argument('--database',
+        help='an SQLite lexicon to look the irregular verbs up in')
+
+    snapshot = commands.add_parser('snapshot',
+        help='convert the data files to a binary snapshot')
+    snapshot.add_argument('-o', '--output', help='the path of the snapshot')
+
+    server = commands.add_parser('serve',
+        help='serve profiles over HTTP')
+    server.add_argument('--host', default='127.0.0.1',
+        help='the host to listen on')
+    server.add_argument('--port', type=int, default=8000,
+        help='the port to listen on')
+    server.add_argument('--workers', type=int, default=4,
+        help='the number of threads profiling verbs')
+    server.add_argument('--cache-size', type=int, default=0,
+        help='the maximum number of cached profiles')
+    server.add_argument('--no-coalesce', action='store_true',
+        help='compute duplicate in-flight requests separately')
+
+    args = parser.parse_args(argv)
+    if args.command == 'build':
+        print(build(args.output))
+        return
+    if args.command == 'update':
+        with open(args.changes, 'r', encoding='utf-8') as file:
+            print(update(json.load(file)))
+        return
+    if args.command == 'store':
+        changes = dict(lexicon.irregulars) if args.irregulars else {}
+        if args.changes:
+            with open(args.changes, 'r', encoding='utf-8') as file:
+                changes.update(json.load(file))
+        print(SQLiteBackend(args.database).upsert(changes, not args.no_paradigms))
+        return
+    if args.command == 'export':
+        backend = SQLiteBackend(args.database) if args.database else JSONBackend()
+        items = reading(args.verbs) if args.verbs else list(backend.gerunds())
+        output = (open(args.output, 'w', encoding='utf-8', newline='')
+                  if args.output else sys.stdout)
+        try:
+            count = export(items, output, args.format, SPACES[args.space],
+                           transliterate=args.transliterate, backend=backend)
+        finally:
+            if args.output:
+                output.close()
+        print(f'{count} rows', file=sys.stderr)
+        return
+    if args.command == 'snapshot':
+        print(convert(args.output))
+        return
+    if args.command == 'serve':
+        serve(args.host, args.port, args.workers, not args.no_coalesce,
+              args.cache_size)
+        return
+
+    verbs = list(reading(args.verbs)) if args.verbs else []
+    output = (open(args.output, 'a', encoding='utf-8') if args.output
+              else sys.stdout)
+    try:
+        stats = tag(args.corpus, output, args.offset, verbs, sys.stderr)
+    finally:
+        if args.output:
+            output.close()
+    print(f"{stats['tokens']} tokens, {stats['verbs']} verb forms, "
+          f"{stats['tokens/s']:.0f} tokens/s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
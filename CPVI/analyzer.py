@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+from .errors import custom_errors
+from .fuzzy import folding
+from .inflection import inflector
+from .lexicon import lexicon, thaw
+
+# the layers of the paradigm hierarchy, from formality to person and number,
+# followed by the object of objective paradigms
+FEATURES = ['formality', 'alphabet', 'polarity', 'tense', 'aspect', 'person',
+            'object']
+
+
+def walk(node, path=()):
+    """
+    Iterate through the inflected forms of a paradigm
+
+    Lists of dual stems and lists of alternative endings are flattened, so
+    every form is yielded separately with the keys leading to it.
+
+    Parameters
+    ----------
+    node : dict, list, str, or None
+        a paradigm or a branch of it
+    path : tuple, optional
+        the keys leading to node
+
+    Yields
+    ------
+    tuple
+        a tuple of the keys leading to the form and the form
+    """
+    if isinstance(node, dict):
+        for key, val in node.items():
+            yield from walk(val, path + (key,))
+    elif isinstance(node, list):
+        for val in node:
+            yield from walk(val, path)
+    elif isinstance(node, str) and node:
+        yield path, node
+
+
+def lemma(profile):
+    """
+    Make the gerund of the verb from its formal Persian past stem
+
+    Parameters
+    ----------
+    profile : dict
+        a dictionary containing the properties of the verb
+
+    Returns
+    -------
+    str
+        the gerund of the verb
+    """
+    stem = profile['formal Persian past stem']
+    return f'{stem[0] if isinstance(stem, list) else stem}ن'
+
+
+def key(form):
+    """
+    Make the index key of a form; ZWNJ and space, and Arabic and Persian
+    Yeh and Kaf are not distinguished
+
+    Parameters
+    ----------
+    form : str
+        an inflected form
+
+    Returns
+    -------
+    str
+        the folded form with every ZWNJ replaced by space
+    """
+    return folding(form).replace('\u200c', ' ')
+
+
+class Analyzer():
+    """
+    A hash index mapping every inflected form to its lemmas and features
+
+    Looking a token up costs a single hash of the token, so it does not
+    depend on the number of indexed verbs. Forms spelled with ZWNJ and
+    with space are indexed under the same key.
+
+    Attributes
+    ----------
+    space : str
+        the space used to inflect the indexed verbs
+    forms : dict
+        the keys of inflected forms mapped to lists of (lemma, features)
+        tuples
+    """
+    def __init__(self, space='\u200c', irregulars=True) -> None:
+        """
+        Parameters
+        ----------
+        space : str, optional
+            either space (" "), ZWNJ (\\u200c), or empty string ("")
+        irregulars : bool, optional
+            if True, index every irregular verb of the lexicon
+        """
+        custom_errors('', space)
+        self.space = space
+        self.forms = {}
+        if irregulars:
+            for entry, props in lexicon.irregulars.items():
+                paradigm = lexicon.paradigm(entry, space)
+                if paradigm is None:
+                    paradigm = inflector(thaw(props), space)['paradigm']
+                self.insert(entry, paradigm)
+
+    def __len__(self):
+        return len(self.forms)
+
+    def __contains__(self, token):
+        return key(token) in self.forms
+
+    def insert(self, lemma, paradigm):
+        """
+        Index every inflected form of a paradigm
+
+        Parameters
+        ----------
+        lemma : str
+            the gerund of the verb
+        paradigm : dict
+            a nested dictionary containing the inflected forms of the verb
+
+        Returns
+        -------
+        int
+            the number of (form, features) pairs that were new
+        """
+        added = 0
+        for path, form in walk(paradigm):
+            analyses = self.forms.setdefault(key(form), [])
+            analysis = (lemma, path)
+            if analysis not in analyses:
+                analyses.append(analysis)
+                added += 1
+        return added
+
+    def add(self, profile):
+        """
+        Index the inflected forms of a profile returned by `CPVI.profiling`,
+        including its objective paradigm if it has one
+
+        Parameters
+        ----------
+        profile : dict
+            a dictionary containing the properties and the paradigm of a verb
+
+        Returns
+        -------
+        int
+            the number of (form, features) pairs that were new
+        """
+        added = self.insert(lemma(profile), profile['paradigm'])
+        if 'objective paradigm' in profile:
+            added += self.insert(lemma(profile), profile['objective paradigm'])
+        return added
+
+    def analyze(self, token):
+        """
+        Get every analysis of an inflected form
+
+        Parameters
+        ----------
+        token : str
+            an inflected form in Persian or IPA alphabet
+
+        Returns
+        -------
+        list of dicts
+            dictionaries containing the lemma and the formality, alphabet,
+            polarity, tense, aspect, and person of every analysis
+        """
+        analyses = []
+        for gerund, path in self.forms.get(key(token), []):
+            analysis = {'lemma': gerund}
+            analysis.update(zip(FEATURES, path))
+            analyses.append(analysis)
+        return analyses
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+
+from .build import SPACES, encoding
+from .fuzzy import canonical, finding, unprefixing
+from .lexicon import KEYS, lexicon, surface_forms, thaw
+from .update import update
+from abc import ABC, abstractmethod
+from timeit import default_timer as timer
+import threading
+import sqlite3
+import json
+
+# the tables of the SQLite backend; every surface form is a row of forms,
+# indexed as it is written and by its canonical key
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS verbs (
+    gerund TEXT PRIMARY KEY,
+    props TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS forms (
+    form TEXT NOT NULL,
+    key TEXT NOT NULL,
+    field TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    gerund TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS forms_form ON forms (form);
+CREATE INDEX IF NOT EXISTS forms_key ON forms (key);
+CREATE INDEX IF NOT EXISTS forms_gerund ON forms (gerund);
+CREATE TABLE IF NOT EXISTS paradigms (
+    gerund TEXT NOT NULL,
+    space TEXT NOT NULL,
+    version TEXT NOT NULL,
+    paradigm TEXT NOT NULL,
+    PRIMARY KEY (gerund, space)) WITHOUT ROWID;
+'''
+
+# the entry of a form is the first entry inserted that has it, like in
+# surface_index, and a canonical key prefers the forms written canonically,
+# like in normalized_index
+FINDING = '''
+SELECT forms.gerund FROM forms JOIN verbs ON verbs.gerund = forms.gerund
+WHERE forms.form = ? ORDER BY verbs.rowid, forms.position LIMIT 1'''
+KEYING = '''
+SELECT forms.gerund FROM forms JOIN verbs ON verbs.gerund = forms.gerund
+WHERE forms.key = ? AND forms.form != ''
+ORDER BY forms.form != forms.key, verbs.rowid, forms.position LIMIT 1'''
+
+
+class Backend(ABC):
+    """
+    The interface of the stores of irregular verbs that profiling reads
+
+    A backend finds the entry of a surface form, returns the properties
+    and the precomputed paradigms of entries, and applies change sets. The
+    conjugations and the auxiliaries that inflection is made of are always
+    read from the data files. A subclass that does not implement every
+    method cannot be instantiated.
+    """
+    @abstractmethod
+    def find(self, word):
+        """
+        Find the irregular verb that the word is its gerund or one of its
+        stems
+
+        Parameters
+        ----------
+        word : str
+            a string in Persian alphabet
+
+        Returns
+        -------
+        str or None
+            the gerund of the irregular verb, or None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, gerund):
+        """
+        Get the properties of an irregular verb
+
+        Parameters
+        ----------
+        gerund : str
+            the gerund of the irregular verb
+
+        Returns
+        -------
+        dict
+            a fresh, mutable copy of the properties
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def paradigm(self, gerund, space):
+        """
+        Retrieve the precomputed paradigm of an irregular verb
+
+        Parameters
+        ----------
+        gerund : str
+            the gerund of the irregular verb
+        space : str
+            either space (" "), ZWNJ (\\u200c), or empty string ("")
+
+        Returns
+        -------
+        dict or None
+            a fresh copy of the paradigm, or None if it is not precomputed
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def gerunds(self):
+        """
+        Get the gerunds of the irregular verbs in the order they were added
+
+        Returns
+        -------
+        iterator
+            the gerunds
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert(self, changes, paradigms=True, caches=()):
+        """
+        Add, change, or remove irregular verbs
+
+        Parameters
+        ----------
+        changes : dict
+            the gerunds mapped to their properties, as they are in
+            irregulars.json, or to None to remove the entry
+        paradigms : bool, optional
+            if True, the paradigms of the changed entries are precomputed
+        caches : iterable, optional
+            the `LRUCache` objects of `CPVI` instances whose stale profiles
+            should be removed
+
+        Returns
+        -------
+        dict
+            the report of the changes
+        """
+        raise NotImplementedError
+
+
+class JSONBackend(Backend):
+    """
+    The irregulars of the data files, loaded at once into the shared
+    lexicon; this is the default backend of `CPVI`
+    """
+    def find(self, word):
+        entry = lexicon.index.get(word)
+        if entry is None:
+            # spelling variants like Arabic Yeh and Kaf or می گفت
+            entry = finding(word, lexicon.normalized)
+        return entry
+
+    def get(self, gerund):
+        return thaw(lexicon.irregulars[gerund])
+
+    def paradigm(self, gerund, space):
+        return lexicon.paradigm(gerund, space)
+
+    def gerunds(self):
+        return iter(lexicon.irregulars)
+
+    def upsert(self, changes, paradigms=True, caches=()):
+        # irregulars.json and the artifact are rewritten by update, which
+        # always precomputes the paradigms
+        return update(changes, caches)
+
+
+class SQLiteBackend(Backend):
+    """
+    Irregular verbs stored in an SQLite database, read one entry at a time
+
+    Every gerund and stem is indexed as it is written and by its canonical
+    key, so finding an entry is a query of an index, and the paradigms
+    precomputed by `upsert` are stored next to the entries. Paradigms
+    inflected from other data files are ignored. Every thread gets its own
+    connection, so the path should be a file rather than ":memory:".
+
+    Attributes
+    ----------
+    path : str
+        the path of the database
+    """
+    def __init__(self, path) -> None:
+        """
+        Parameters
+        ----------
+        path : str or Path
+            the path of the database; it is made if it does not exist
+        """
+        self.path = str(path)
+        self._local = threading.local()
+        self.connection.executescript(SCHEMA)
+
+    @property
+    def connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self.path)
+        return connection
+
+    def __reduce__(self):
+        # a copy, like one sent to another process, opens its own connection
+        return (SQLiteBackend, (self.path,))
+
+    def close(self):
+        """
+        Close the connection of the calling thread
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM verbs').fetchone()[0]
+
+    def find(self, word):
+        execute = self.connection.execute
+        row = execute(FINDING, (word,)).fetchone()
+        if row is not None:
+            return row[0]
+        # the same fallbacks as finding
+        def keying(key):
+            row = execute(KEYING, (key,)).fetchone()
+            return row[0] if row is not None else None
+
+        entry = keying(canonical(word))
+        if entry is None:
+            entry = unprefixing(word, keying)
+        return entry
+
+    def get(self, gerund):
+        row = self.connection.execute(
+            'SELECT props FROM verbs WHERE gerund = ?', (gerund,)).fetchone()
+        if row is None:
+            raise KeyError(gerund)
+        return json.loads(row[0])
+
+    def paradigm(self, gerund, space):
+        row = self.connection.execute(
+            'SELECT version, paradigm FROM paradigms WHERE gerund = ? AND space = ?',
+            (gerund, space)).fetchone()
+        if row is None or row[0] != lexicon.version:
+            return None
+        return json.loads(row[1])
+
+    def gerunds(self):
+        cursor = self.connection.execute('SELECT gerund FROM verbs ORDER BY rowid')
+        return (gerund for gerund, in cursor)
+
+    def upsert(self, changes, paradigms=True, caches=()):
+        """
+        Add, change, or remove irregular verbs in a single transaction
+
+        Entries that are changed keep their place in the order of the
+        entries, and new entries are added after the others.
+
+        Parameters
+        ----------
+        changes : dict
+            the gerunds mapped to their properties, as they are in
+            irregulars.json, or to None to remove the entry
+        paradigms : bool, optional
+            if True, the paradigms of the changed entries are inflected for
+            every space option and stored; otherwise they are inflected on
+            every call of profiling
+        caches : iterable, optional
+            the `LRUCache` objects of `CPVI` instances whose stale profiles
+            should be removed
+
+        Returns
+        -------
+        dict
+            the numbers of upserted and removed entries, stored paradigms,
+            and profiles removed from the caches, and the seconds taken
+
+        Raises
+        ------
+        ValueError
+            if the properties of an entry do not have the keys of `KEYS`
+        """
+        start = timer()
+        keys = set(KEYS)
+        for entry, props in changes.items():
+            if props is not None and set(props) != keys:
+                raise ValueError(f'''The properties of "{entry}" should have these keys:
+                {", ".join(sorted(keys))}''')
+
+        # profiles served from a changed entry are stale, before and after
+        touched = set(changes)
+
+        def expired(key):
+            return self.find(key[0]) in touched
+
+        evicted = sum(cache.discard(expired) for cache in caches)
+
+        removed = [(entry,) for entry, props in changes.items() if props is None]
+        upserted = [(entry, props) for entry, props in changes.items()
+                    if props is not None]
+        version = lexicon.version
+        with self.connection as connection:
+            gerunds = [(entry,) for entry in changes]
+            connection.executemany('DELETE FROM forms WHERE gerund = ?', gerunds)
+            connection.executemany('DELETE FROM paradigms WHERE gerund = ?', gerunds)
+            connection.executemany('DELETE FROM verbs WHERE gerund = ?', removed)
+            connection.executemany(
+                'INSERT INTO verbs VALUES (?, ?) ON CONFLICT (gerund) '
+                'DO UPDATE SET props = excluded.props',
+                ((entry, json.dumps(props, ensure_ascii=False,
+                                    separators=(',', ':')))
+                 for entry, props in upserted))
+            connection.executemany(
+                'INSERT INTO forms VALUES (?, ?, ?, ?, ?)',
+                ((form, canonical(form), field, position, entry)
+                 for entry, props in upserted
+                 for position, (field, form)
+                 in enumerate(surface_forms(entry, props))))
+            if paradigms:
+                connection.executemany(
+                    'INSERT INTO paradigms VALUES (?, ?, ?, ?)',
+                    ((entry, space, version, encoding(props, space))
+                     for entry, props in upserted for space in SPACES))
+
+        evicted += sum(cache.discard(expired) for cache in caches)
+        return {'upserted': len(upserted), 'removed': len(removed),
+                'paradigms': len(upserted) * len(SPACES) if paradigms else 0,
+                'evicted': evicted, 'seconds': timer() - start}
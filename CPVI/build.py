@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+from .inflection import inflector
+from .lexicon import lexicon, thaw, ARTIFACT
+from pathlib import Path
+import argparse
+import gzip
+import json
+import os
+import stat
+import tempfile
+
+# the space options of profiling
+SPACES = ['\u200c', ' ', '']
+
+
+def encoding(props, space):
+    """
+    Inflect an irregular verb and encode its paradigm as JSON text
+
+    Parameters
+    ----------
+    props : dict
+        the properties of the verb as they are in irregulars.json
+    space : str
+        either space (" "), ZWNJ (\\u200c), or empty string ("")
+
+    Returns
+    -------
+    str
+        the paradigm as compact JSON text
+    """
+    paradigm = inflector(thaw(props), space)['paradigm']
+    return json.dumps(paradigm, ensure_ascii=False, separators=(',', ':'))
+
+
+def replacing(path, raw):
+    """
+    Write a file so that readers find either the old or the new content
+
+    The content is written to a temporary file in the same directory that
+    then replaces the file, so a crash could not leave it half-written. The
+    file keeps its permissions, and a new file gets the ones of `open`.
+
+    Parameters
+    ----------
+    path : str or Path
+        the path of the file
+    raw : bytes
+        the new content
+    """
+    path = Path(path)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        # the temporary file is private, so apply the umask like open does
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            os.chmod(temporary, mode)
+            file.write(raw)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def writing(paradigms, version, path, level=9):
+    """
+    Write the encoded paradigms to the artifact
+
+    Parameters
+    ----------
+    paradigms : dict
+        the spaces mapped to dictionaries of the gerunds and the encoded
+        paradigms
+    version : str
+        the version of the data files that the paradigms were inflected from
+    path : str or Path
+        the path of the artifact
+    level : int, optional
+        the gzip compression level; lower levels are faster but larger
+    """
+    artifact = {'version': version, 'paradigms': paradigms}
+    raw = json.dumps(artifact, ensure_ascii=False, separators=(',', ':'))
+    # a zero mtime keeps the artifact identical across builds
+    replacing(path, gzip.compress(raw.encode('utf-8'), level, mtime=0))
+
+
+def build(path=None):
+    """
+    Inflect every irregular verb for every space option and write the
+    paradigms to the artifact that profiling reads irregulars from
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        the path of the artifact; the default value is
+        data/paradigms.json.gz next to the data files
+
+    Returns
+    -------
+    dict
+        the number of paradigms written and the version of the data files
+    """
+    path = path or lexicon.path / ARTIFACT
+
+    # every paradigm is stored as JSON text so that it is decoded on demand
+    paradigms = {}
+    for space in SPACES:
+        paradigms[space] = {}
+        for entry, props in lexicon.irregulars.items():
+            paradigms[space][entry] = encoding(props, space)
+
+    version = lexicon.version
+    writing(paradigms, version, path)
+    lexicon.reload()
+    return {'paradigms': len(SPACES) * len(lexicon.irregulars),
+            'version': version}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Precompute the paradigms of the irregular verbs')
+    parser.add_argument('-o', '--output', help='the path of the artifact')
+    args = parser.parse_args()
+    print(build(args.output))
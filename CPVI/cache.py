@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+import threading
+
+
+class LRUCache():
+    """
+    A thread-safe, size-bounded cache that evicts the least recently used item
+
+    Attributes
+    ----------
+    maxsize : int
+        the maximum number of items kept in the cache
+    hits : int
+        the number of lookups that found their key
+    misses : int
+        the number of lookups that did not find their key
+    evictions : int
+        the number of items dropped to keep the cache within maxsize
+    """
+    def __init__(self, maxsize=1024) -> None:
+        if maxsize < 1:
+            raise ValueError('The "maxsize" argument should be a positive integer')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """
+        Retrieve the value of the key and mark it as the most recently used
+
+        Parameters
+        ----------
+        key : hashable
+            the key of the item
+        default : optional
+            the value returned if the key is not in the cache
+
+        Returns
+        -------
+        object
+            the cached value or default
+        """
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Store the value and evict the least recently used items if needed
+
+        Parameters
+        ----------
+        key : hashable
+            the key of the item
+        value : object
+            the value of the item
+        """
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, predicate):
+        """
+        Remove the items that their keys satisfy the predicate
+
+        Parameters
+        ----------
+        predicate : callable
+            a function of a key that returns True if the item is stale
+
+        Returns
+        -------
+        int
+            the number of items removed
+        """
+        with self._lock:
+            stale = [key for key in self._items if predicate(key)]
+            for key in stale:
+                del self._items[key]
+        return len(stale)
+
+    def clear(self):
+        """
+        Remove every item and reset the counters
+        """
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """
+        Get the counters of the cache
+
+        Returns
+        -------
+        dict
+            a dictionary containing hits, misses, evictions, size, and maxsize
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'size': len(self._items),
+                    'maxsize': self.maxsize}
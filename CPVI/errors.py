@@ -25,4 +25,32 @@ def custom_errors(IPA, space=''):
             Use "CPVI.IPA" to see the mapping between Persian and IPA alphabet''')
     if space not in ['', ' ', '\u200c']:
         raise ValueError(f'''The "space" argument could not be a "{space}".
-        Use space, \\u200c, or empty string as the space argument''')
\ No newline at end of file
+        Use space, \\u200c, or empty string as the space argument''')
+
+def selector_errors(select):
+    """
+    raise ValueError if the selector has a layer or a value that is not in
+    the paradigm hierarchy
+
+    Parameters
+    ----------
+    select : dict or None
+        a dictionary mapping layers (formality, alphabet, polarity, tense,
+        and aspect) to a value or a list of values
+    
+    Returns
+    -------
+    ValueError
+        if a layer or a value of the selector is not in the hierarchy
+    """
+    from .inflection import LAYERS
+    for layer, values in (select or {}).items():
+        if layer not in LAYERS:
+            raise ValueError(f'''The "{layer}" layer could not be selected.
+            Use {", ".join(LAYERS)} as the layers of the selector''')
+        if values is None:
+            continue
+        for value in [values] if isinstance(values, str) else values:
+            if value not in LAYERS[layer]:
+                raise ValueError(f'''The "{value}" could not be selected as {layer}.
+                Use {", ".join(LAYERS[layer])} as the values of {layer}''')
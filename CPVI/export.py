@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+from .CPVI import CPVI
+from .analyzer import lemma, walk
+from .errors import custom_errors, selector_errors
+from .inflection import LAYERS, EVERY, selector, pruning, context, assembling
+import csv
+import json
+
+# the columns of the exported rows
+COLUMNS = ['lemma', 'formality', 'alphabet', 'polarity', 'tense', 'aspect',
+           'person', 'form']
+
+# the delimiters of the delimited formats
+DELIMITERS = {'csv': ',', 'tsv': '\t'}
+
+
+def rows(profile, space='\u200c', select=None, table=None, gerund=None):
+    """
+    Generate a row for every inflected form of a verb
+
+    The rows are made while the paradigm is assembled, without building
+    the nested dictionary. Dual stems and alternative endings give a row
+    for every variant.
+
+    Parameters
+    ----------
+    profile : dict
+        a dictionary containing the properties of the verb; a paradigm that
+        is already filled is walked instead
+    space : str, optional
+        either space (" "), ZWNJ (\\u200c), or empty string ("")
+    select : dict, optional
+        a dictionary mapping layers (formality, alphabet, polarity, tense,
+        and aspect) to a value or a list of values
+    table : dict, optional
+        the inflection context of the space returned by `context`
+    gerund : str, optional
+        the lemma of the rows; the default value is made from the formal
+        Persian past stem
+
+    Yields
+    ------
+    tuple
+        the lemma, formality, alphabet, polarity, tense, aspect, person,
+        and form
+    """
+    select = selector(select)
+    gerund = gerund or lemma(profile)
+
+    # irregulars like بودن come with their paradigms
+    if profile['paradigm']:
+        paradigm = profile['paradigm']
+        if select is not EVERY:
+            paradigm = pruning(paradigm, select)
+        for path, form in walk(paradigm):
+            yield (gerund,) + path + (form,)
+        return
+
+    if table is None:
+        table = context(space)
+    for frmlty in LAYERS['formality']:
+        if frmlty not in select['formality']:
+            continue
+        for alphabet in LAYERS['alphabet']:
+            if alphabet not in select['alphabet']:
+                continue
+            for polarity in LAYERS['polarity']:
+                if polarity not in select['polarity']:
+                    continue
+                cells = assembling(profile, space, frmlty, alphabet, polarity,
+                                   select, table[frmlty, alphabet, polarity])
+                for tense, aspect, persons in cells:
+                    # continuous forms are assembled for progressives too
+                    if (aspect is None or tense not in select['tense']
+                            or aspect not in select['aspect']):
+                        continue
+                    for person, forms in persons.items():
+                        if forms is None:
+                            continue
+                        for form in [forms] if isinstance(forms, str) else forms:
+                            if form:
+                                yield (gerund, frmlty, alphabet, polarity,
+                                       tense, aspect, person, form)
+
+
+def exporting(items, space='\u200c', select=None, transliterate=False,
+              backend=None):
+    """
+    Generate the rows of every verb passed in items
+
+    Parameters
+    ----------
+    items : iterable
+        an iterable of words or (word, API_form) tuples
+    space : str, optional
+        either space (" "), ZWNJ (\\u200c), or empty string ("")
+    select : dict, optional
+        a dictionary mapping layers of the paradigm to a value or a list of
+        values
+    transliterate : bool, optional
+        if True, the IPA forms of verbs passed without one are guessed
+    backend : Backend, optional
+        the store of irregular verbs that the words are looked up in; the
+        default value None reads them from the data files
+
+    Yields
+    ------
+    tuple
+        the lemma, formality, alphabet, polarity, tense, aspect, person,
+        and form of every inflected form
+    """
+    custom_errors('', space)
+    selector_errors(select)
+    table = context(space)
+    p = CPVI(transliterate=transliterate, backend=backend)
+    for item in items:
+        word, API_form = (item, '') if isinstance(item, str) else item
+        # irregulars are found like profiling finds them
+        entry = p.backend.find(word)
+        if entry is not None:
+            profile = p.backend.get(entry)
+        else:
+            # a lazy profile derives the stems without inflecting them
+            profile = p.profiling(word, API_form, space, lazy=True)
+            profile['paradigm'] = ''
+            entry = lemma(profile)
+        yield from rows(profile, space, select, table, entry)
+
+
+def export(items, output, fmt='csv', space='\u200c', select=None,
+           transliterate=False, backend=None):
+    """
+    Write every inflected form of the verbs passed in items as it is made
+
+    Parameters
+    ----------
+    items : iterable
+        an iterable of words or (word, API_form) tuples
+    output : text file
+        the file that the rows are written to; open it with newline=''
+        for CSV and TSV
+    fmt : str, optional
+        either csv, tsv, or jsonl
+    space : str, optional
+        either space (" "), ZWNJ (\\u200c), or empty string ("")
+    select : dict, optional
+        a dictionary mapping layers of the paradigm to a value or a list of
+        values
+    transliterate : bool, optional
+        if True, the IPA forms of verbs passed without one are guessed
+    backend : Backend, optional
+        the store of irregular verbs that the words are looked up in; the
+        default value None reads them from the data files
+
+    Returns
+    -------
+    int
+        the number of rows written
+    """
+    if fmt not in ['csv', 'tsv', 'jsonl']:
+        raise ValueError(f'''The "{fmt}" format is not supported.
+        Use csv, tsv, or jsonl as the format''')
+
+    count = 0
+    if fmt == 'jsonl':
+        for row in exporting(items, space, select, transliterate, backend):
+            output.write(json.dumps(dict(zip(COLUMNS, row)),
+                                    ensure_ascii=False) + '\n')
+            count += 1
+        return count
+
+    writer = csv.writer(output, delimiter=DELIMITERS[fmt], lineterminator='\n')
+    writer.writerow(COLUMNS)
+    for row in exporting(items, space, select, transliterate, backend):
+        writer.writerow(row)
+        count += 1
+    return count
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+
+from .inflection import LAYERS, EVERY, context, assembling
+from .lexicon import lexicon
+from .utils import steming, unpack
+import gzip
+import json
+
+# a private-use character that stands for the body of the probed stems
+MARKER = '\ue000'
+
+# the beginnings of stems that prefixing treats differently, and a
+# beginning that it leaves as it is
+HEADS = {'Persian': ['آ', 'ا', 'ای'],
+         'IPA': ['ɒ', 'æ', 'o', 'e', 'i', 'u', 'ʔ', 'ʔɒ', 'ʔæ', 'ʔo', 'ʔe',
+                 'ʔi', 'ʔu']}
+OTHERS = {'Persian': 'ب', 'IPA': 'b'}
+
+# the stems of the probes
+KINDS = ['present', 'past']
+
+# the letters of the Persian IPA alphabet, as `custom_errors` checks them
+LETTERS = set('ɒuiæeobpfvtdszʃʒʤʧcɈxGhʔmnrlj')
+
+
+class Transducer():
+    """
+    A finite-state transducer with string outputs and default arcs
+
+    Every state has arcs keyed by input symbols, an optional default arc
+    taken by any symbol that has no arc of its own, and an optional final
+    output. A default arc either copies the symbol after its output or
+    drops it.
+
+    Attributes
+    ----------
+    arcs : list of dicts
+        the arcs of every state, mapping input symbols to lists of
+        (output, target) tuples
+    defaults : list
+        the (output, target, copy) default arc of every state, or None
+    finals : list
+        the final output of every state, or None if it is not final
+    """
+    def __init__(self) -> None:
+        self.arcs = []
+        self.defaults = []
+        self.finals = []
+        self._endings = None
+        self.start = self.state()
+
+    def __len__(self):
+        return len(self.arcs)
+
+    def state(self, final=None):
+        """
+        Add a state
+
+        Parameters
+        ----------
+        final : str, optional
+            the final output; the default value None makes it non-final
+
+        Returns
+        -------
+        int
+            the number of the state
+        """
+        self.arcs.append({})
+        self.defaults.append(None)
+        self.finals.append(final)
+        self._endings = None
+        return len(self.arcs) - 1
+
+    def arc(self, source, symbol, output, target):
+        """
+        Add an arc reading the symbol and writing the output
+        """
+        self.arcs[source].setdefault(symbol, []).append((output, target))
+        self._endings = None
+
+    def default(self, source, output, target, copy=True):
+        """
+        Set the arc taken by the symbols that have no arc of their own
+        """
+        self.defaults[source] = (output, target, copy)
+        self._endings = None
+
+    def transduce(self, symbols):
+        """
+        Get every output of a sequence of input symbols
+
+        Parameters
+        ----------
+        symbols : iterable
+            the input symbols
+
+        Returns
+        -------
+        list
+            the outputs of every accepting path, in the order of the arcs
+        """
+        paths = [(self.start, '')]
+        for symbol in symbols:
+            following = []
+            for state, output in paths:
+                arcs = self.arcs[state].get(symbol)
+                if arcs:
+                    following += [(target, output + out) for out, target in arcs]
+                elif self.defaults[state] is not None:
+                    out, target, copy = self.defaults[state]
+                    following.append((target, output + out + (symbol if copy else '')))
+            paths = following
+        return [output + self.finals[state] for state, output in paths
+                if self.finals[state] is not None]
+
+    def invert(self, output):
+        """
+        Get every input sequence that is transduced to the output
+
+        Default arcs that drop their symbols could read any input, so the
+        paths through them are not followed.
+
+        Parameters
+        ----------
+        output : str
+            an output of the transducer
+
+        Returns
+        -------
+        list of lists
+            the input symbols of every path writing exactly the output
+        """
+        if self._endings is None:
+            self._index()
+        memo = {}
+
+        def ending(target):
+            # the output ends with a final that the target could reach
+            return any(output.endswith(final) for final in self._endings[target])
+
+        def inputs(state, position):
+            key = (state, position)
+            if key in memo:
+                return memo[key]
+            found = []
+            final = self.finals[state]
+            if final is not None and output.startswith(final, position) and \
+                    position + len(final) == len(output):
+                found.append([])
+            arcs = self._lasts[state]
+            for symbol, out, target in arcs.get(output[-1:], []) + arcs[None]:
+                if output.startswith(out, position) and ending(target):
+                    found += [[symbol] + rest
+                              for rest in inputs(target, position + len(out))]
+            default = self.defaults[state]
+            if default is not None and default[2]:
+                out, target, _ = default
+                end = position + len(out)
+                # the copied symbol is one that has no arc of its own
+                if (end < len(output) and output.startswith(out, position)
+                        and output[end] not in self.arcs[state]):
+                    found += [[output[end]] + rest
+                              for rest in inputs(target, end + 1)]
+            memo[key] = found
+            return found
+
+        return inputs(self.start, 0)
+
+    def _index(self):
+        # the finals that every state could reach, and the arcs of every
+        # state grouped by the last letter of the finals they could reach
+        endings = [{final} if final is not None else set()
+                   for final in self.finals]
+        changed = True
+        while changed:
+            changed = False
+            for state in range(len(self)):
+                targets = [target for arcs in self.arcs[state].values()
+                           for _, target in arcs]
+                if self.defaults[state] is not None:
+                    targets.append(self.defaults[state][1])
+                for target in targets:
+                    if not endings[target] <= endings[state]:
+                        endings[state] |= endings[target]
+                        changed = True
+        lasts = []
+        for state in range(len(self)):
+            index = {None: []}
+            for symbol, arcs in self.arcs[state].items():
+                for out, target in arcs:
+                    # an empty final ends with whatever was written before it
+                    if '' in endings[target]:
+                        index[None].append((symbol, out, target))
+                        continue
+                    for last in {final[-1] for final in endings[target]}:
+                        index.setdefault(last, []).append((symbol, out, target))
+            lasts.append(index)
+        self._endings, self._lasts = endings, lasts
+
+    def to_dict(self):
+        """
+        Get the states of the transducer as JSON compatible lists
+        """
+        return {'arcs': [{symbol: [list(arc) for arc in arcs]
+                          for symbol, arcs in state.items()}
+                         for state in self.arcs],
+                'defaults': [list(default) if default else None
+                             for default in self.defaults],
+                'finals': self.finals}
+
+    def from_dict(self, states):
+        """
+        Replace the states of the transducer with the ones of `to_dict`
+        """
+        self.arcs = [{symbol: [tuple(arc) for arc in arcs]
+                      for symbol, arcs in state.items()}
+                     for state in states['arcs']]
+        self.defaults = [tuple(default) if default else None
+                         for default in states['defaults']]
+        self.finals = states['finals']
+        self._endings = None
+        self.start = 0
+
+
+def tag(formality, alphabet, polarity, tense, aspect, person):
+    """
+    Make the input symbol of the features of a cell
+    """
+    return '|'.join([formality, alphabet, polarity, tense, aspect, person])
+
+
+def probing(space, table, frmlty, alphabet, polarity, head):
+    # assemble a branch for stems made of the head and the marker
+    stem = head + MARKER
+    profile = {'present dual': False, 'past dual': False, 'paradigm': ''}
+    for kind in KINDS:
+        profile[f'{frmlty} {alphabet} {kind} stem'] = stem
+    slots = {kind: [] for kind in KINDS}
+    kind = 'present'
+    for tense, aspect, persons in assembling(profile, space, frmlty, alphabet,
+                                             polarity, EVERY,
+                                             table[frmlty, alphabet, polarity]):
+        # the past stem loop starts with the simple past
+        if (tense, aspect) == ('past', 'simple'):
+            kind = 'past'
+        slots[kind].append((tense, aspect, persons))
+    return slots
+
+
+class Compiled(Transducer):
+    """
+    The inflection rules of a space compiled into a transducer
+
+    The input of the transducer is the symbol of the features of a cell
+    followed by the letters of the stem, as `steming` returns it, and the
+    output is the inflected form. The prefixes of `prefixing` depend on
+    the first letters of the stem, so the transducer branches on them and
+    copies the rest of the stem; the suffixes and auxiliaries are written
+    when the stem ends.
+
+    Attributes
+    ----------
+    space : str
+        the space that the rules were compiled for
+    layout : dict
+        the (tense, aspect, persons) slots assembled from the present and
+        past stems of every formality, alphabet, and polarity, in the order
+        `assembling` makes them
+    kinds : dict
+        the input symbol of every cell mapped to the kind of the stem,
+        present or past, that the cell is inflected from
+    """
+    def __init__(self, space='\u200c') -> None:
+        """
+        Parameters
+        ----------
+        space : str, optional
+            either space (" "), ZWNJ (\\u200c), or empty string ("")
+        """
+        super().__init__()
+        self.space = space
+        self.layout = {}
+        self.kinds = {}
+        self._bodies = {}
+        table = context(space)
+        for frmlty in LAYERS['formality']:
+            for alphabet in LAYERS['alphabet']:
+                for polarity in LAYERS['polarity']:
+                    self._branch(table, frmlty, alphabet, polarity)
+        del self._bodies
+
+    def _body(self, suffix, copy=True):
+        # a state copying (or dropping) the rest of the stem and writing
+        # the suffix when it ends; states are shared by equal suffixes
+        key = (suffix, copy)
+        if key not in self._bodies:
+            state = self.state(suffix)
+            self.default(state, '', state, copy)
+            self._bodies[key] = state
+        return self._bodies[key]
+
+    def _branch(self, table, frmlty, alphabet, polarity):
+        heads = HEADS[alphabet] + [OTHERS[alphabet]]
+        probes = {head: probing(self.space, table, frmlty, alphabet, polarity,
+                                head) for head in heads}
+        other = probes[OTHERS[alphabet]]
+        self.layout[frmlty, alphabet, polarity] = {
+            kind: [(tense, aspect, list(persons))
+                   for tense, aspect, persons in other[kind]] for kind in KINDS}
+
+        for kind in KINDS:
+            for n, (tense, aspect, persons) in enumerate(other[kind]):
+                for person in persons:
+                    symbol = tag(frmlty, alphabet, polarity, tense, aspect, person)
+                    if symbol in self.arcs[self.start]:
+                        continue
+                    self.kinds[symbol] = kind
+                    variants = {head: probes[head][kind][n][2][person]
+                                for head in heads}
+                    for v in range(len(self._variants(variants[heads[-1]]))):
+                        self._cell(symbol, alphabet, {
+                            head: self._variants(forms)[v]
+                            for head, forms in variants.items()})
+
+    @staticmethod
+    def _variants(forms):
+        return [forms] if isinstance(forms, str) else forms
+
+    def _cell(self, symbol, alphabet, forms):
+        # add the states of a variant of a cell; forms maps every probed
+        # head to the form made from it
+        other = OTHERS[alphabet]
+        form = forms[other]
+        if MARKER not in form:
+            # a form that does not contain the stem
+            self.arc(self.start, symbol, '', self._body(form, copy=False))
+            return
+
+        suffix = form.split(MARKER)[1]
+        cell = self.state()
+        self.arc(self.start, symbol, '', cell)
+        self.default(cell, form.split(MARKER)[0][:-len(other)], self._body(suffix))
+
+        # the heads make a trie; a head that is the beginning of a longer
+        # one waits for the next letter
+        nodes = {'': cell}
+        for head in sorted(HEADS[alphabet], key=len):
+            before = forms[head].split(MARKER)[0]
+            parent = nodes[head[:-1]]
+            longer = [h for h in HEADS[alphabet] if h != head and h.startswith(head)]
+            if not longer:
+                self.arc(parent, head[-1], before, self._body(suffix))
+                continue
+            node = self.state(before + suffix)
+            self.arc(parent, head[-1], '', node)
+            self.default(node, before, self._body(suffix))
+            nodes[head] = node
+
+    def generate(self, stem, formality, alphabet, polarity, tense, aspect, person):
+        """
+        Inflect a stem for the features of a cell
+
+        Parameters
+        ----------
+        stem : str
+            the present or past stem as `steming` returns it
+        formality, alphabet, polarity, tense, aspect, person : str
+            the features of the cell
+
+        Returns
+        -------
+        str or list
+            the form, or a list of the forms if the cell has alternatives
+        """
+        forms = self.transduce([tag(formality, alphabet, polarity, tense,
+                                    aspect, person)] + list(stem))
+        return forms[0] if len(forms) == 1 else forms
+
+    def analyze(self, form, stems=None):
+        """
+        Find every stem and cell that the form could be inflected from
+
+        The transducer copies any stem, so a form has an analysis for every
+        way it could be split into prefixes, a stem, and suffixes; the
+        stems could be restricted to the known ones. A present stem only
+        inflects the present cells and a past stem the past ones, so a
+        known stem is a (stem, kind) pair.
+
+        Parameters
+        ----------
+        form : str
+            an inflected form
+        stems : container, optional
+            the (stem, kind) tuples that the analyses are restricted to,
+            where the stem is as `steming` returns it and the kind is
+            either "present" or "past"
+
+        Returns
+        -------
+        list of dicts
+            dictionaries containing the stem, its kind, and the formality,
+            alphabet, polarity, tense, aspect, and person
+        """
+        analyses = []
+        for symbols in self.invert(form):
+            features = dict(zip(['formality', 'alphabet', 'polarity', 'tense',
+                                 'aspect', 'person'], symbols[0].split('|')))
+            stem = ''.join(symbols[1:])
+            # the stems of a cell are written in its alphabet
+            if stem and (features['alphabet'] == 'IPA') != (stem[0] in LETTERS):
+                continue
+            kind = self.kinds[symbols[0]]
+            if stems is not None and (stem, kind) not in stems:
+                continue
+            analysis = {'stem': stem, 'kind': kind}
+            analysis.update(features)
+            if analysis not in analyses:
+                analyses.append(analysis)
+        return analyses
+
+    def paradigm(self, profile):
+        """
+        Inflect a profile like `inflector` does, through the transducer
+
+        Parameters
+        ----------
+        profile : dict
+            a dictionary containing the properties of the verb
+
+        Returns
+        -------
+        dict
+            a nested dictionary containing the inflected forms of the verb
+        """
+        # irregulars like بودن come with their paradigms
+        if profile['paradigm']:
+            return profile['paradigm']
+
+        paradigm = {}
+        for (frmlty, alphabet, polarity), slots in self.layout.items():
+            stems = dict(zip(KINDS, steming(profile, frmlty, alphabet)))
+            past = {'simple': [], 'continuous': [], 'subjunctive': [],
+                    'progressive': [], 'perfect': [], 'perfect subjunctive': []}
+            present = {'simple': [], 'continuous': [], 'subjunctive': [],
+                       'progressive': [], 'perfect': [], 'perfect past': [],
+                       'imperative': []}
+            branches = {'present': present, 'past': past, 'future': {'simple': []}}
+            for kind in KINDS:
+                for stem in stems[kind]:
+                    if stem == '':
+                        branches[kind] = None
+                        break
+                    for tense, aspect, persons in slots[kind]:
+                        branches[tense][aspect].append({
+                            person: self.generate(stem, frmlty, alphabet,
+                                                  polarity, tense, aspect, person)
+                            for person in persons})
+            paradigm.setdefault(frmlty, {}).setdefault(alphabet, {})[polarity] = {
+                tense: unpack(branches[tense]) for tense in ['present', 'past', 'future']}
+        return paradigm
+
+    def save(self, path):
+        """
+        Write the transducer to a gzip compressed JSON file
+
+        Parameters
+        ----------
+        path : str or Path
+            the path of the file
+        """
+        data = {'version': lexicon.version, 'space': self.space,
+                'layout': [[list(key), {kind: [[t, a, p] for t, a, p in slots]
+                                        for kind, slots in layout.items()}]
+                           for key, layout in self.layout.items()],
+                'states': self.to_dict()}
+        raw = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        with open(path, 'wb') as file:
+            file.write(gzip.compress(raw.encode('utf-8'), 9, mtime=0))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a transducer written by `save`
+
+        Parameters
+        ----------
+        path : str or Path
+            the path of the file
+
+        Returns
+        -------
+        Compiled
+            the transducer
+
+        Raises
+        ------
+        ValueError
+            if the transducer was compiled from other data files
+        """
+        with gzip.open(path, 'rb') as file:
+            data = json.load(file)
+        if data['version'] != lexicon.version:
+            raise ValueError(f'"{path}" was compiled from other data files; '
+                             f'compile it again')
+        compiled = cls.__new__(cls)
+        compiled.space = data['space']
+        compiled.layout = {tuple(key): {kind: [(t, a, p) for t, a, p in slots]
+                                        for kind, slots in layout.items()}
+                           for key, layout in data['layout']}
+        # the kinds of the cells follow from the slots they were assembled in
+        compiled.kinds = {
+            tag(*key, tense, aspect, person): kind
+            for key, layout in compiled.layout.items()
+            for kind, slots in layout.items()
+            for tense, aspect, persons in slots for person in persons}
+        compiled.from_dict(data['states'])
+        return compiled
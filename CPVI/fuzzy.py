@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+
+# Arabic letters mapped to their Persian forms, and the marks that do not
+# change a word (diacritics, tatweel, and direction marks) removed
+FOLDING = str.maketrans({'ي': 'ی', 'ى': 'ی', 'ك': 'ک', '\u0640': None,
+                         '\u200d': '\u200c', '\u200e': None, '\u200f': None,
+                         **{chr(mark): None for mark in range(0x064b, 0x0653)},
+                         '\u0670': None})
+
+# the characters that could stand between the prefix and the stem
+JOINERS = str.maketrans({' ': None, '\t': None, '\u200c': None})
+
+# the continuous prefixes that could be written apart from a stem, and the
+# characters that could stand between them
+PREFIXES = ['نمی', 'می']
+SEPARATORS = {' ', '\t', '\u200c'}
+
+
+def folding(word):
+    """
+    Replace Arabic Yeh and Kaf with Persian ones and remove diacritics
+
+    Parameters
+    ----------
+    word : str
+        a string in Persian alphabet
+
+    Returns
+    -------
+    str
+        the word written with Persian letters only
+    """
+    return word.translate(FOLDING)
+
+
+def canonical(word):
+    """
+    Make the key of a word that its spelling variants share
+
+    Parameters
+    ----------
+    word : str
+        a string in Persian alphabet
+
+    Returns
+    -------
+    str
+        the folded word without ZWNJ, spaces, and tabs
+    """
+    return word.translate(FOLDING).translate(JOINERS)
+
+
+def normalized_index(index):
+    """
+    Map the keys of the surface forms of irregulars to their entries
+
+    Forms that differ only in diacritics, like کَن and کن, share a key.
+
+    Parameters
+    ----------
+    index : dict
+        the surface forms mapped to gerunds, made by `surface_index`
+
+    Returns
+    -------
+    dict
+        a dictionary mapping the canonical keys of the forms to gerunds
+    """
+    normalized = {}
+    # forms that are written canonically keep their entries, and the other
+    # entries of a key follow in the order of the index
+    forms = sorted(index, key=lambda form: form != canonical(form))
+    for form in forms:
+        # missing stems are empty strings
+        if form:
+            normalized.setdefault(canonical(form), index[form])
+    return normalized
+
+
+def unprefixing(word, lookup):
+    """
+    Find the entry of the stem of a word written apart from its continuous
+    prefix, like می گفت
+
+    Only a prefix followed by a space or ZWNJ is removed, so words that
+    merely begin with its letters, like میراندن or نمیر, are left alone,
+    and the rest of the word should be a stem rather than a gerund.
+
+    Parameters
+    ----------
+    word : str
+        a string in Persian alphabet
+    lookup : callable
+        a function mapping a canonical key to the gerund of its entry, or
+        to None
+
+    Returns
+    -------
+    str or None
+        the gerund of the irregular verb, or None
+    """
+    word = folding(word)
+    for prefix in PREFIXES:
+        size = len(prefix)
+        if word.startswith(prefix) and word[size:size + 1] in SEPARATORS:
+            key = canonical(word[size:])
+            entry = lookup(key) if key else None
+            if entry is not None and canonical(entry) != key:
+                return entry
+            return None
+    return None
+
+
+def finding(word, normalized):
+    """
+    Find the entry of a word in the normalized index
+
+    A word written apart from its continuous prefix, like می گفت, is looked
+    up by its stem if it is not found as it is; see `unprefixing`.
+
+    Parameters
+    ----------
+    word : str
+        a string in Persian alphabet
+    normalized : dict
+        the index made by `normalized_index`
+
+    Returns
+    -------
+    str or None
+        the gerund of the irregular verb, or None
+    """
+    entry = normalized.get(canonical(word))
+    if entry is None:
+        entry = unprefixing(word, normalized.get)
+    return entry
+
+
+def editing(a, b):
+    """
+    Get the edit distance of two words, counting the transposition of
+    adjacent letters as a single edit
+
+    Parameters
+    ----------
+    a, b : str
+        the words
+
+    Returns
+    -------
+    int
+        the number of insertions, deletions, substitutions, and
+        transpositions that turn a into b
+    """
+    previous, row = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, row = previous, row, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            row[j] = min(previous[j] + 1, row[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2]
+                    and a[i - 2] == b[j - 1]):
+                row[j] = min(row[j], before[j - 2] + 1)
+    return row[-1]
+
+
+def deleting(word, distance):
+    """
+    Get the words made by deleting up to distance letters of the word
+
+    Parameters
+    ----------
+    word : str
+        a word
+    distance : int
+        the largest number of deleted letters
+
+    Returns
+    -------
+    set
+        the word and every word made by the deletions
+    """
+    found = {word}
+    layer = {word}
+    for _ in range(distance):
+        layer = {form[:n] + form[n + 1:] for form in layer
+                 for n in range(len(form))}
+        found |= layer
+    return found
+
+
+class Neighborhood():
+    """
+    A deletion-neighborhood index for finding words within an edit distance
+
+    Every indexed word is stored under all the words made by deleting up
+    to `distance` of its letters. Two words within the distance share such
+    a deletion, so a search looks up the deletions of the query instead of
+    comparing it with every indexed word, and only the words found are
+    checked with `editing`.
+
+    Attributes
+    ----------
+    distance : int
+        the largest edit distance that could be searched
+    """
+    def __init__(self, words=(), distance=2) -> None:
+        """
+        Parameters
+        ----------
+        words : iterable, optional
+            the words to index
+        distance : int, optional
+            the largest edit distance that could be searched
+        """
+        self.distance = distance
+        self._deletions = {}
+        self._words = set()
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return len(self._words)
+
+    def __contains__(self, word):
+        return word in self._words
+
+    def add(self, word):
+        """
+        Index a word
+        """
+        if word in self._words:
+            return
+        self._words.add(word)
+        for deletion in deleting(word, self.distance):
+            self._deletions.setdefault(deletion, []).append(word)
+
+    def search(self, word, distance=1):
+        """
+        Find the indexed words within the edit distance of the word
+
+        Parameters
+        ----------
+        word : str
+            the query
+        distance : int, optional
+            the largest edit distance; it could not be larger than the
+            distance of the index
+
+        Returns
+        -------
+        list
+            (word, distance) tuples sorted by the distance and the word
+
+        Raises
+        ------
+        ValueError
+            if the distance is larger than the distance of the index
+        """
+        if distance > self.distance:
+            raise ValueError(f'''The distance could not be larger than {self.distance}.
+            Make the index with a larger distance''')
+        candidates = set()
+        for deletion in deleting(word, distance):
+            candidates.update(self._deletions.get(deletion, ()))
+        found = []
+        for candidate in candidates:
+            # words that differ in length by more than the distance are
+            # never within it
+            if abs(len(candidate) - len(word)) > distance:
+                continue
+            edits = editing(word, candidate)
+            if edits <= distance:
+                found.append((candidate, edits))
+        return sorted(found, key=lambda item: (item[1], item[0]))
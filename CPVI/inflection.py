@@ -1,13 +1,96 @@
 #!/usr/bin/env python3
 
-from itertools import product
+from functools import partial
+from timeit import default_timer as timer
+from .lexicon import lexicon, FrozenDict, thaw
+from .timers import timers
 from .utils import *
 
 
-def inflector(profile, space):
+# the values of every layer of the paradigm hierarchy that a selector
+# could narrow down
+LAYERS = {'formality': ['formal', 'informal'],
+          'alphabet': ['IPA', 'Persian'],
+          'polarity': ['affirmative', 'negative'],
+          'tense': ['present', 'past', 'future'],
+          'aspect': ['simple', 'continuous', 'subjunctive', 'progressive',
+                     'perfect', 'perfect past', 'perfect subjunctive',
+                     'imperative']}
+
+
+def selector(select):
+    """
+    Turn a selector into a dictionary of the selected values of every layer
+
+    Parameters
+    ----------
+    select : dict or None
+        a dictionary mapping layers (formality, alphabet, polarity, tense,
+        and aspect) to a value or a list of values; missing layers and
+        None select every value
+
+    Returns
+    -------
+    dict
+        a dictionary mapping every layer to a set of selected values; it is
+        EVERY if select is empty or None
+    """
+    if not select:
+        return EVERY
+    selected = {}
+    for layer, values in LAYERS.items():
+        value = select.get(layer)
+        if value is None:
+            selected[layer] = set(values)
+        elif isinstance(value, str):
+            selected[layer] = {value}
+        else:
+            selected[layer] = set(value)
+    return selected
+
+
+# the selection of the whole paradigm
+EVERY = {layer: set(values) for layer, values in LAYERS.items()}
+
+
+def pruning(paradigm, select, depth=0):
+    """
+    Remove the branches of the paradigm that are not selected
+
+    Parameters
+    ----------
+    paradigm : dict
+        a nested dictionary containing inflected forms
+    select : dict
+        a dictionary mapping every layer to a set of selected values
+    depth : int, optional
+        the layer of the paradigm's keys; 0 is formality and 3 is tense
+
+    Returns
+    -------
+    dict
+        the selected branches of the paradigm
+    """
+    layers = list(LAYERS)
+
+    def prune(node, depth):
+        if depth == len(layers) or not isinstance(node, dict):
+            return node
+        return {key: prune(val, depth + 1) for key, val in node.items()
+                if key in select[layers[depth]]}
+    return prune(paradigm, depth)
+
+
+def inflector(profile, space, select=None, lazy=False, table=None,
+              objective=False):
     """
     Inflect the verb that its stems passed as the profile
 
+    The profile passed is not changed, so it could be a record of the
+    shared lexicon or a profile used by other threads; the properties are
+    copied to a new profile, and a paradigm that comes with a lexicon
+    record is copied too.
+
     Parameters
     ----------
     profile : dict
@@ -15,159 +98,481 @@ def inflector(profile, space):
     space : str
         a string that is either space (" "), ZWNJ (\\u200c), or 
         empty string ("")
+    select : dict, optional
+        a dictionary mapping layers (formality, alphabet, polarity, tense,
+        and aspect) to the values that should be inflected; the default
+        value None inflects the whole paradigm
+    lazy : bool, optional
+        if True, every formality, alphabet, and polarity branch is
+        inflected the first time it is accessed
+    table : dict, optional
+        the inflection context of the space returned by `context`; it is
+        retrieved if it is not passed
+    objective : bool, optional
+        if True, the profile gets an objective paradigm, where every form
+        is expanded with the object clitics the first time its formality,
+        alphabet, and polarity branch is accessed
     
     Returns
     -------
     dict
-        a nested dictionary containing the properties and inflected forms of 
-        the verb
+        a new nested dictionary containing the properties and inflected
+        forms of the verb
     """
+    # read-only lexicon records are copied whole, and other profiles only
+    # get a new top level that the paradigm is written to
+    if isinstance(profile, FrozenDict):
+        profile = thaw(profile)
+    else:
+        profile = dict(profile)
 
     # return profile if paradigm is already filled
     if profile['paradigm']:
+        if select:
+            profile['paradigm'] = pruning(profile['paradigm'], selector(select))
+        if objective:
+            profile['objective paradigm'] = objectifying(profile['paradigm'], space)
         return profile
 
-    # make an empty paradigm frame
-    paradigm = {'formal': {
-                    'IPA': {'affirmative': {}, 'negative': {}}, 
-                    'Persian': {'affirmative': {}, 'negative': {}}},
-                'informal': {
-                    'IPA': {'affirmative': {}, 'negative': {}}, 
-                    'Persian': {'affirmative': {}, 'negative': {}}}}
-    
-    # make a list of tuples for iteration
-    comb = product([True, False], repeat=3)
+    select = selector(select)
+    if table is None:
+        table = context(space)
+
+    # make a paradigm frame of the selected formalities and alphabets
+    # and fill it with the selected polarities
+    paradigm = {}
+    for frmlty in LAYERS['formality']:
+        if frmlty not in select['formality']:
+            continue
+        paradigm[frmlty] = {}
+        for alphabet in LAYERS['alphabet']:
+            if alphabet not in select['alphabet']:
+                continue
+            branch = {polarity: partial(inflect, profile, space, frmlty,
+                                        alphabet, polarity, select,
+                                        table[frmlty, alphabet, polarity])
+                      for polarity in LAYERS['polarity']
+                      if polarity in select['polarity']}
+            if lazy:
+                paradigm[frmlty][alphabet] = LazyDict(branch)
+            else:
+                paradigm[frmlty][alphabet] = {
+                    polarity: inflect() for polarity, inflect in branch.items()}
 
-    # iterate through negation, formality, and IPA
-    for negation, formality, IPA in comb:
+    profile['paradigm'] = paradigm
+    if objective:
+        profile['objective paradigm'] = objectifying(paradigm, space)
+    return profile
 
-        # make empty dictionaries for past, present, and future
-        past = {'simple': [], 'continuous': [], 'subjunctive': [], 
-        'progressive': [], 'perfect': [], 'perfect subjunctive': []}
-        present = {'simple': [], 'continuous': [], 'subjunctive': [], 
-        'progressive': [], 'perfect': [], 'perfect past': [], 'imperative': []}
-        future = {'simple': []}
 
-        # turn booleans to string
-        frmlty = ['informal', 'formal'][formality]
-        alphabet = ['Persian', 'IPA'][IPA]
-        polarity = ['affirmative', 'negative'][negation]
+def objectifying(paradigm, space):
+    """
+    Make the objective paradigm of an inflected paradigm
 
-        # retrieve present and past stems
-        present_stem, past_stem = steming(profile, frmlty, alphabet)
+    Every form of the paradigm is expanded with the object clitics, which
+    multiplies the number of forms by up to six, so every formality,
+    alphabet, and polarity branch is expanded the first time it is
+    accessed. Clitics of the same first or second person as the subject
+    are left out, as those are expressed with the reflexive خود.
 
-        # assign suffix and word spaces
-        pres, sufs, wrds = spacing(space, IPA)
+    Parameters
+    ----------
+    paradigm : dict
+        a nested dictionary containing inflected forms
+    space : str
+        a string that is either space (" "), ZWNJ (\\u200c), or 
+        empty string ("")
 
-        # retrieve auxiliaries
-        prf_aux, sub_aux, prg_prs_aux, prg_pst_aux, ftr_aux = auxiliary(frmlty, alphabet)
+    Returns
+    -------
+    dict
+        a nested dictionary like the paradigm, where every subject person
+        is mapped to a dictionary of its forms keyed by the object person
+    """
+    objective = {}
+    for frmlty, alphabets in paradigm.items():
+        objective[frmlty] = {}
+        for alphabet, polarities in alphabets.items():
+            suffix = spacing(space, alphabet == 'IPA')[1]
+            objective[frmlty][alphabet] = LazyDict({
+                polarity: partial(cliticizing, polarities, polarity,
+                                  clitics(frmlty, alphabet), suffix)
+                for polarity in polarities})
+    return objective
+
+
+def cliticizing(polarities, polarity, clitic, space):
+    """
+    Attach the object clitics to the forms of a polarity
 
-        # the participle form of the perfect auxiliary
-        part_aux = ["بوده", "bude"][IPA]
+    Parameters
+    ----------
+    polarities : dict
+        a dictionary mapping polarities to their tenses
+    polarity : str
+        either affirmative or negative
+    clitic : dict
+        a dictionary mapping person and number keys to object clitics
+    space : str
+        the space put between a silent h and the clitic
 
-        # retrieve conjugations
-        past_conj, present_conj, perfect_conj, imperative_conj = conj(frmlty, alphabet)
+    Returns
+    -------
+    dict
+        a nested dictionary containing the tenses and aspects of the
+        polarity with the objective forms of every person
+    """
+    def expand(persons):
+        objective = {}
+        for subject, form in persons.items():
+            if not form:
+                objective[subject] = form
+                continue
+            objective[subject] = {
+                obj: attaching(form, suffix, space)
+                for obj, suffix in clitic.items()
+                if obj[1] != subject[1] or subject[1] == '3'}
+        return objective
+
+    branch = {}
+    for tense, aspects in polarities[polarity].items():
+        if aspects is None:
+            branch[tense] = None
+            continue
+        branch[tense] = {}
+        for aspect, persons in aspects.items():
+            if persons is None:
+                branch[tense][aspect] = None
+            elif isinstance(persons, list):
+                branch[tense][aspect] = [expand(dual) for dual in persons]
+            else:
+                branch[tense][aspect] = expand(persons)
+    return branch
 
-        # retrieve continuous, negation, and subjunctive prefixes
-        contix, neg, sub =  prefix(negation, IPA)
 
-        # inflect present stem
-        for stem in present_stem:
+# the inflection contexts keyed by the lexicon version and the space
+CONTEXTS = {}
 
-            # prevent execution if the IPA form of the stem is not provided
-            if stem == '':
-                present = None
-                break
 
-            stem, sub_stem, cont_stem = (prefixing(neg, stem, space),
-                                        prefixing(sub, stem, space),
-                                        prefixing(contix, stem, space))
-            # ‌گویم
-            present['simple'].append(concatenate(stem, present_conj))
+def context(space):
+    """
+    Build the constants of every formality, alphabet, and polarity
 
-            # بگویم
-            present['subjunctive'].append(concatenate(sub_stem, present_conj))
+    The spaces, prefixes, and compiled templates do not depend on the verb,
+    so they are built once per space and reused until the lexicon changes.
 
-            # نمی‌گویم
-            present['continuous'].append(concatenate(cont_stem, present_conj))
+    Parameters
+    ----------
+    space : str
+        a string that is either space (" "), ZWNJ (\\u200c), or 
+        empty string ("")
 
-            # بگو
-            imperative = concatenate(sub_stem, imperative_conj)
-            imperative = {'s2': imperative['s2'], 'p2': imperative['p2']}
-            present['imperative'].append(imperative)
+    Returns
+    -------
+    dict
+        a dictionary mapping (formality, alphabet, polarity) tuples to
+        dictionaries containing the spaces, prefixes, and templates
+    """
+    key = (lexicon.version, space)
+    table = CONTEXTS.get(key)
+    if table is not None:
+        return table
+
+    table = {}
+    for frmlty in LAYERS['formality']:
+        for alphabet in LAYERS['alphabet']:
+            for polarity in LAYERS['polarity']:
+                IPA = alphabet == 'IPA'
+                negation = polarity == 'negative'
+                table[frmlty, alphabet, polarity] = {
+                    'spaces': spacing(space, IPA),
+                    'prefixes': prefix(negation, IPA),
+                    'templates': templating(frmlty, alphabet, negation, space)}
+    # threads that built the table at the same time all get the first one
+    return CONTEXTS.setdefault(key, table)
+
+
+def templating(frmlty, alphabet, negation, space):
+    """
+    Compile the templates of a formality, an alphabet, and a polarity
 
-            # exclude the negative conjugation of present progressives
-            if not negation:
-                # دارم می‌گویم‌
-                present['progressive'].append(concatenate(
-                    prg_prs_aux, wrds, present['continuous'][-1]))
+    Parameters
+    ----------
+    frmlty : str
+        either formal or informal
+    alphabet : str
+        either IPA or Persian
+    negation : bool
+        A flag used to determine the polarity
+    space : str
+        a string that is either space (" "), ZWNJ (\\u200c), or 
+        empty string ("")
 
-        # inflect past stem
-        for stem in past_stem:
+    Returns
+    -------
+    dict
+        a dictionary mapping the names of the templates to templates
+    """
+    IPA = alphabet == 'IPA'
+
+    # assign suffix and word spaces
+    pres, sufs, wrds = spacing(space, IPA)
+
+    # retrieve auxiliaries
+    prf_aux, sub_aux, prg_prs_aux, prg_pst_aux, ftr_aux = auxiliary(frmlty, alphabet)
+
+    # the participle form of the perfect auxiliary; the informal IPA
+    # present perfect past drops its last vowel
+    part_aux = ["بوده", "bude"][IPA]
+    prs_part_aux = part_aux[:-1] if frmlty == 'informal' and IPA else part_aux
+
+    # retrieve conjugations
+    past_conj, present_conj, perfect_conj, imperative_conj = conj(frmlty, alphabet)
+
+    # retrieve the negation prefix
+    neg = prefix(negation, IPA)[1]
+
+    # None marks the stem or the form that fills the template
+    return {
+        'present': Template(None, present_conj),
+        'imperative': Template(None, imperative_conj),
+        'present progressive': Template(prg_prs_aux, wrds, None),
+        'past': Template(None, past_conj),
+        'past subjunctive': Template(None, wrds, sub_aux),
+        'past perfect': Template(None, wrds, prf_aux),
+        'past perfect subjunctive': Template(
+            None, wrds, part_aux, wrds, sub_aux),
+        'past progressive': Template(prg_pst_aux, wrds, None),
+        'perfect past': Template(None, wrds, prs_part_aux, sufs, perfect_conj),
+        'perfect': Template(None, sufs, perfect_conj),
+        'future': Template(neg, ftr_aux, wrds, None)}
+
+
+def inflect(profile, space, frmlty, alphabet, polarity, select, constants):
+    """
+    Inflect the verb for a formality, an alphabet, and a polarity
 
-            # prevent execution if the IPA from of the stem is not provided
-            if stem == '':
-                past = None
-                break
+    Parameters
+    ----------
+    profile : dict
+        a dictionary containing the properties of the verb
+    space : str
+        a string that is either space (" "), ZWNJ (\\u200c), or 
+        empty string ("")
+    frmlty : str
+        either formal or informal
+    alphabet : str
+        either IPA or Persian
+    polarity : str
+        either affirmative or negative
+    select : dict
+        a dictionary mapping every layer to a set of selected values
+    constants : dict
+        the spaces, prefixes, and templates of the formality, alphabet, and
+        polarity in the inflection context
 
-            stem, sub_stem, cont_stem = (prefixing(neg, stem, pres),
-                                        prefixing(sub, stem, pres),
-                                        prefixing(contix, stem, pres))
+    Returns
+    -------
+    dict
+        a nested dictionary containing the selected tenses and aspects
+    """
+    start = timers.enabled and timer()
+
+    # make empty dictionaries for past, present, and future
+    past = {'simple': [], 'continuous': [], 'subjunctive': [], 
+    'progressive': [], 'perfect': [], 'perfect subjunctive': []}
+    present = {'simple': [], 'continuous': [], 'subjunctive': [], 
+    'progressive': [], 'perfect': [], 'perfect past': [], 'imperative': []}
+    future = {'simple': []}
+    branches = {'present': present, 'past': past, 'future': future}
+
+    for tense, aspect, persons in assembling(profile, space, frmlty, alphabet,
+                                             polarity, select, constants):
+        if aspect is None:
+            branches[tense] = None
+        else:
+            branches[tense][aspect].append(persons)
+
+    inflected = {'present': unpack(branches['present']),
+                 'past': unpack(branches['past']),
+                 'future': unpack(branches['future'])}
+    if select is not EVERY:
+        inflected = pruning(inflected, select, 3)
+    if start:
+        timers.since('inflect', start)
+    return inflected
+
+
+def assembling(profile, space, frmlty, alphabet, polarity, select, constants):
+    """
+    Generate the person dictionaries of a formality, an alphabet, and a
+    polarity in the order they are assembled
 
-            # past participle
-            part = prefixing('', f'{stem}{["ه", "e"][IPA]}', space)
+    Every stem of a dual verb gives its own dictionary, and the forms of a
+    person are a list if the conjugation has alternative endings. The
+    continuous forms are generated for progressives even if they are not
+    selected.
 
+    Parameters
+    ----------
+    profile : dict
+        a dictionary containing the properties of the verb
+    space : str
+        a string that is either space (" "), ZWNJ (\\u200c), or 
+        empty string ("")
+    frmlty : str
+        either formal or informal
+    alphabet : str
+        either IPA or Persian
+    polarity : str
+        either affirmative or negative
+    select : dict
+        a dictionary mapping every layer to a set of selected values
+    constants : dict
+        the spaces, prefixes, and templates of the formality, alphabet, and
+        polarity in the inflection context
+
+    Yields
+    ------
+    tuple
+        the tense, the aspect, and the dictionary mapping persons to forms;
+        the aspect and the dictionary are None if the stems of the tense
+        are not provided
+    """
+    # turn strings to booleans
+    formality = frmlty == 'formal'
+    IPA = alphabet == 'IPA'
+    negation = polarity == 'negative'
+
+    tenses, aspects = select['tense'], select['aspect']
+
+    def wanted(tense, aspect):
+        return tense in tenses and aspect in aspects
+
+    # retrieve present and past stems
+    start = timers.enabled and timer()
+    present_stem, past_stem = steming(profile, frmlty, alphabet)
+    if start:
+        timers.since('steming', start)
+
+    # retrieve the prefix space
+    pres = constants['spaces'][0]
+
+    # retrieve the compiled templates of the suffixes and auxiliaries
+    tpl = constants['templates']
+
+    # retrieve continuous, negation, and subjunctive prefixes
+    contix, neg, sub = constants['prefixes']
+
+    # progressives are made of continuous forms and have no negative forms
+    prs_progressive = not negation and wanted('present', 'progressive')
+    pst_progressive = not negation and wanted('past', 'progressive')
+
+    # inflect present stem
+    for stem in present_stem:
+
+        # prevent execution if the IPA form of the stem is not provided
+        if stem == '':
+            yield 'present', None, None
+            break
+
+        stem, sub_stem, cont_stem = (prefixing(neg, stem, space),
+                                    prefixing(sub, stem, space),
+                                    prefixing(contix, stem, space))
+        # ‌گویم
+        if wanted('present', 'simple'):
+            yield 'present', 'simple', tpl['present'](stem)
+
+        # بگویم
+        if wanted('present', 'subjunctive'):
+            yield 'present', 'subjunctive', tpl['present'](sub_stem)
+
+        # نمی‌گویم
+        if wanted('present', 'continuous') or prs_progressive:
+            continuous = tpl['present'](cont_stem)
+            yield 'present', 'continuous', continuous
+
+        # بگو
+        if wanted('present', 'imperative'):
+            imperative = tpl['imperative'](sub_stem)
+            imperative = {'s2': imperative['s2'], 'p2': imperative['p2']}
+            yield 'present', 'imperative', imperative
+
+        # exclude the negative conjugation of present progressives
+        if prs_progressive:
+            # دارم می‌گویم‌
+            yield ('present', 'progressive',
+                tpl['present progressive'](continuous))
+
+    # inflect past stem
+    for stem in past_stem:
+
+        # prevent execution if the IPA from of the stem is not provided
+        if stem == '':
+            yield 'past', None, None
+            break
+
+        stem, sub_stem, cont_stem = (prefixing(neg, stem, pres),
+                                    prefixing(sub, stem, pres),
+                                    prefixing(contix, stem, pres))
+
+        # past participle
+        part = prefixing('', f'{stem}{["ه", "e"][IPA]}', space)
+
+        # نگفتم
+        if wanted('past', 'simple'):
+            yield 'past', 'simple', tpl['past'](stem)
+
+        # نمی‌گفتم
+        if wanted('past', 'continuous') or pst_progressive:
+            continuous = tpl['past'](cont_stem)
+            yield 'past', 'continuous', continuous
+
+        # نگفته باشم
+        if wanted('past', 'subjunctive'):
+            yield 'past', 'subjunctive', tpl['past subjunctive'](part)
+
+        # نگفته بودم
+        if (wanted('past', 'perfect') or
+            not formality and not IPA and wanted('present', 'perfect past')):
+            perfect = tpl['past perfect'](part)
+            yield 'past', 'perfect', perfect
+
+        # نگفته بوده باشم
+        if wanted('past', 'perfect subjunctive'):
+            yield ('past', 'perfect subjunctive',
+                tpl['past perfect subjunctive'](part))
+
+        # exclude the negative conjugation of past progressives
+        if pst_progressive:
+            # داشتم می‌گفتم
+            yield 'past', 'progressive', tpl['past progressive'](continuous)
+
+        # exclude the informal conjugation of the simple future
+        if formality:
+            # نگفته‌ بوده‌ام
+            if wanted('present', 'perfect past'):
+                yield 'present', 'perfect past', tpl['perfect past'](part)
+            # نگفته‌ام
+            if wanted('present', 'perfect'):
+                yield 'present', 'perfect', tpl['perfect'](part)
+            # نخواهم گفت
+            if wanted('future', 'simple'):
+                yield 'future', 'simple', tpl['future'](stem)
+        elif not formality and not IPA:
             # نگفتم
-            past['simple'].append(concatenate(stem, past_conj))
-
-            # نمی‌گفتم
-            past['continuous'].append(concatenate(cont_stem, past_conj))
-
-            # نگفته باشم
-            past['subjunctive'].append(concatenate(part, wrds, sub_aux))
-
-            # نگفته بودم
-            past['perfect'].append(concatenate(part, wrds, prf_aux))
-
-            # نگفته بوده باشم
-            past['perfect subjunctive'].append(concatenate(
-                part, wrds, part_aux, wrds, sub_aux))
-
-            # exclude the negative conjugation of past progressives
-            if not negation:
-                # داشتم می‌گفتم
-                past['progressive'].append(concatenate(prg_pst_aux, 
-                                            wrds, past['continuous'][-1]))
-
-            # exclude the informal conjugation of the simple future
-            if formality:
-                # نگفته‌ بوده‌ام
-                present['perfect past'].append(concatenate(
-                    part, wrds, part_aux, sufs, perfect_conj))
-                # نگفته‌ام
-                present['perfect'].append(concatenate(
-                    part, sufs, perfect_conj))
-                # نخواهم گفت
-                future['simple'].append(concatenate(neg, ftr_aux, wrds, stem))
-            elif not formality and not IPA:
-                # نگفتم
-                present['perfect'].append(concatenate(stem, present_conj))
-                # نگفته‌ بودم
-                present['perfect past'].append(past['perfect'][-1])
-            else:
-                # نگفته‌ بوده‌ام
-                present['perfect past'].append(concatenate(
-                    part, wrds, part_aux[:-1], sufs, perfect_conj))
-                # نگفته‌ام
-                present['perfect'].append(concatenate(
-                    part, sufs, perfect_conj))
-
-        paradigm[frmlty][alphabet][polarity] = {'present': unpack(
-            present), 'past': unpack(past), 'future': unpack(future)}
-
-    profile['paradigm'] = paradigm
-    return profile
-
+            if wanted('present', 'perfect'):
+                yield 'present', 'perfect', tpl['present'](stem)
+            # نگفته‌ بودم
+            if wanted('present', 'perfect past'):
+                yield 'present', 'perfect past', perfect
+        else:
+            # نگفته‌ بوده‌ام
+            if wanted('present', 'perfect past'):
+                yield 'present', 'perfect past', tpl['perfect past'](part)
+            # نگفته‌ام
+            if wanted('present', 'perfect'):
+                yield 'present', 'perfect', tpl['perfect'](part)
 
 profile = {
     'lexical aspect': 'action',
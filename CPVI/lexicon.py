@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+
+from .fuzzy import Neighborhood, normalized_index
+from .timers import timers
+from pathlib import Path
+from timeit import default_timer as timer
+import threading
+import hashlib
+import gzip
+import json
+
+
+# the precomputed paradigms of irregulars, written by CPVI.build
+ARTIFACT = 'paradigms.json.gz'
+
+# the data files, whose bytes make the version of the lexicon
+FILES = ['irregulars', 'conjugations']
+
+# the properties of every verb, in the order of irregulars.json
+KEYS = ['lexical aspect', 'regularity', 'transitivity', 'present dual',
+        'past dual', 'formal IPA present stem', 'formal IPA past stem',
+        'formal Persian present stem', 'formal Persian past stem',
+        'informal IPA present stem', 'informal IPA past stem',
+        'informal Persian present stem', 'informal Persian past stem',
+        'paradigm']
+
+
+class FrozenDict(dict):
+    """
+    A read-only dictionary used to protect the shared lexicon data
+
+    It is still an instance of dict, so the inflection functions that check
+    for dictionaries keep working on it.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('The lexicon is read-only; use thaw() to get a copy')
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """
+    A read-only list used to protect the shared lexicon data
+
+    It is still an instance of list, so the inflection functions that check
+    for lists (dual stems and dual conjugations) keep working on it.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('The lexicon is read-only; use thaw() to get a copy')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = _readonly
+    reverse = sort = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(obj):
+    """
+    Make a read-only deep copy of the loaded JSON data
+
+    Parameters
+    ----------
+    obj : dict, list, str, bool, or None
+        the data loaded from a JSON file
+
+    Returns
+    -------
+    FrozenDict, FrozenList, str, bool, or None
+        a read-only copy of obj
+    """
+    if isinstance(obj, dict):
+        return FrozenDict((key, freeze(val)) for key, val in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(val) for val in obj)
+    return obj
+
+
+def thaw(obj):
+    """
+    Make a mutable deep copy of the (frozen) lexicon data
+
+    Parameters
+    ----------
+    obj : dict, list, str, bool, or None
+        (a part of) the lexicon data
+
+    Returns
+    -------
+    dict, list, str, bool, or None
+        a copy of obj made of plain dictionaries and lists
+    """
+    if isinstance(obj, dict):
+        return {key: thaw(val) for key, val in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(val) for val in obj]
+    return obj
+
+
+def surface_forms(entry, props):
+    """
+    Get the gerund and the Persian stems of an irregular that profiling
+    finds it by
+
+    Stems in the lists of dual entries are included too: the present stems
+    of entries with dual present stems, otherwise the past stems of entries
+    with dual past stems.
+
+    Parameters
+    ----------
+    entry : str
+        the gerund of the irregular verb
+    props : dict
+        the properties of the verb as they are in irregulars.json
+
+    Returns
+    -------
+    list
+        (field, form) tuples, where the field is either gerund or the key
+        of the stem
+    """
+    forms = [('gerund', entry)]
+    for key in ['formal Persian past stem', 'formal Persian present stem',
+                'informal Persian past stem',
+                'informal Persian present stem']:
+        if isinstance(props[key], str):
+            forms.append((key, props[key]))
+    # if the entry is a dual verb include the stems in lists
+    if props['present dual']:
+        keys = ['formal Persian present stem', 'informal Persian present stem']
+    elif props['past dual']:
+        keys = ['formal Persian past stem', 'informal Persian past stem']
+    else:
+        keys = []
+    for key in keys:
+        forms += [(key, form) for form in props[key]]
+    return forms
+
+
+def versioning(path):
+    """
+    Get the version of the data files in a directory without parsing them
+
+    Parameters
+    ----------
+    path : str or Path
+        the directory containing irregulars.json and conjugations.json
+
+    Returns
+    -------
+    str
+        the SHA-256 digest of the data files, like `Lexicon.version`
+    """
+    digest = hashlib.sha256()
+    for name in FILES:
+        digest.update((Path(path) / f'{name}.json').read_bytes())
+    return digest.hexdigest()
+
+
+def surface_index(irregulars):
+    """
+    Map every gerund and Persian stem of the irregulars to its entry
+
+    The forms are the ones of `surface_forms`. When two entries share a
+    form, the first entry in the file wins.
+
+    Parameters
+    ----------
+    irregulars : dict
+        the irregular verbs keyed by their gerunds
+
+    Returns
+    -------
+    dict
+        a dictionary mapping the surface forms to gerunds
+    """
+    index = {}
+    for entry, props in irregulars.items():
+        for _, form in surface_forms(entry, props):
+            index.setdefault(form, entry)
+    return index
+
+
+class Lexicon():
+    """
+    A process-wide, read-only view of the data files
+
+    The files are parsed once, on first access, and shared by every call to
+    `CPVI.profiling`, `inflector`, `auxiliary`, and `conj`.
+
+    Attributes
+    ----------
+    path : Path
+        the directory containing irregulars.json and conjugations.json
+    irregulars : FrozenDict
+        the irregular verbs keyed by their gerunds
+    conjugations : FrozenDict
+        the subjective and objective conjugations
+    index : FrozenDict
+        the gerunds and Persian stems of irregulars mapped to their gerunds
+    normalized : FrozenDict
+        the canonical keys of the gerunds and Persian stems of irregulars,
+        made by `canonical`, mapped to their gerunds
+    neighborhood : Neighborhood
+        the deletion-neighborhood index of the canonical keys, built on
+        first access
+    version : str
+        the SHA-256 digest of the data files, used to stamp the precomputed
+        paradigms
+    """
+    def __init__(self, path=None) -> None:
+        self.path = Path(path) if path else Path(__file__).parents[0] / 'data'
+        self._lock = threading.Lock()
+        self._data = None
+        self._artifact = None
+        self._neighborhood = None
+
+    def _load(self):
+        # parse the files only once, even if several threads ask for them
+        with self._lock:
+            if self._data is None:
+                start = timers.enabled and timer()
+                data = {}
+                digest = hashlib.sha256()
+                for name in FILES:
+                    raw = (self.path / f'{name}.json').read_bytes()
+                    digest.update(raw)
+                    data[name] = freeze(json.loads(raw))
+                data['version'] = digest.hexdigest()
+                data['index'] = FrozenDict(surface_index(data['irregulars']))
+                data['normalized'] = FrozenDict(normalized_index(data['index']))
+                self._data = data
+                if start:
+                    timers.since('load', start)
+        return self._data
+
+    @property
+    def irregulars(self):
+        return (self._data or self._load())['irregulars']
+
+    @property
+    def conjugations(self):
+        return (self._data or self._load())['conjugations']
+
+    @property
+    def index(self):
+        return (self._data or self._load())['index']
+
+    @property
+    def normalized(self):
+        return (self._data or self._load())['normalized']
+
+    @property
+    def neighborhood(self):
+        if self._neighborhood is not None:
+            return self._neighborhood
+        normalized = self.normalized
+        with self._lock:
+            if self._neighborhood is None:
+                self._neighborhood = Neighborhood(normalized)
+        return self._neighborhood
+
+    @property
+    def version(self):
+        return (self._data or self._load())['version']
+
+    def _load_artifact(self):
+        # an artifact that is missing or built from other data files is
+        # ignored and the irregulars are inflected on every call
+        version = self.version
+        with self._lock:
+            if self._artifact is None:
+                artifact = {}
+                try:
+                    with gzip.open(self.path / ARTIFACT, 'rb') as file:
+                        loaded = json.load(file)
+                    if loaded['version'] == version:
+                        artifact = loaded['paradigms']
+                except (OSError, EOFError, ValueError, KeyError):
+                    pass
+                self._artifact = artifact
+        return self._artifact
+
+    def paradigm(self, entry, space):
+        """
+        Retrieve the precomputed paradigm of an irregular verb
+
+        Parameters
+        ----------
+        entry : str
+            the gerund of the irregular verb
+        space : str
+            a string that is either space (" "), ZWNJ (\\u200c), or
+            empty string ("")
+
+        Returns
+        -------
+        dict or None
+            a fresh copy of the paradigm, or None if it is not precomputed
+        """
+        start = timers.enabled and timer()
+        artifact = self._artifact
+        if artifact is None:
+            artifact = self._load_artifact()
+        paradigm = artifact.get(space, {}).get(entry)
+        # paradigms are kept as JSON text and decoded on demand
+        if paradigm is not None:
+            paradigm = json.loads(paradigm)
+        if start:
+            timers.since('artifact', start)
+        return paradigm
+
+    def reload(self):
+        """
+        Drop the loaded data so that the files are parsed again on next access
+        """
+        with self._lock:
+            self._data = None
+            self._artifact = None
+            self._neighborhood = None
+
+
+# the lexicon shared by the whole process
+lexicon = Lexicon()
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+
+from array import array
+from enum import IntEnum
+from itertools import product
+
+# the layers of the paradigm hierarchy; the aspects include the ones used
+# by the paradigms shipped in irregulars.json
+Formality = IntEnum('Formality', ['formal', 'informal'], start=0)
+Alphabet = IntEnum('Alphabet', ['IPA', 'Persian'], start=0)
+Polarity = IntEnum('Polarity', ['affirmative', 'negative'], start=0)
+Tense = IntEnum('Tense', ['present', 'past', 'future'], start=0)
+Aspect = IntEnum('Aspect', ['simple', 'continuous', 'subjunctive',
+                            'progressive', 'perfect', 'perfect past',
+                            'perfect subjunctive', 'imperative',
+                            'subjunctive perfect', 'present perfect'], start=0)
+Person = IntEnum('Person', ['s1', 's2', 's3', 'p1', 'p2', 'p3'], start=0)
+
+ENUMS = [Formality, Alphabet, Polarity, Tense, Aspect, Person]
+
+# the members of every enum keyed by their names, faster to look up than
+# the enums themselves
+MEMBERS = [dict(enum.__members__) for enum in ENUMS]
+
+# the keys of the nodes seen so far, with their depth, mapped to the enums of
+# the keys in their order, or to None if it is the order of their enum
+ORDERS = {}
+
+# the shapes of the branches; a list of n dual branches is LIST + n, so
+# every shape of a list is apart from the others, even an empty list
+ABSENT, NONE, DICT, LIST = 0, 1, 2, 3
+
+# the code of an absent person; codes below it point to the extras
+MISSING = -1
+
+
+class Paradigm():
+    """
+    A compact, read-only paradigm stored in flat arrays
+
+    The cells are kept in a flat array indexed by (formality, alphabet,
+    polarity, tense, aspect, person). Every distinct form is stored once in
+    a single string, so a cell is only a number pointing to it. The
+    paradigm could be navigated like the nested dictionary returned by
+    `inflector`, and `to_dict` returns that dictionary.
+
+    Attributes
+    ----------
+    branches : array
+        1 for every (formality, alphabet, polarity) branch that exists
+    tenses : array
+        the shape (absent, None, or dictionary) of every tense
+    aspects : array
+        the shape (absent, None, dictionary, or list of n dictionaries) of
+        every aspect
+    cells : array
+        the code of every person: the number of a form, MISSING if the
+        person is absent, or a code below MISSING pointing to the extras
+    text : str
+        the distinct forms of the paradigm joined together
+    offsets : array
+        the start of every form in text, followed by the length of text
+    extras : tuple
+        tuples of codes, used for lists of alternative forms and for the
+        forms of every dual branch
+    orders : dict
+        the coordinates of the nodes whose keys were not in the order of
+        their enum, like in the paradigms written in irregulars.json, mapped
+        to the enums of the keys in their order; the dual branch n of an
+        aspect is at the coordinates of the aspect followed by n
+    """
+    __slots__ = ['branches', 'tenses', 'aspects', 'cells', 'text', 'offsets',
+                 'extras', 'orders']
+
+    def __init__(self, paradigm) -> None:
+        """
+        Parameters
+        ----------
+        paradigm : dict
+            a nested dictionary containing inflected forms
+        """
+        sizes = [len(enum) for enum in ENUMS]
+        self.branches = array('b', bytes(sizes[0] * sizes[1] * sizes[2]))
+        self.tenses = array('b', bytes(len(self.branches) * sizes[3]))
+        self.aspects = array('b', bytes(len(self.tenses) * sizes[4]))
+        self.cells = array('i', [MISSING]) * (len(self.aspects) * sizes[5])
+
+        strings, extras = {}, []
+        self.orders = {}
+
+        def ordering(coords, keys):
+            # keep the order of the keys if it is not the order of the enum
+            depth = min(len(coords), 5)
+            keys = (depth, *keys)
+            if keys not in ORDERS:
+                order = [MEMBERS[depth][key] for key in keys[1:]]
+                ORDERS[keys] = tuple(order) if order != sorted(order) else None
+            if ORDERS[keys] is not None:
+                self.orders[coords] = ORDERS[keys]
+
+        def encode(value):
+            # turn a form, None, or a list of them into a code
+            if value is None:
+                return MISSING
+            if isinstance(value, str):
+                return strings.setdefault(value, len(strings))
+            extras.append(tuple(encode(val) for val in value))
+            return MISSING - len(extras)
+
+        ordering((), paradigm)
+        for formality, alphabets in paradigm.items():
+            ordering((Formality[formality],), alphabets)
+            for alphabet, polarities in alphabets.items():
+                ordering((Formality[formality], Alphabet[alphabet]), polarities)
+
+        for f, a, p, branch in self._branches(paradigm):
+            i = self._index(f, a, p)
+            self.branches[i] = 1
+            ordering((f, a, p), branch)
+            for tense, aspects in branch.items():
+                tense = MEMBERS[3][tense]
+                t = i * sizes[3] + tense
+                if aspects is None:
+                    self.tenses[t] = NONE
+                    continue
+                self.tenses[t] = DICT
+                ordering((f, a, p, tense), aspects)
+                for aspect, persons in aspects.items():
+                    aspect = MEMBERS[4][aspect]
+                    s = t * sizes[4] + aspect
+                    coords = (f, a, p, tense, aspect)
+                    if persons is None:
+                        self.aspects[s] = NONE
+                    elif isinstance(persons, list):
+                        self.aspects[s] = LIST + len(persons)
+                        for n, dual in enumerate(persons):
+                            ordering(coords + (n,), dual)
+                        for person in Person:
+                            self.cells[s * sizes[5] + person] = encode(
+                                [dual.get(person.name) for dual in persons])
+                    else:
+                        self.aspects[s] = DICT
+                        ordering(coords, persons)
+                        for person, form in persons.items():
+                            self.cells[s * sizes[5] + MEMBERS[5][person]] = encode(form)
+
+        self.text = ''.join(strings)
+        self.offsets = array('i', [0])
+        for form in strings:
+            self.offsets.append(self.offsets[-1] + len(form))
+        self.extras = tuple(extras)
+
+    def _decode(self, code):
+        # turn a code back into a form, None, or a list of them
+        if code >= 0:
+            return self.text[self.offsets[code]:self.offsets[code + 1]]
+        if code == MISSING:
+            return None
+        return [self._decode(val) for val in self.extras[MISSING - code - 1]]
+
+    @staticmethod
+    def _branches(paradigm):
+        for formality, alphabets in paradigm.items():
+            for alphabet, polarities in alphabets.items():
+                for polarity, branch in polarities.items():
+                    yield (Formality[formality], Alphabet[alphabet],
+                           Polarity[polarity], branch)
+
+    @staticmethod
+    def _index(*coords):
+        # the flat index of the coordinates of the first layers
+        index = 0
+        for enum, coord in zip(ENUMS, coords):
+            index = index * len(enum) + coord
+        return index
+
+    def get(self, formality, alphabet, polarity, tense, aspect, person):
+        """
+        Retrieve the form of a cell
+
+        Parameters
+        ----------
+        formality, alphabet, polarity, tense, aspect, person : str or IntEnum
+            the names or the enums of the coordinates of the cell
+
+        Returns
+        -------
+        str, list, or None
+            the form of the cell as it is in the nested dictionary, or the
+            list of the forms of every dual branch if the aspect is dual
+        """
+        coords = [enum[coord] if isinstance(coord, str) else coord
+                  for enum, coord in zip(ENUMS, [formality, alphabet, polarity,
+                                                 tense, aspect, person])]
+        return self._decode(self.cells[self._index(*coords)])
+
+    def _aspect(self, s, coords):
+        # rebuild the dictionary (or the list of dual dictionaries) of an aspect
+        shape = self.aspects[s]
+        if shape == NONE:
+            return None
+        cells = self.cells[s * len(Person):(s + 1) * len(Person)]
+        if shape == DICT:
+            order = self.orders.get(coords, Person)
+            return {person.name: self._decode(cells[person])
+                    for person in order if cells[person] != MISSING}
+        duals = [self._decode(code) for code in cells]
+        return [{person.name: duals[person][n]
+                 for person in self.orders.get(coords + (n,), Person)
+                 if duals[person][n] is not None}
+                for n in range(shape - LIST)]
+
+    def _node(self, coords):
+        # rebuild the branch of the coordinates as a view or a dictionary
+        depth = len(coords)
+        if depth < 4:
+            return ParadigmView(self, coords)
+        t = self._index(*coords)
+        if depth == 4:
+            if self.tenses[t] == NONE:
+                return None
+            return ParadigmView(self, coords)
+        return self._aspect(t, coords)
+
+    def _keys(self, coords):
+        # the names of the existing children of the coordinates, in the
+        # order they were given
+        order = self.orders.get(coords)
+        if order is not None:
+            return [child.name for child in order]
+        depth = len(coords)
+        enum = ENUMS[depth]
+        keys = []
+        for child in enum:
+            index = self._index(*coords, child)
+            if depth < 3:
+                # a formality or an alphabet exists if a branch under it exists
+                exists = any(self.branches[self._index(*branch)]
+                             for branch in product(Formality, Alphabet, Polarity)
+                             if branch[:depth + 1] == (*coords, child))
+            elif depth == 3:
+                exists = self.tenses[index] != ABSENT
+            else:
+                exists = self.aspects[index] != ABSENT
+            if exists:
+                keys.append(child.name)
+        return keys
+
+    def __getitem__(self, key):
+        return ParadigmView(self, ())[key]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def __eq__(self, other):
+        if isinstance(other, (Paradigm, ParadigmView)):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return f'Paradigm({self.to_dict()!r})'
+
+    def keys(self):
+        return self._keys(())
+
+    def to_dict(self):
+        """
+        Rebuild the nested dictionary of the paradigm
+
+        Returns
+        -------
+        dict
+            a nested dictionary equal to the one the paradigm was made
+            from, with its keys in the same order
+        """
+        return ParadigmView(self, ()).to_dict()
+
+
+class ParadigmView():
+    """
+    A branch of a compact paradigm navigated like a nested dictionary
+    """
+    __slots__ = ['paradigm', 'coords']
+
+    def __init__(self, paradigm, coords) -> None:
+        self.paradigm = paradigm
+        self.coords = coords
+
+    def keys(self):
+        return self.paradigm._keys(self.coords)
+
+    def __getitem__(self, key):
+        if key not in self.keys():
+            raise KeyError(key)
+        coord = ENUMS[len(self.coords)][key]
+        return self.paradigm._node(self.coords + (coord,))
+
+    def get(self, key, default=None):
+        return self[key] if key in self.keys() else default
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def __eq__(self, other):
+        if isinstance(other, (Paradigm, ParadigmView)):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        """
+        Rebuild the nested dictionary of the branch
+
+        Returns
+        -------
+        dict
+            a nested dictionary containing the inflected forms of the branch
+        """
+        branch = {}
+        for key, val in self.items():
+            branch[key] = val.to_dict() if isinstance(val, ParadigmView) else val
+        return branch
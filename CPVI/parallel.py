@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from .CPVI import CPVI
+from .errors import custom_errors
+from .lexicon import lexicon
+
+# the profiler of the worker process
+_worker = None
+
+
+def _initializer(cache_size, transliterate, backend):
+    """
+    Load the lexicon once in every worker process and make its profiler
+    with the options of the caller
+
+    Parameters
+    ----------
+    cache_size, transliterate, backend
+        the arguments of `CPVI`
+    """
+    global _worker
+    lexicon.irregulars
+    _worker = CPVI(cache_size, transliterate, backend)
+
+
+def _profile_chunk(chunk, space):
+    """
+    Profile a chunk of (word, API_form) tuples in a worker process
+
+    Parameters
+    ----------
+    chunk : list of tuples
+        a list of (word, API_form) tuples
+    space : str
+        a string that is either space (" "), ZWNJ (\\u200c), or
+        empty string ("")
+
+    Returns
+    -------
+    list
+        the profile of every tuple, or the error that it raised
+    """
+    results = []
+    for word, API_form in chunk:
+        try:
+            results.append(_worker.profiling(word, API_form, space))
+        except (TypeError, ValueError) as error:
+            results.append(error)
+    return results
+
+
+def profile_parallel(items, space='\u200c', workers=None, chunksize=256,
+                     cache_size=0, transliterate=False, backend=None):
+    """
+    Profile the verbs passed in items in a pool of worker processes
+
+    Parameters
+    ----------
+    items : iterable
+        an iterable of words or (word, API_form) tuples
+    space : str, optional
+        either space (" "), ZWNJ (\\u200c), or empty string ("")
+    workers : int, optional
+        the number of worker processes; the default value None uses the
+        number of processors
+    chunksize : int, optional
+        the number of items sent to a worker at once
+    cache_size, transliterate, backend : optional
+        the arguments of the `CPVI` of every worker; the backend is sent
+        to the workers, so it should be picklable
+
+    Returns
+    -------
+    list
+        the profile of every item, in the order of items; items that raise
+        TypeError or ValueError in `profiling` get the error instead
+    """
+    # raise errors
+    custom_errors('', space)
+    if chunksize < 1:
+        raise ValueError('The "chunksize" argument should be a positive integer')
+
+    items = [(item, '') if isinstance(item, str) else tuple(item)
+             for item in items]
+    chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+    results = []
+    with ProcessPoolExecutor(workers, initializer=_initializer,
+                             initargs=(cache_size, transliterate,
+                                       backend)) as executor:
+        # map keeps the chunks in order
+        for chunk in executor.map(_profile_chunk, chunks, repeat(space)):
+            results += chunk
+    return results
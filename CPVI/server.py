@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+from .CPVI import CPVI
+from .errors import custom_errors, selector_errors
+from .inflection import LAYERS
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from timeit import default_timer as timer
+from urllib.parse import urlsplit, parse_qs
+import asyncio
+import json
+
+# the names of the spaces accepted in the query string
+SPACES = {'zwnj': '\u200c', 'space': ' ', 'none': ''}
+
+# the upper bounds of the latency buckets in milliseconds
+BOUNDS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500,
+          5000, 10000]
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed'}
+
+
+class Histogram():
+    """
+    A latency histogram with fixed buckets
+
+    Attributes
+    ----------
+    counts : list
+        the number of latencies in every bucket of BOUNDS, and in the
+        bucket above the last bound
+    count : int
+        the number of recorded latencies
+    total : float
+        the sum of the recorded latencies in milliseconds
+    """
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, latency):
+        """
+        Record a latency
+
+        Parameters
+        ----------
+        latency : float
+            the latency in milliseconds
+        """
+        self.counts[bisect_left(BOUNDS, latency)] += 1
+        self.count += 1
+        self.total += latency
+
+    def percentile(self, q):
+        """
+        Estimate a percentile as the upper bound of its bucket
+
+        Parameters
+        ----------
+        q : float
+            the percentile between 0 and 100
+
+        Returns
+        -------
+        float or None
+            the upper bound of the bucket in milliseconds, or None if no
+            latency was recorded
+        """
+        if not self.count:
+            return None
+        rank, seen = q / 100 * self.count, 0
+        for bound, count in zip(BOUNDS + [float('inf')], self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def summary(self):
+        """
+        Get the buckets and the percentiles of the histogram
+
+        Returns
+        -------
+        dict
+            a dictionary containing count, mean, p50, p90, p99, and the
+            count of every bucket keyed by its upper bound
+        """
+        return {'count': self.count,
+                'mean': self.total / self.count if self.count else None,
+                'p50': self.percentile(50), 'p90': self.percentile(90),
+                'p99': self.percentile(99),
+                'buckets': {str(bound): count for bound, count
+                            in zip(BOUNDS + ['inf'], self.counts)}}
+
+
+class Service():
+    """
+    An asyncio HTTP service that profiles verbs
+
+    Duplicate requests that arrive while the same profile is being computed
+    wait for that computation instead of starting another one. Profiling
+    runs in a bounded executor, so the event loop keeps serving requests.
+
+    Endpoints
+    ---------
+    GET /profile?word=...&api=...&space=zwnj|space|none
+        the profile of the verb
+    GET /slice?word=...&api=...&space=...&formality=...&tense=...
+        the profile with the paradigm limited to the selected values of the
+        layers; a layer could be repeated to select several values
+    GET /stats
+        the latency histograms and the counters of the service
+
+    Attributes
+    ----------
+    coalesce : bool
+        if True, in-flight duplicate requests share a single computation
+    workers : int
+        the number of threads of the executor
+    histograms : dict
+        the latency histograms keyed by endpoint and by 'compute'
+    counters : dict
+        the numbers of requests, computations, and coalesced requests
+    """
+    def __init__(self, workers=4, coalesce=True, cache_size=0) -> None:
+        """
+        Parameters
+        ----------
+        workers : int, optional
+            the number of threads profiling verbs; no more than this number
+            of computations run at once
+        coalesce : bool, optional
+            if True, in-flight duplicate requests share a single computation
+        cache_size : int, optional
+            the maximum number of profiles kept in the cache of `CPVI`
+        """
+        if workers < 1:
+            raise ValueError('The "workers" argument should be a positive integer')
+        self.coalesce = coalesce
+        self.workers = workers
+        self.profiler = CPVI(cache_size)
+        self.executor = ThreadPoolExecutor(workers)
+        self.histograms = {'profile': Histogram(), 'slice': Histogram(),
+                           'compute': Histogram()}
+        self.counters = {'requests': 0, 'computations': 0, 'coalesced': 0}
+        self._inflight = {}
+
+    def _compute(self, word, API_form, space, select):
+        # profile the verb and encode the response once for every waiter
+        start = timer()
+        profile = self.profiler.profiling(word, API_form, space, select)
+        body = json.dumps(profile, ensure_ascii=False).encode('utf-8')
+        return body, (timer() - start) * 1000
+
+    async def profile(self, word, API_form='', space='\u200c', select=None):
+        """
+        Get the JSON encoded profile of a verb
+
+        Parameters
+        ----------
+        word : str
+            a string in Persian alphabet
+        API_form : str, optional
+            a string in IPA alphabet
+        space : str, optional
+            either space (" "), ZWNJ (\\u200c), or empty string ("")
+        select : dict, optional
+            a dictionary mapping layers of the paradigm to a list of values
+
+        Returns
+        -------
+        bytes
+            the profile encoded as UTF-8 JSON
+        """
+        key = (word, API_form, space,
+               tuple(sorted((k, tuple(v)) for k, v in (select or {}).items())))
+        if self.coalesce and key in self._inflight:
+            self.counters['coalesced'] += 1
+            return await asyncio.shield(self._inflight[key])
+
+        self.counters['computations'] += 1
+        future = asyncio.ensure_future(self._run(word, API_form, space, select))
+        if not self.coalesce:
+            return await future
+        self._inflight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            # later requests start a new computation
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _run(self, word, API_form, space, select):
+        # the histograms are only touched by the event loop thread
+        loop = asyncio.get_running_loop()
+        body, latency = await loop.run_in_executor(
+            self.executor, self._compute, word, API_form, space, select)
+        self.histograms['compute'].record(latency)
+        return body
+
+    def stats(self):
+        """
+        Get the latency histograms and the counters of the service
+
+        Returns
+        -------
+        dict
+            a dictionary containing the counters, the number of in-flight
+            computations, and the summary of every histogram
+        """
+        stats = dict(self.counters, inflight=len(self._inflight),
+                     coalesce=self.coalesce, workers=self.workers)
+        stats['latency'] = {name: histogram.summary()
+                            for name, histogram in self.histograms.items()}
+        return stats
+
+    async def respond(self, method, target):
+        """
+        Get the status and the body of the response to a request
+
+        Parameters
+        ----------
+        method : str
+            the method of the request
+        target : str
+            the path and the query string of the request
+
+        Returns
+        -------
+        tuple
+            the status code and the JSON encoded body
+        """
+        url = urlsplit(target)
+        if url.path not in ['/profile', '/slice', '/stats']:
+            return 404, json.dumps({'error': f'"{url.path}" is not found'}).encode()
+        if method != 'GET':
+            return 405, json.dumps({'error': 'Use GET'}).encode()
+        if url.path == '/stats':
+            return 200, json.dumps(self.stats()).encode()
+
+        query = parse_qs(url.query)
+        word = query.get('word', [''])[0]
+        API_form = query.get('api', [''])[0]
+        space = SPACES.get(query.get('space', ['zwnj'])[0])
+        select = None
+        if url.path == '/slice':
+            select = {layer: query[layer] for layer in LAYERS if layer in query}
+        try:
+            if not word:
+                raise ValueError('The "word" parameter is required')
+            if space is None:
+                raise ValueError(f'Use {", ".join(SPACES)} as the "space" parameter')
+            custom_errors(API_form, space)
+            selector_errors(select)
+            return 200, await self.profile(word, API_form, space, select)
+        except (TypeError, ValueError) as error:
+            return 400, json.dumps({'error': str(error)}, ensure_ascii=False).encode()
+
+    async def handle(self, reader, writer):
+        """
+        Serve the requests of a connection; connections are kept alive
+        unless the client asks to close them
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            the stream of the requests
+        writer : asyncio.StreamWriter
+            the stream of the responses
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                start = timer()
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in [b'\r\n', b'\n', b'']:
+                        break
+                    name, _, value = header.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                # the bodies of the requests are not used, but the end of a
+                # body of unknown length could not be found, so the
+                # connection is closed after the response
+                length = headers.get('content-length', '0') or '0'
+                length = int(length) if length.isascii() and length.isdigit() else None
+                if length:
+                    await reader.readexactly(length)
+
+                parts = line.decode('latin-1').split()
+                if len(parts) != 3:
+                    status, body = 400, b'{"error": "Malformed request line"}'
+                elif length is None:
+                    status, body = 400, b'{"error": "Malformed Content-Length header"}'
+                else:
+                    self.counters['requests'] += 1
+                    status, body = await self.respond(parts[0], parts[1])
+                close = (length is None or
+                         headers.get('connection', '').lower() == 'close')
+                writer.write(f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+                             f'Content-Type: application/json; charset=utf-8\r\n'
+                             f'Content-Length: {len(body)}\r\n'
+                             f'Connection: {"close" if close else "keep-alive"}'
+                             f'\r\n\r\n'.encode('latin-1') + body)
+                await writer.drain()
+                path = urlsplit(parts[1]).path.strip('/') if len(parts) == 3 else ''
+                if status == 200 and path in self.histograms:
+                    self.histograms[path].record((timer() - start) * 1000)
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8000):
+        """
+        Serve until the task is cancelled
+
+        Parameters
+        ----------
+        host : str, optional
+            the host to listen on
+        port : int, optional
+            the port to listen on
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def serve(host='127.0.0.1', port=8000, workers=4, coalesce=True, cache_size=0):
+    """
+    Run the inflection service until it is interrupted
+
+    Parameters
+    ----------
+    host : str, optional
+        the host to listen on
+    port : int, optional
+        the port to listen on
+    workers : int, optional
+        the number of threads profiling verbs
+    coalesce : bool, optional
+        if True, in-flight duplicate requests share a single computation
+    cache_size : int, optional
+        the maximum number of profiles kept in the cache of `CPVI`
+    """
+    service = Service(workers, coalesce, cache_size)
+    try:
+        asyncio.run(service.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.executor.shutdown()
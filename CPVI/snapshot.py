@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+
+from .build import SPACES
+from .inflection import inflector
+from .lexicon import Lexicon, lexicon, surface_index, thaw, versioning
+from pathlib import Path
+from struct import Struct
+import argparse
+import mmap
+import os
+
+# the binary snapshot of the lexicon and the paradigms of irregulars,
+# written by convert
+SNAPSHOT = 'lexicon.snap'
+
+MAGIC = b'CPVISNAP'
+FORMAT = 1
+
+# the header: magic, format, SHA-256 digest of the data files, the counts
+# of strings, entries, and surface forms, the positions of the sections,
+# and the position of the conjugations among the values
+HEADER = Struct('<8sH32sIIIIIIIII')
+
+# an entry record: the gerund, the properties, and the paradigm of every
+# space option; records have a fixed size so entry n is at n * RECORD.size
+RECORD = Struct(f'<II{len(SPACES)}I')
+
+# a pair of numbers: the start and end of a string in the string table, or
+# a row of the sorted tables (a string and the number of an entry)
+PAIR = Struct('<II')
+
+U16, U32 = Struct('<H'), Struct('<I')
+
+# the tags of the encoded values
+NONE, FALSE, TRUE, STRING, LIST, DICT = range(6)
+
+
+def encode(value, strings, out):
+    """
+    Append the binary encoding of a JSON value to a bytearray
+
+    Strings are replaced by their numbers in the string table.
+
+    Parameters
+    ----------
+    value : dict, list, str, bool, or None
+        the value loaded from a JSON file
+    strings : dict
+        the string table mapping strings to their numbers; new strings are
+        added to it
+    out : bytearray
+        the buffer that the encoding is appended to
+    """
+    if value is None:
+        out.append(NONE)
+    elif value is True or value is False:
+        out.append(TRUE if value else FALSE)
+    elif isinstance(value, str):
+        out.append(STRING)
+        out += U32.pack(strings.setdefault(value, len(strings)))
+    elif isinstance(value, list):
+        out.append(LIST)
+        out += U16.pack(len(value))
+        for val in value:
+            encode(val, strings, out)
+    elif isinstance(value, dict):
+        out.append(DICT)
+        out += U16.pack(len(value))
+        for key, val in value.items():
+            out += U32.pack(strings.setdefault(key, len(strings)))
+            encode(val, strings, out)
+    else:
+        raise TypeError(f'The value "{value!r}" could not be encoded')
+
+
+def convert(output=None, path=None):
+    """
+    Convert the data files and the paradigms of irregulars to a snapshot
+
+    The paradigms are taken from the precomputed artifact, or inflected if
+    it is not built.
+
+    Parameters
+    ----------
+    output : str or Path, optional
+        the path of the snapshot; the default value is data/lexicon.snap
+        next to the data files
+    path : str or Path, optional
+        the directory of the data files; the default value is the
+        directory of the shared lexicon
+
+    Returns
+    -------
+    dict
+        the numbers of entries and strings, the size of the snapshot in
+        bytes, and the version of the data files
+    """
+    source = lexicon if path is None else Lexicon(path)
+    output = Path(output or source.path / SNAPSHOT)
+    irregulars = source.irregulars
+
+    strings, values = {}, bytearray()
+    records = []
+    for entry, props in irregulars.items():
+        record = [strings.setdefault(entry, len(strings)), len(values)]
+        encode(props, strings, values)
+        for space in SPACES:
+            paradigm = source.paradigm(entry, space)
+            if paradigm is None:
+                paradigm = inflector(thaw(props), space)['paradigm']
+            record.append(len(values))
+            encode(paradigm, strings, values)
+        records.append(record)
+    conjugations = len(values)
+    encode(source.conjugations, strings, values)
+
+    # the gerunds and the surface forms sorted by their UTF-8 bytes, so
+    # that they could be searched without decoding every string
+    numbers = {entry: n for n, entry in enumerate(irregulars)}
+    gerunds = sorted((entry.encode('utf-8'), strings[entry], numbers[entry])
+                     for entry in irregulars)
+    forms = sorted((form.encode('utf-8'),
+                    strings.setdefault(form, len(strings)), numbers[entry])
+                   for form, entry in surface_index(irregulars).items())
+
+    blob = bytearray()
+    offsets = bytearray(U32.pack(0))
+    for string in strings:
+        blob += string.encode('utf-8')
+        offsets += U32.pack(len(blob))
+
+    # lay the sections out after the header
+    sections = [offsets, blob,
+                b''.join(RECORD.pack(*record) for record in records),
+                b''.join(PAIR.pack(sid, n) for _, sid, n in gerunds),
+                b''.join(PAIR.pack(sid, n) for _, sid, n in forms),
+                values]
+    positions, position = [], HEADER.size
+    for section in sections:
+        positions.append(position)
+        position += len(section)
+    header = HEADER.pack(MAGIC, FORMAT, bytes.fromhex(source.version),
+                         len(strings), len(records), len(forms),
+                         positions[0], positions[1], positions[2],
+                         positions[3], positions[4], conjugations)
+    with open(output, 'wb') as file:
+        file.write(header)
+        # the values are addressed relative to the start of their section
+        for section in sections:
+            file.write(section)
+
+    return {'entries': len(records), 'strings': len(strings),
+            'bytes': position, 'version': source.version}
+
+
+class Snapshot():
+    """
+    A read-only lexicon memory-mapped from a binary snapshot
+
+    Opening a snapshot reads only its header and hashes the data files; a
+    snapshot converted from other data files is rejected. Every entry,
+    paradigm, and string is decoded from the mapped file when it is asked
+    for, so the cost of the first lookup does not depend on the size of
+    the lexicon.
+
+    Attributes
+    ----------
+    path : Path
+        the path of the snapshot
+    version : str
+        the SHA-256 digest of the data files that the snapshot was made from
+    """
+    def __init__(self, path=None, data=None) -> None:
+        """
+        Parameters
+        ----------
+        path : str or Path, optional
+            the path of the snapshot; the default value is data/lexicon.snap
+            next to the data files
+        data : str or Path, optional
+            the directory of the data files that the snapshot should be
+            converted from; the default value is the directory of the
+            shared lexicon
+
+        Raises
+        ------
+        ValueError
+            if the file is not a snapshot of this format, or if it was
+            converted from other data files
+        """
+        self.path = Path(path or lexicon.path / SNAPSHOT)
+        with open(self.path, 'rb') as file:
+            # a file shorter than the header, even an empty one that could
+            # not be mapped, is not a snapshot
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise ValueError(f'"{self.path}" is not a CPVI snapshot of '
+                                 f'format {FORMAT}; convert the data files again')
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, fmt, digest, self._strings, self._entries, self._forms,
+         self._offsets, self._blob, self._records, self._gerunds,
+         self._index, self._conjugations) = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or fmt != FORMAT:
+            self._buffer.close()
+            raise ValueError(f'"{self.path}" is not a CPVI snapshot of '
+                             f'format {FORMAT}; convert the data files again')
+        self.version = digest.hex()
+        if self.version != versioning(data or lexicon.path):
+            self._buffer.close()
+            raise ValueError(f'"{self.path}" was converted from other data '
+                             f'files; convert them again')
+        self._values = self._index + self._forms * PAIR.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Unmap the snapshot
+        """
+        self._buffer.close()
+
+    def __len__(self):
+        return self._entries
+
+    def __iter__(self):
+        for n in range(self._entries):
+            yield self._string(RECORD.unpack_from(
+                self._buffer, self._records + n * RECORD.size)[0])
+
+    def __contains__(self, entry):
+        return self._search(self._gerunds, self._entries, entry) is not None
+
+    def _bytes(self, sid):
+        # the UTF-8 bytes of a string of the string table
+        start, end = PAIR.unpack_from(self._buffer, self._offsets + sid * 4)
+        return self._buffer[self._blob + start:self._blob + end]
+
+    def _string(self, sid):
+        return self._bytes(sid).decode('utf-8')
+
+    def _search(self, table, size, string):
+        # binary search a sorted table for the entry number of a string
+        target = string.encode('utf-8')
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            sid, n = PAIR.unpack_from(self._buffer, table + middle * PAIR.size)
+            found = self._bytes(sid)
+            if found == target:
+                return n
+            if found < target:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def _decode(self, position):
+        # decode the value at the position and return the next position
+        buffer = self._buffer
+        tag = buffer[position]
+        position += 1
+        if tag == STRING:
+            return self._string(U32.unpack_from(buffer, position)[0]), position + 4
+        if tag == DICT:
+            size = U16.unpack_from(buffer, position)[0]
+            position += 2
+            value = {}
+            for _ in range(size):
+                key = self._string(U32.unpack_from(buffer, position)[0])
+                value[key], position = self._decode(position + 4)
+            return value, position
+        if tag == LIST:
+            size = U16.unpack_from(buffer, position)[0]
+            position += 2
+            value = []
+            for _ in range(size):
+                val, position = self._decode(position)
+                value.append(val)
+            return value, position
+        return [None, False, True][tag], position
+
+    def _record(self, n):
+        return RECORD.unpack_from(self._buffer, self._records + n * RECORD.size)
+
+    def lookup(self, word):
+        """
+        Find the irregular verb that the word is its gerund or a Persian stem
+
+        Parameters
+        ----------
+        word : str
+            a string in Persian alphabet
+
+        Returns
+        -------
+        str or None
+            the gerund of the irregular verb, or None
+        """
+        n = self._search(self._index, self._forms, word)
+        return None if n is None else self._string(self._record(n)[0])
+
+    def entry(self, entry):
+        """
+        Decode the properties of an irregular verb
+
+        Parameters
+        ----------
+        entry : str
+            the gerund of the irregular verb
+
+        Returns
+        -------
+        dict or None
+            a fresh copy of the properties as they are in irregulars.json,
+            or None if the verb is not in the snapshot
+        """
+        n = self._search(self._gerunds, self._entries, entry)
+        return None if n is None else self._decode(self._values + self._record(n)[1])[0]
+
+    def paradigm(self, entry, space='\u200c'):
+        """
+        Decode the precomputed paradigm of an irregular verb
+
+        Parameters
+        ----------
+        entry : str
+            the gerund of the irregular verb
+        space : str, optional
+            either space (" "), ZWNJ (\\u200c), or empty string ("")
+
+        Returns
+        -------
+        dict or None
+            a fresh copy of the paradigm, or None if it is not in the
+            snapshot
+        """
+        n = self._search(self._gerunds, self._entries, entry)
+        if n is None or space not in SPACES:
+            return None
+        position = self._record(n)[2 + SPACES.index(space)]
+        return self._decode(self._values + position)[0]
+
+    def profile(self, word, space='\u200c'):
+        """
+        Get the profile of an irregular verb, like `CPVI.profiling` does
+
+        Parameters
+        ----------
+        word : str
+            the gerund or a Persian stem of an irregular verb
+        space : str, optional
+            either space (" "), ZWNJ (\\u200c), or empty string ("")
+
+        Returns
+        -------
+        dict or None
+            the properties and the paradigm of the verb, or None if the
+            word is not an irregular verb
+        """
+        entry = self.lookup(word)
+        if entry is None:
+            return None
+        profile = self.entry(entry)
+        profile['paradigm'] = self.paradigm(entry, space)
+        return profile
+
+    @property
+    def conjugations(self):
+        """
+        Decode the subjective and objective conjugations
+        """
+        return self._decode(self._values + self._conjugations)[0]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Convert the data files to a binary snapshot')
+    parser.add_argument('-o', '--output', help='the path of the snapshot')
+    args = parser.parse_args()
+    print(convert(args.output))
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+from .CPVI import CPVI
+from .analyzer import Analyzer
+from .inflection import inflector
+from .lexicon import lexicon, thaw
+from collections import deque
+from timeit import default_timer as timer
+import codecs
+import json
+import re
+import sys
+
+# a token is a run of letters; ZWNJ, spaces, and punctuation separate tokens
+TOKEN = re.compile(r'\w+')
+
+# the characters that could stand between the words of a single verb form,
+# like the prefix and the stem or the participle and the auxiliary
+JOINERS = set(' \t\u200c')
+
+# the largest number of words in an inflected form, like نگفته بوده باشم
+WIDTH = 4
+
+# the number of bytes read from the corpus at once
+CHUNK = 1 << 16
+
+
+def indexing(verbs=None):
+    """
+    Build the index of verb forms used by the tagger
+
+    Irregulars are indexed with both ZWNJ and empty string spaces, so that
+    forms written with or without a space between affixes are found.
+
+    Parameters
+    ----------
+    verbs : iterable, optional
+        an iterable of words or (word, API_form) tuples of other verbs to
+        profile and index
+
+    Returns
+    -------
+    Analyzer
+        the index of verb forms
+    """
+    analyzer = Analyzer('\u200c')
+    for entry, props in lexicon.irregulars.items():
+        # inflect the paradigm if the artifact is missing or stale
+        paradigm = lexicon.paradigm(entry, '')
+        if paradigm is None:
+            paradigm = inflector(thaw(props), '')['paradigm']
+        analyzer.insert(entry, paradigm)
+    p = CPVI()
+    # the verbs are profiled once for every space
+    verbs = list(verbs or [])
+    for space in ['\u200c', '']:
+        for profile in p.profile_many(verbs, space):
+            analyzer.add(profile)
+    return analyzer
+
+
+def cutting(text, start=0):
+    """
+    Find where a piece of text could be cut without splitting a token or
+    the words of a verb form
+
+    Parameters
+    ----------
+    text : str
+        the text read so far
+    start : int, optional
+        the position before which there is no character but letters and
+        joiners
+
+    Returns
+    -------
+    int
+        the position after the last character that is neither a letter nor
+        a joiner; if there is none and the text is longer than CHUNK, the
+        position after the last joiner or the length of the text, otherwise 0
+    """
+    for n in range(len(text) - 1, start - 1, -1):
+        if text[n] not in JOINERS and not TOKEN.match(text[n]):
+            return n + 1
+    if len(text) <= CHUNK:
+        return 0
+    # a very long run of words is cut so that the memory stays bounded
+    for n in range(len(text) - 1, -1, -1):
+        if text[n] in JOINERS:
+            return n + 1
+    return len(text)
+
+
+def reading(file, offset=0, size=CHUNK):
+    """
+    Read a UTF-8 file in chunks from a byte offset
+
+    Every piece ends where no token or verb form continues, and the rest of
+    the chunk is carried over to the next piece, so the memory does not
+    depend on the length of the lines. Bytes that are not UTF-8 are kept
+    as surrogates, so the offsets stay exact.
+
+    Parameters
+    ----------
+    file : binary file
+        a file opened in binary mode
+    offset : int, optional
+        the byte offset to resume from, like the offset of a token; if it
+        falls inside a token the rest of that token is skipped
+    size : int, optional
+        the number of bytes read at once
+
+    Yields
+    ------
+    tuple
+        the byte offset of every piece and the decoded piece
+    """
+    partial = False
+    if offset:
+        # step over the rest of a character that the offset falls in
+        file.seek(offset)
+        head = file.read(4)
+        skip = 0
+        while skip < len(head) and head[skip] & 0xc0 == 0x80:
+            skip += 1
+        offset += skip
+        file.seek(max(0, offset - 4))
+        before = file.read(offset - max(0, offset - 4))
+        before = before.decode('utf-8', errors='ignore')
+        partial = bool(before) and TOKEN.match(before[-1]) is not None
+        file.seek(offset)
+
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='surrogateescape')
+    carry = ''
+    while True:
+        raw = file.read(size)
+        text = carry + decoder.decode(raw, final=not raw)
+        carried, carry = len(carry), ''
+        if partial:
+            # skip the rest of the token that the offset falls in
+            match = TOKEN.match(text)
+            if match:
+                offset += len(match.group().encode('utf-8', 'surrogateescape'))
+                text = text[match.end():]
+            if text or not raw:
+                partial = False
+        if not raw:
+            if text:
+                yield offset, text
+            return
+        # the carried text has no place to cut
+        cut = cutting(text, carried)
+        text, carry = text[:cut], text[cut:]
+        if text:
+            yield offset, text
+            offset += len(text.encode('utf-8', 'surrogateescape'))
+
+
+def tokenizing(lines):
+    """
+    Split the pieces of text into tokens
+
+    Parameters
+    ----------
+    lines : iterable
+        an iterable of (byte offset, piece) tuples, like the ones of
+        `reading`
+
+    Yields
+    ------
+    tuple
+        the byte offset of every token, the piece, and the start and end
+        of the token in the piece
+    """
+    for offset, line in lines:
+        position, size = 0, offset
+        for match in TOKEN.finditer(line):
+            start, end = match.span()
+            size += len(line[position:start].encode('utf-8', 'surrogateescape'))
+            yield size, line, start, end
+            size += len(line[start:end].encode('utf-8', 'surrogateescape'))
+            position = end
+
+
+def tagging(tokens, analyzer):
+    """
+    Find the verb forms among the tokens
+
+    Consecutive tokens separated only by spaces or ZWNJ are joined, and the
+    longest sequence that is an inflected form wins.
+
+    Parameters
+    ----------
+    tokens : iterable
+        an iterable of tokens returned by `tokenizing`
+    analyzer : Analyzer
+        the index of verb forms
+
+    Yields
+    ------
+    dict
+        the byte offset, the form, and the analyses of every verb form
+    """
+    window = deque()
+    tokens = iter(tokens)
+    exhausted = False
+    while True:
+        # keep WIDTH tokens in the window
+        while not exhausted and len(window) < WIDTH:
+            try:
+                window.append(next(tokens))
+            except StopIteration:
+                exhausted = True
+        if not window:
+            return
+
+        offset, line, start, end = window[0]
+        width = 1
+        # the longest sequence of joined tokens that is in the index
+        for n in range(len(window), 0, -1):
+            last = window[n - 1]
+            if last[1] is not line:
+                continue
+            if all(set(line[window[i][3]:window[i + 1][2]]) <= JOINERS
+                   for i in range(n - 1)):
+                form = line[start:last[3]]
+                analyses = analyzer.analyze(form)
+                if analyses:
+                    width = n
+                    yield {'offset': offset, 'form': form,
+                           'analyses': analyses}
+                    break
+        for _ in range(width):
+            window.popleft()
+
+
+def tag(path, output=sys.stdout, offset=0, verbs=None, progress=None):
+    """
+    Stream a UTF-8 corpus and write a JSON line for every verb form
+
+    The corpus is read in chunks, so the memory does not depend on the size
+    of the file or the length of its lines.
+
+    Parameters
+    ----------
+    path : str or Path
+        the path of the corpus
+    output : text file, optional
+        the file that the JSON lines are written to
+    offset : int, optional
+        the byte offset to resume from, like the offset of the last verb
+        form written, which is then tagged again
+    verbs : iterable, optional
+        an iterable of words or (word, API_form) tuples of other verbs to
+        index besides the irregulars
+    progress : text file, optional
+        a file that the number of tokens, the byte offset, and the speed
+        are reported to every 100,000 tokens
+
+    Returns
+    -------
+    dict
+        the numbers of tokens and verb forms, the seconds, and the tokens
+        per second
+    """
+    analyzer = indexing(verbs)
+    stats = {'tokens': 0, 'verbs': 0}
+    start = timer()
+
+    def counting(tokens):
+        for token in tokens:
+            stats['tokens'] += 1
+            if progress is not None and stats['tokens'] % 100000 == 0:
+                progress.write(f"{stats['tokens']} tokens, offset {token[0]}, "
+                               f"{stats['tokens'] / (timer() - start):.0f} tokens/s\n")
+            yield token
+
+    with open(path, 'rb') as file:
+        tokens = counting(tokenizing(reading(file, offset)))
+        for record in tagging(tokens, analyzer):
+            stats['verbs'] += 1
+            output.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    stats['seconds'] = timer() - start
+    stats['tokens/s'] = stats['tokens'] / stats['seconds']
+    return stats
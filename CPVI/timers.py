@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+from timeit import default_timer as timer
+import threading
+
+
+class Timers():
+    """
+    Opt-in, process-wide cumulative timers of the stages of profiling
+
+    The stages check `enabled` before reading the clock, so disabled timers
+    cost a single attribute lookup per stage.
+
+    Stages
+    ------
+    load
+        parsing the data files
+    artifact
+        loading the precomputed paradigms and decoding a paradigm
+    lookup
+        looking a word up in the surface-form index of irregulars
+    regex
+        matching the word and the IPA form with the regular patterns
+    steming
+        deriving the stems of a formality and an alphabet
+    inflect
+        assembling a formality, alphabet, and polarity branch
+    profiling
+        a whole call to `CPVI.profiling`
+
+    Attributes
+    ----------
+    enabled : bool
+        if True, the stages are timed
+    """
+    def __init__(self) -> None:
+        self.enabled = False
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """
+        Start timing the stages
+        """
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stop timing the stages; the counters are kept
+        """
+        self.enabled = False
+
+    def reset(self):
+        """
+        Clear the counters
+        """
+        with self._lock:
+            self._stages.clear()
+
+    def add(self, stage, seconds):
+        """
+        Add a call to the counters of a stage
+
+        Parameters
+        ----------
+        stage : str
+            the name of the stage
+        seconds : float
+            the duration of the call
+        """
+        with self._lock:
+            counter = self._stages.get(stage)
+            if counter is None:
+                counter = self._stages[stage] = [0, 0.0]
+            counter[0] += 1
+            counter[1] += seconds
+
+    def since(self, stage, start):
+        """
+        Add a call that started at start (a `timer` reading) to a stage
+        """
+        self.add(stage, timer() - start)
+
+    def snapshot(self):
+        """
+        Get the counters of every stage
+
+        Returns
+        -------
+        dict
+            a dictionary mapping stages to dictionaries containing calls,
+            seconds, and mean seconds per call
+        """
+        with self._lock:
+            return {stage: {'calls': calls, 'seconds': seconds,
+                            'mean': seconds / calls}
+                    for stage, (calls, seconds) in self._stages.items()}
+
+
+# the timers shared by the whole process
+timers = Timers()
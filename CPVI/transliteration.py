@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+
+from .errors import custom_errors
+from .fuzzy import canonical
+from math import exp, log
+
+# the marks of the start and the end of a word, read as nothing
+START, END = '^', '$'
+
+# the longest chunk of letters, including the marks, kept in the table
+LONGEST = 4
+
+# the vowels, and the short ones that are not written in Persian alphabet
+VOWELS = 'ɒuiæeo'
+SHORT = 'æeo'
+
+# the readings of letters missing from CPVI.IPA, like the initial alef
+# that carries a glottal stop
+READINGS = {'ا': ['ʔ'], 'آ': ['ʔɒ'], 'و': ['o'], 'ه': ['e'], 'ئ': ['ʔ'],
+            'ء': ['ʔ'], 'أ': ['ʔ'], 'ؤ': ['ʔ'], 'إ': ['ʔ']}
+
+# the counts given to every reading of a letter, and to the reading
+# followed by a short vowel, before the stems are counted
+PRIOR = 0.5
+VOCALIZED = {'æ': 0.2, 'e': 0.1, 'o': 0.1}
+
+# the letter read either as a consonant or as a long vowel, and the log
+# probability lost by reading it as a consonant between two consonant
+# letters, where it is nearly always u or o, like in پوش
+GLIDE = 'و'
+MEDIAL = -3.0
+
+# the log probability lost by every two vowels or three consonants in a
+# row, which Persian syllables do not have
+PENALTY = -6.0
+
+# the number of readings of a chunk tried, at least
+WIDTH = 4
+
+# the log probability of a letter that has no reading
+UNKNOWN = -20.0
+
+# the costs of aligning a letter with its reading followed by a short
+# vowel, with nothing, or with an extra vowel after its reading; a letter is
+# never aligned with a consonant that is not its reading, so misspelled IPA
+# forms are not counted
+COSTS = {'vowel': 1, 'silent': 2, 'extra': 3}
+
+
+def letters(mapping):
+    """
+    Map Persian letters to their IPA readings
+
+    Parameters
+    ----------
+    mapping : dict
+        the IPA letters mapped to a Persian letter or a list of them, like
+        `CPVI.IPA`; names of diacritics are skipped
+
+    Returns
+    -------
+    dict
+        the Persian letters mapped to the lists of their IPA readings
+    """
+    readings = {}
+    for sound, persian in mapping.items():
+        for letter in [persian] if isinstance(persian, str) else persian:
+            # او is read as u, the other names are diacritics
+            if letter == 'او':
+                letter = 'و'
+            if len(letter) == 1:
+                readings.setdefault(letter, []).append(sound)
+    for letter, sounds in READINGS.items():
+        readings.setdefault(letter, []).extend(sounds)
+    return readings
+
+
+def stem_pairs(irregulars):
+    """
+    Pair the Persian stems and gerunds of irregulars with their IPA forms
+
+    Parameters
+    ----------
+    irregulars : dict
+        the irregular verbs keyed by their gerunds
+
+    Returns
+    -------
+    list
+        (Persian, IPA) tuples; ɟ is written as Ɉ, the letter of CPVI.IPA
+    """
+    pairs = []
+    for gerund, entry in irregulars.items():
+        for frmlty in ['formal', 'informal']:
+            for tense in ['past', 'present']:
+                persian = entry[f'{frmlty} Persian {tense} stem']
+                sound = entry[f'{frmlty} IPA {tense} stem']
+                if isinstance(persian, str):
+                    persian, sound = [persian], [sound]
+                pairs.extend(zip(persian, sound))
+        # the gerund is the first past stem followed by ن
+        persian = entry['formal Persian past stem']
+        sound = entry['formal IPA past stem']
+        if not isinstance(persian, str):
+            persian, sound = persian[0], sound[0]
+        if gerund == f'{persian}ن':
+            pairs.append((gerund, f'{sound}æn'))
+
+    checked = []
+    for persian, sound in pairs:
+        persian, sound = canonical(persian), sound.replace('ɟ', 'Ɉ')
+        if not persian or not sound:
+            continue
+        try:
+            custom_errors(sound)
+        except TypeError:
+            continue
+        checked.append((persian, sound))
+    return checked
+
+
+def effects(reading):
+    """
+    Count the syllables a reading breaks after every number of consonants
+
+    Parameters
+    ----------
+    reading : str
+        a string in IPA alphabet
+
+    Returns
+    -------
+    tuple
+        (breaks, consonants) pairs for a reading that comes after 0, 1, or
+        2 consonants, telling how many times two vowels or three consonants
+        come in a row and how many consonants the reading ends in
+    """
+    result = []
+    for run in range(3):
+        breaks = 0
+        for sound in reading:
+            if sound in VOWELS:
+                breaks += run == 0
+                run = 0
+            else:
+                breaks += run == 2
+                run = min(run + 1, 2)
+        result.append((breaks, run))
+    return tuple(result)
+
+
+def aligning(persian, sound, readings):
+    """
+    Split an IPA form into the sounds of every letter of its Persian form
+
+    Parameters
+    ----------
+    persian : str
+        the Persian form between the start and end marks
+    sound : str
+        the IPA form
+    readings : dict
+        the Persian letters mapped to the lists of their IPA readings
+
+    Returns
+    -------
+    list
+        the sounds of every letter, or None if they could not be aligned
+    """
+    size, length = len(persian), len(sound)
+    infinity = float('inf')
+    # costs[i][j] is the cost of reading the first i letters as sound[:j]
+    costs = [[infinity] * (length + 1) for _ in range(size + 1)]
+    back = [[None] * (length + 1) for _ in range(size + 1)]
+    costs[0][0] = 0
+
+    def relaxing(i, j, k, cost, step):
+        if cost < costs[i][k]:
+            costs[i][k], back[i][k] = cost, step
+
+    for i in range(size + 1):
+        for j in range(length + 1):
+            cost = costs[i][j]
+            if cost == infinity:
+                continue
+            # an extra vowel read with the previous letter
+            if 0 < i and j < length and sound[j] in VOWELS:
+                relaxing(i, j, j + 1, cost + COSTS['extra'], (i, j))
+            if i == size:
+                continue
+            letter = persian[i]
+            if letter in (START, END):
+                relaxing(i + 1, j, j, cost, (i, j))
+                continue
+            for reading in readings.get(letter, []):
+                if sound.startswith(reading, j):
+                    k = j + len(reading)
+                    relaxing(i + 1, j, k, cost, (i, j))
+                    if k < length and sound[k] in SHORT:
+                        relaxing(i + 1, j, k + 1, cost + COSTS['vowel'], (i, j))
+            relaxing(i + 1, j, j, cost + COSTS['silent'], (i, j))
+
+    if costs[size][length] == infinity:
+        return None
+    # walk back and give every letter the sounds read after it
+    sounds = [''] * size
+    i, k = size, length
+    while (i, k) != (0, 0):
+        previous, j = back[i][k]
+        sounds[i - 1] = sound[j:k] + sounds[i - 1]
+        i, k = previous, j
+    return sounds
+
+
+class Transliterator():
+    """
+    A longest-match table of Persian letters and their IPA readings used to
+    guess the IPA forms of verbs
+
+    The table is counted from the stems of irregulars aligned letter by
+    letter with their IPA forms. Every chunk of up to four letters,
+    including the start and end marks of a word, is mapped to the
+    probabilities of its readings, and a word is read as the most probable
+    sequence of chunks; readings with two vowels or three consonants in a
+    row, or with a و between two consonant letters read as a consonant,
+    are unlikely.
+
+    Attributes
+    ----------
+    table : dict
+        the chunks of letters mapped to tuples of (reading, log probability,
+        effects, glides), the most probable first, where glides are the
+        positions in the chunk of the و read as a consonant
+    longest : int
+        the number of letters in the longest chunk
+    consonants : set
+        the letters that are only read as consonants
+    """
+    def __init__(self, mapping, pairs) -> None:
+        """
+        Parameters
+        ----------
+        mapping : dict
+            the IPA letters mapped to a Persian letter or a list of them,
+            like `CPVI.IPA`
+        pairs : list
+            (Persian, IPA) tuples, like the ones of `stem_pairs`
+        """
+        readings = letters(mapping)
+        counts = {}
+        for letter, sounds in readings.items():
+            for sound in sounds:
+                counts.setdefault(letter, {})[sound] = PRIOR
+                if sound[-1] not in VOWELS:
+                    for vowel, count in VOCALIZED.items():
+                        counts[letter][sound + vowel] = count
+        for mark in (START, END):
+            counts[mark] = {'': PRIOR}
+        glides = {(letter, reading): (0,) if letter == GLIDE and
+                  reading[:1] not in VOWELS else ()
+                  for letter, options in counts.items() for reading in options}
+
+        for persian, sound in pairs:
+            persian = f'{START}{persian}{END}'
+            sounds = aligning(persian, sound, readings)
+            if sounds is None:
+                continue
+            for i in range(len(persian)):
+                for j in range(i + 1, min(i + LONGEST, len(persian)) + 1):
+                    chunk = persian[i:j]
+                    options = counts.setdefault(chunk, {})
+                    reading = ''.join(sounds[i:j])
+                    options[reading] = options.get(reading, 0) + 1
+                    glides.setdefault((chunk, reading), tuple(
+                        k - i for k in range(i, j) if persian[k] == GLIDE
+                        and sounds[k][:1] not in VOWELS))
+
+        self.table = {}
+        for chunk, options in counts.items():
+            total = sum(options.values())
+            self.table[chunk] = tuple(sorted(
+                ((reading, log(count / total), effects(reading),
+                  glides[chunk, reading])
+                 for reading, count in options.items()),
+                key=lambda option: -option[1]))
+        self.longest = max(map(len, self.table))
+        self.consonants = {letter for letter, sounds in readings.items()
+                           if all(sound[:1] not in VOWELS for sound in sounds)}
+
+    def _medial(self, word):
+        # the positions of the و between two consonant letters
+        if GLIDE not in word:
+            return ()
+        consonants = self.consonants
+        return {k for k in range(1, len(word) - 1) if word[k] == GLIDE
+                and word[k - 1] in consonants and word[k + 1] in consonants}
+
+    def candidates(self, word, n=3):
+        """
+        Read a word in the most probable ways
+
+        Parameters
+        ----------
+        word : str
+            a string in Persian alphabet
+        n : int, optional
+            the largest number of readings returned
+
+        Returns
+        -------
+        list
+            (IPA form, score) tuples, the most probable first; the scores
+            are the shares of the probabilities of the returned readings,
+            so a reading close to 1 is unambiguous
+        """
+        word = f'{START}{canonical(word)}{END}'
+        table, longest = self.table, self.longest
+        medial = self._medial(word)
+        size = len(word)
+        width = max(n, WIDTH)
+        # the n best (log probability, reading) pairs of every prefix, kept
+        # apart by the number of consonants the readings end in
+        beams = [{} for _ in range(size + 1)]
+        beams[0] = {1: [(0.0, '')]}
+        for i in range(size):
+            beam = beams[i]
+            if not beam:
+                continue
+            matched = False
+            for j in range(i + 1, min(i + longest, size) + 1):
+                options = table.get(word[i:j])
+                if options is None:
+                    continue
+                matched = True
+                following = beams[j]
+                for reading, probability, effects, glides in options[:width]:
+                    if medial and glides:
+                        probability += MEDIAL * sum(i + k in medial for k in glides)
+                    for run, pairs in beam.items():
+                        breaks, after = effects[run]
+                        score = probability + breaks * PENALTY
+                        following.setdefault(after, []).extend(
+                            (previous + score, prefix + reading)
+                            for previous, prefix in pairs)
+                for pairs in following.values():
+                    pairs.sort(key=lambda pair: -pair[0])
+                    del pairs[n:]
+            # letters that are not in the table are skipped
+            if not matched:
+                following = beams[i + 1]
+                for run, pairs in beam.items():
+                    following.setdefault(run, []).extend(
+                        (score + UNKNOWN, prefix) for score, prefix in pairs)
+
+        best = {}
+        for score, reading in sorted((pair for pairs in beams[size].values()
+                                      for pair in pairs), key=lambda pair: -pair[0]):
+            best.setdefault(reading, score)
+        best = dict(list(best.items())[:n])
+        if not best:
+            return []
+        top = max(best.values())
+        total = sum(exp(score - top) for score in best.values())
+        return [(reading, exp(score - top) / total)
+                for reading, score in best.items()]
+
+    def transliterate(self, word):
+        """
+        Read a word in the most probable way
+
+        Parameters
+        ----------
+        word : str
+            a string in Persian alphabet
+
+        Returns
+        -------
+        str
+            the IPA form of the word, or an empty string if the word has
+            no letters in the table
+        """
+        # the best reading of every prefix for every number of consonants
+        # it ends in, as in candidates with n=1 but without the sorting
+        word = f'{START}{canonical(word)}{END}'
+        table, longest = self.table, self.longest
+        medial = self._medial(word)
+        size = len(word)
+        beams = [{} for _ in range(size + 1)]
+        beams[0] = {1: (0.0, '')}
+        for i in range(size):
+            beam = beams[i]
+            if not beam:
+                continue
+            matched = False
+            for j in range(i + 1, min(i + longest, size) + 1):
+                options = table.get(word[i:j])
+                if options is None:
+                    continue
+                matched = True
+                following = beams[j]
+                for reading, probability, effects, glides in options[:WIDTH]:
+                    if medial and glides:
+                        probability += MEDIAL * sum(i + k in medial for k in glides)
+                    for run, (previous, prefix) in beam.items():
+                        breaks, after = effects[run]
+                        score = previous + probability + breaks * PENALTY
+                        best = following.get(after)
+                        if best is None or score > best[0]:
+                            following[after] = (score, prefix + reading)
+            if not matched:
+                following = beams[i + 1]
+                for run, (previous, prefix) in beam.items():
+                    best = following.get(run)
+                    if best is None or previous + UNKNOWN > best[0]:
+                        following[run] = (previous + UNKNOWN, prefix)
+        if not beams[size]:
+            return ''
+        return max(beams[size].values(), key=lambda pair: pair[0])[1]
+
+    def transliterate_many(self, words):
+        """
+        Read every word in the most probable way, reading duplicates once
+
+        Parameters
+        ----------
+        words : iterable
+            strings in Persian alphabet
+
+        Returns
+        -------
+        list
+            the IPA forms of the words, in the order of words
+        """
+        forms = {}
+        result = []
+        for word in words:
+            form = forms.get(word)
+            if form is None:
+                form = forms[word] = self.transliterate(word)
+            result.append(form)
+        return result
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+from .build import SPACES, encoding, replacing, writing
+from .fuzzy import finding
+from .lexicon import lexicon, thaw, ARTIFACT
+from .utils import AUXILIARIES
+from timeit import default_timer as timer
+import argparse
+import gzip
+import json
+
+
+def spans(text):
+    """
+    Find the entries of the top-level object of a JSON text
+
+    Parameters
+    ----------
+    text : str
+        the JSON text of an object
+
+    Returns
+    -------
+    list
+        the (key, start, end) tuples of the entries, where the text of an
+        entry, from its key to the end of its value, is text[start:end]
+    """
+    decoder = json.JSONDecoder()
+    whitespace = ' \t\n\r'
+    result = []
+    position = text.index('{') + 1
+    while True:
+        while text[position] in whitespace + ',':
+            position += 1
+        if text[position] == '}':
+            return result
+        start = position
+        key, position = decoder.raw_decode(text, position)
+        while text[position] in whitespace + ':':
+            position += 1
+        _, position = decoder.raw_decode(text, position)
+        result.append((key, start, position))
+
+
+def splicing(text, new):
+    """
+    Write the entries of a JSON object into its text, keeping the text of
+    the unchanged entries
+
+    Parameters
+    ----------
+    text : str
+        the JSON text of the old object
+    new : dict
+        the new object; the entries that are in the old object keep their
+        places, and the other entries follow them
+
+    Returns
+    -------
+    str
+        the JSON text of the new object
+    """
+    old = json.loads(text)
+    entries = spans(text)
+    places = {key: (start, end) for key, start, end in entries}
+    # the new entries are indented and separated like the first ones
+    first = entries[0][1]
+    indent = first - text.rindex('\n', 0, first) - 1
+    separator = text[entries[0][2]:entries[1][1]] if len(entries) > 1 else ',\n' + ' ' * indent
+
+    parts = []
+    for key, props in new.items():
+        if key in places and old[key] == props:
+            parts.append(text[slice(*places[key])])
+            continue
+        value = json.dumps(props, ensure_ascii=False, indent=2)
+        value = value.replace('\n', '\n' + ' ' * indent)
+        parts.append(f'{json.dumps(key, ensure_ascii=False)}: {value}')
+    return text[:first] + separator.join(parts) + text[entries[-1][2]:]
+
+
+def depending(old, new):
+    """
+    Find the auxiliaries whose paradigms differ between two lexicons
+
+    `auxiliary` takes the auxiliaries of every verb from the paradigms of
+    بودن, داشتن, and خواستن, so a change to one of them changes every
+    paradigm; a change to any other part of an entry changes only the
+    paradigm of that entry.
+
+    Parameters
+    ----------
+    old, new : dict
+        the irregulars before and after the changes
+
+    Returns
+    -------
+    list
+        the auxiliaries whose paradigms changed
+    """
+    return [entry for entry in AUXILIARIES
+            if (old.get(entry) or {}).get('paradigm') !=
+            (new.get(entry) or {}).get('paradigm')]
+
+
+def resolving(word, index, normalized):
+    # the entry that profiling serves the word from, or None
+    return index.get(word) or finding(word, normalized)
+
+
+def loading(version):
+    # the encoded paradigms of the artifact if it was built from the data
+    # files of the version, and None otherwise
+    try:
+        with gzip.open(lexicon.path / ARTIFACT, 'rb') as file:
+            artifact = json.load(file)
+    except (OSError, EOFError, ValueError):
+        return None
+    if artifact.get('version') != version:
+        return None
+    return artifact['paradigms']
+
+
+def update(changes, caches=()):
+    """
+    Apply a change set to the irregulars and rebuild only the paradigms that
+    depend on the changed entries
+
+    irregulars.json is rewritten with the changes, the precomputed
+    paradigms of the changed entries are inflected again, and the other
+    paradigms are copied from the artifact. If the paradigm of an auxiliary
+    changes, or the artifact was not built from the current data files,
+    every paradigm is inflected again. The profiles of the changed entries
+    are removed from the caches.
+
+    Parameters
+    ----------
+    changes : dict
+        the gerunds mapped to their new properties, as they are in
+        irregulars.json, or to None to remove the entry
+    caches : iterable, optional
+        the `LRUCache` objects of `CPVI` instances whose stale profiles
+        should be removed
+
+    Returns
+    -------
+    dict
+        the report of the rebuild: the changed, added, and removed entries,
+        the auxiliaries whose paradigms changed, whether every paradigm was
+        rebuilt, the numbers of rebuilt and reused paradigms, the number of
+        profiles removed from the caches, the new version, and the seconds
+        taken
+
+    Raises
+    ------
+    ValueError
+        if the properties of an entry do not have the keys of the other
+        entries
+    """
+    start = timer()
+    old = thaw(lexicon.irregulars)
+    keys = set(next(iter(old.values())))
+    old_index, old_normalized = lexicon.index, lexicon.normalized
+    paradigms = loading(lexicon.version)
+
+    new = dict(old)
+    for entry, props in changes.items():
+        if props is None:
+            new.pop(entry, None)
+        elif set(props) != keys:
+            raise ValueError(f'''The properties of "{entry}" should have these keys:
+            {", ".join(sorted(keys))}''')
+        else:
+            new[entry] = props
+
+    added = [entry for entry in new if entry not in old]
+    removed = [entry for entry in old if entry not in new]
+    changed = [entry for entry in new if entry in old and new[entry] != old[entry]]
+    auxiliaries = depending(old, new)
+
+    # only the changed entries are rewritten, and the file is replaced at
+    # once so that a crash could not leave it truncated
+    path = lexicon.path / 'irregulars.json'
+    text = splicing(path.read_text(encoding='utf-8'), new)
+    replacing(path, text.encode('utf-8'))
+    lexicon.reload()
+
+    full = paradigms is None or bool(auxiliaries)
+    stale = set(new) if full else set(added + changed)
+    if full:
+        paradigms = {space: {} for space in SPACES}
+    for space in SPACES:
+        for entry in removed:
+            paradigms[space].pop(entry, None)
+        for entry, props in lexicon.irregulars.items():
+            if entry in stale:
+                paradigms[space][entry] = encoding(props, space)
+        # keep the order of the entries in the file
+        paradigms[space] = {entry: paradigms[space][entry]
+                            for entry in lexicon.irregulars}
+    version = lexicon.version
+    # compressing takes longer than inflecting a few entries, so the
+    # artifact is compressed less than by build
+    writing(paradigms, version, lexicon.path / ARTIFACT, 6)
+    lexicon.reload()
+
+    # a cached profile is stale if its word belongs to an entry that is
+    # rebuilt or removed, or to another entry after the changes
+    index, normalized = lexicon.index, lexicon.normalized
+    dropped = stale | set(removed)
+
+    def expired(key):
+        if full:
+            return True
+        before = resolving(key[0], old_index, old_normalized)
+        after = resolving(key[0], index, normalized)
+        return before != after or before in dropped
+
+    evicted = sum(cache.discard(expired) for cache in caches)
+    return {'changed': changed, 'added': added, 'removed': removed,
+            'auxiliaries': auxiliaries, 'full': full,
+            'rebuilt': len(stale) * len(SPACES),
+            'reused': (len(new) - len(stale)) * len(SPACES),
+            'evicted': evicted, 'version': version,
+            'seconds': timer() - start}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Apply a change set to the irregulars and rebuild the '
+                    'paradigms that depend on it')
+    parser.add_argument('changes', help='a JSON file mapping gerunds to their '
+                        'new properties, or to null to remove them')
+    args = parser.parse_args()
+    with open(args.changes, 'r', encoding='utf-8') as file:
+        print(update(json.load(file)))
@@ -1,8 +1,48 @@
 #!/usr/bin/env python3
 
 from itertools import product
-from pathlib import Path
-import json
+from .lexicon import lexicon
+import threading
+
+# the keys of person and number
+PERSONS = ['s1', 's2', 's3', 'p1', 'p2', 'p3']
+
+# the irregulars that every verb takes its auxiliaries from (see auxiliary)
+AUXILIARIES = ['بودن', 'داشتن', 'خواستن']
+
+def combine(args, key, form=None):
+    """
+    Concatenate the strings with the values of the key in the dictionaries
+
+    Parameters
+    ----------
+    args : tuple of str and dict
+        (a) string(s) or dictionar(ies)
+    key : str
+        the person and number key of the dictionaries
+    form : str, optional
+        the format string of args, if it is already made
+
+    Returns
+    -------
+    str or list
+        the concatenated form, or a list of them if any value is a list
+    """
+    if form is None:
+        # make a string by replacing every dictionary with curly bracket
+        form = ''.join(i if isinstance(i, str) else '{}' for i in args)
+
+    # enclose every value of dictionary in args with bracket
+    lst = []
+    for arg in args:
+        if isinstance(arg, dict) and key in arg:
+            if isinstance(arg[key], list):
+                lst.append(arg[key])
+            lst.append([arg[key]])
+
+    # fill with every items
+    l = [form.format(*element) for element in product(*lst)]
+    return l[0] if len(l) == 1 else l
 
 def concatenate(*args):
     """
@@ -18,28 +58,201 @@ def concatenate(*args):
     dict
         a nested dictionary containing concatenated forms of args
     """
-    paradigm = {'s1': '', 's2': '', 's3': '',
-                'p1': '', 'p2': '', 'p3': ''}
     # make a string by replacing every dictionary with curly bracket
     form = ''.join(i if isinstance(i, str) else '{}' for i in args)
+    return {key: combine(args, key, form) for key in PERSONS}
+
+class Template():
+    """
+    A concatenation of strings and dictionaries compiled once and filled
+    with the stems of every verb
+
+    The template gives the same forms as `concatenate` called with the
+    parts, where every None part is replaced by a value passed on call.
 
-    # enclose every value of dictionary in args with bracket and
-    # add it to the paradigm
-    for key in paradigm:
-        lst = []
+    Attributes
+    ----------
+    parts : tuple
+        the strings and dictionaries of the template, and None for every
+        part that is filled on call
+    slots : list
+        the positions of the None parts
+    formats : dict or None
+        the format strings of every person, used when the template has at
+        most one dictionary and is filled with strings
+    """
+    __slots__ = ['parts', 'slots', 'formats']
+
+    def __init__(self, *parts) -> None:
+        self.parts = parts
+        self.slots = [i for i, part in enumerate(parts) if part is None]
+        dicts = [part for part in parts if isinstance(part, dict)]
+        self.formats = None
+        if len(dicts) > 1:
+            return
+
+        # make a format string for every value of the dictionary, so that
+        # filling the template is a single format call per form
+        self.formats = {}
+        for key in PERSONS:
+            if dicts and key not in dicts[0]:
+                self.formats[key] = None
+                continue
+            value = dicts[0][key] if dicts else ''
+            variants = value if isinstance(value, list) else [value]
+            self.formats[key] = [''.join(
+                '{}' if part is None else escape(
+                    part if isinstance(part, str) else variant)
+                for part in parts) for variant in variants]
+
+    def __call__(self, *values):
+        """
+        Fill the template
+
+        Parameters
+        ----------
+        *values : str, dict
+            the values of the None parts, in order
+
+        Returns
+        -------
+        dict
+            a dictionary containing the concatenated forms of every person
+        """
+        formats = self.formats
+        if formats is None or not all(
+                value.__class__ is str for value in values):
+            return {key: self._combine(values, key) for key in PERSONS}
+
+        paradigm = {}
+        for key in PERSONS:
+            forms = formats[key]
+            if forms is None:
+                paradigm[key] = self._combine(values, key)
+            elif len(forms) == 1:
+                paradigm[key] = forms[0].format(*values)
+            else:
+                paradigm[key] = [form.format(*values) for form in forms]
+        return paradigm
+
+    def _combine(self, values, key):
+        # fill the template like concatenate, joining the parts directly
+        # unless a value of the key is a list
+        args = list(self.parts)
+        for i, value in zip(self.slots, values):
+            args[i] = value
+        strings = []
         for arg in args:
-            if isinstance(arg, dict) and key in arg:
-                if isinstance(arg[key], list):
-                    lst.append(arg[key])
-                lst.append([arg[key]])
-        paradigm[key] = lst
+            if not isinstance(arg, dict):
+                strings.append(arg)
+            elif isinstance(arg.get(key), str):
+                strings.append(arg[key])
+            else:
+                return combine(args, key)
+        return ''.join(strings)
 
-    # fill with every items in paradigm
-    for key, val in paradigm.items():
-        l = [form.format(*element) for element in product(*val)]
-        paradigm[key] = l[0] if len(l) == 1 else l
+def escape(string):
+    """
+    Escape the curly brackets of a string used in a format string
+    """
+    return string.replace('{', '{{').replace('}', '}}')
+
+class LazyDict(dict):
+    """
+    A dictionary that computes the value of a key the first time it is read
 
-    return paradigm
+    The keys keep their order and every way of reading the values (indexing,
+    get, values, items, copying, merging, popping, comparing, and printing)
+    computes them first. A value is computed once even if several threads
+    read it at once.
+    """
+    class _Pending():
+        def __init__(self, factory):
+            self.factory = factory
+
+    def __init__(self, factories):
+        """
+        Parameters
+        ----------
+        factories : dict
+            a dictionary mapping keys to functions that compute their values
+        """
+        super().__init__((key, self._Pending(val))
+                         for key, val in factories.items())
+        # reentrant, in case a factory reads another key of the dictionary
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if isinstance(value, self._Pending):
+            with self._lock:
+                value = dict.__getitem__(self, key)
+                if isinstance(value, self._Pending):
+                    value = value.factory()
+                    dict.__setitem__(self, key, value)
+        return value
+
+    def __iter__(self):
+        # overriding __iter__ makes dict(), {**...}, and update read the
+        # values with __getitem__ instead of copying the internal table
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def copy(self):
+        return dict(self.items())
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        key = next(reversed(dict.keys(self)), None)
+        if key is None:
+            raise KeyError('popitem(): dictionary is empty')
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = dict(other)
+        merged.update(self.items())
+        return merged
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
 
 def prefix(neg, IPA):
     """
@@ -78,12 +291,7 @@ def conj(frm, alph):
     list of dicts
         a list of dictionaries containing appropriate conjugations
     """
-
-    dir_path = Path(__file__).parents[0]
-    path = f'{dir_path}/data/conjugations.json'
-
-    with open(path, 'r', encoding='utf-8') as file:
-        conjugations = json.load(file)['subjective']
+    conjugations = lexicon.conjugations['subjective']
 
     # retrieve conjugations
     past = conjugations[frm][alph]['past']
@@ -92,6 +300,55 @@ def conj(frm, alph):
     imperative = conjugations[frm][alph]['imperative']
     return [past, present, perfect, imperative]
 
+def clitics(frm, alph):
+    """
+    Retrieve appropriate object clitics
+
+    Parameters
+    ----------
+    frm : str
+        A string used to determine the formality
+    alph : str
+        A string used to determine the type of alphabet
+
+    Returns
+    -------
+    dict
+        a dictionary mapping person and number keys to object clitics
+    """
+    return lexicon.conjugations['objective'][frm][alph]
+
+def attaching(form, clitic, space):
+    """
+    Attach an object clitic to an inflected form
+
+    Parameters
+    ----------
+    form : str or list
+        An inflected form or a list of alternative forms
+    clitic : str
+        An object clitic
+    space : str
+        The space put between a silent h and the clitic
+
+    Returns
+    -------
+    str or list
+        The form with the clitic, or a list of them
+    """
+    if isinstance(form, list):
+        return [attaching(f, clitic, space) for f in form]
+    if form.endswith('ه'):
+        # singular clitics take an alef after a silent h, like گفته‌اش
+        return f'{form}{space}{"ا" if len(clitic) == 1 else ""}{clitic}'
+    elif form[-1:] in ['ا', 'و', 'آ']:
+        return f'{form}ی{clitic}'
+    elif form[-1:] in ['ɒ', 'u', 'o', 'i']:
+        return f'{form}j{clitic}'
+    elif form[-1:] in ['e', 'æ']:
+        return f'{form}ʔ{clitic}'
+    return f'{form}{clitic}'
+
 def auxiliary(frm, alph):
     """
     Retrieve appropriate auxiliaries
@@ -108,12 +365,7 @@ def auxiliary(frm, alph):
     list
         a list of auxiliaries
     """
-    dir_path = Path(__file__).parents[0]
-    path = f'{dir_path}/data/irregulars.json'
-
-    # load irregulars and conjugations files
-    with open(path, 'r', encoding='utf-8') as file:
-        data = json.load(file)
+    data = lexicon.irregulars
     # retrieve past perfect auxiliary
     prf_aux = data['بودن']['paradigm'][frm][alph]['affirmative']['past']['simple']
     # retrieve past subjunctive auxiliary
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Compare the analyzer index with generating and searching paradigms
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import random
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.analyzer import Analyzer, walk
+from CPVI.lexicon import lexicon
+
+
+if __name__ == '__main__':
+    start = timer()
+    analyzer = Analyzer()
+    print(f'build:       {timer() - start:8.2f} s, {len(analyzer)} forms')
+
+    tokens = random.Random(0).choices(list(analyzer.forms), k=20000)
+    start = timer()
+    for token in tokens:
+        analyzer.analyze(token)
+    print(f'index:       {len(tokens) / (timer() - start):8.0f} tokens/s')
+
+    # brute force: profile every irregular and search its paradigm
+    p = CPVI()
+    sample = tokens[:5]
+    start = timer()
+    for token in sample:
+        for entry in lexicon.irregulars:
+            for path, form in walk(p.profiling(entry)['paradigm']):
+                if form == token:
+                    break
+    print(f'brute force: {len(sample) / (timer() - start):8.2f} tokens/s')
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Compare profiling irregulars from the precomputed artifact with inflecting
+them on every call
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.lexicon import lexicon
+
+
+def run(repeat):
+    p = CPVI()
+    start = timer()
+    for _ in range(repeat):
+        for entry in lexicon.irregulars:
+            p.profiling(entry)
+    return repeat * len(lexicon.irregulars) / (timer() - start)
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    start = timer()
+    lexicon.paradigm('گفتن', '\u200c')
+    print(f'artifact load:  {1000 * (timer() - start):8.1f} ms')
+    print(f'artifact:       {run(repeat):8.1f} profiles/s')
+    # an empty artifact makes profiling inflect the irregulars
+    lexicon._artifact = {}
+    print(f'inflecting:     {run(repeat):8.1f} profiles/s')
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Compare the JSON and SQLite backends with a lexicon of made-up compound
+verbs: the time to open the lexicon, the latency of finding an entry and
+reading its properties, and the memory of the process
+
+    python benchmarks/bench_backends.py 100000
+
+Every backend is measured in its own process, so the memory is the growth
+of the resident size of a process that opened only that backend.
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import json
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.backends import JSONBackend, SQLiteBackend
+from CPVI.lexicon import lexicon, surface_forms, thaw
+
+# the letters of the made-up first parts of the compound verbs
+LETTERS = 'ابپتسشکگلمنرزدو'
+
+
+def prefixing(props, prefix):
+    # put the first part before every Persian stem of the entry
+    props = thaw(props)
+    for key, value in props.items():
+        if 'Persian' not in key or 'stem' not in key:
+            continue
+        if isinstance(value, str):
+            props[key] = f'{prefix} {value}' if value else value
+        else:
+            props[key] = [f'{prefix} {stem}' if stem else stem for stem in value]
+    return props
+
+
+def compounds(size):
+    # entries inflected from their stems, without precomputed paradigms
+    templates = [(gerund, props) for gerund, props in lexicon.irregulars.items()
+                 if not props['paradigm']]
+    entries = {}
+    n = 0
+    while len(entries) < size:
+        number, prefix = n // len(templates), ''
+        while True:
+            number, letter = divmod(number, len(LETTERS))
+            prefix += LETTERS[letter]
+            if not number:
+                break
+        gerund, props = templates[n % len(templates)]
+        entries[f'{prefix} {gerund}'] = prefixing(props, prefix)
+        n += 1
+    return entries
+
+
+def resident():
+    # the resident size of the process in MiB; the peak size where
+    # /proc is missing
+    try:
+        pages = int(Path('/proc/self/statm').read_text().split()[1])
+        return pages * resource.getpagesize() / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measuring(backend, words):
+    # the microseconds of finding and reading every word
+    latencies = []
+    for word in words:
+        start = timer()
+        entry = backend.find(word)
+        if entry is not None:
+            backend.get(entry)
+        latencies.append((timer() - start) * 1e6)
+    latencies.sort()
+    return {'median': latencies[len(latencies) // 2],
+            'p99': latencies[int(len(latencies) * 0.99)]}
+
+
+def child(kind, folder):
+    # measure one backend in this process
+    folder = Path(folder)
+    words = json.loads((folder / 'words.json').read_text(encoding='utf-8'))
+    before = resident()
+    start = timer()
+    if kind == 'json':
+        lexicon.path = folder / 'data'
+        lexicon.reload()
+        lexicon.index, lexicon.normalized
+        backend = JSONBackend()
+    else:
+        backend = SQLiteBackend(folder / 'verbs.db')
+    opened = timer() - start
+    latency = measuring(backend, words)
+    p = CPVI(backend=backend)
+    start = timer()
+    for word in words[:200]:
+        p.profiling(word)
+    profiling = (timer() - start) / 200 * 1e3
+    after = resident()
+    print(json.dumps({'open': opened, 'latency': latency,
+                      'profiling': profiling, 'memory': after - before}))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3])
+        sys.exit()
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        entries = compounds(size)
+        irregulars = dict(thaw(lexicon.irregulars), **entries)
+
+        shutil.copytree(lexicon.path, folder / 'data')
+        with open(folder / 'data' / 'irregulars.json', 'w', encoding='utf-8') as file:
+            json.dump(irregulars, file, ensure_ascii=False, indent=2)
+
+        start = timer()
+        SQLiteBackend(folder / 'verbs.db').upsert(irregulars, paradigms=False)
+        stored = timer() - start
+
+        # found forms, spelling variants, and missing words
+        generator = random.Random(0)
+        forms = [form for gerund in generator.sample(list(irregulars), 5000)
+                 for _, form in surface_forms(gerund, irregulars[gerund]) if form]
+        words = generator.sample(forms, 5000)
+        words += [f'می{word}' for word in words[:1000]]
+        words += [word.replace('ی', 'ي') for word in words[:1000]]
+        words += [f'{word}ش' for word in words[:1000]]
+        generator.shuffle(words)
+        (folder / 'words.json').write_text(json.dumps(words, ensure_ascii=False),
+                                           encoding='utf-8')
+
+        size = len(irregulars)
+        print(f'{size} entries, {len(words)} lookups, '
+              f'SQLite database written in {stored:.1f} s '
+              f'({(folder / "verbs.db").stat().st_size / 2 ** 20:.0f} MiB)')
+        for kind in ['json', 'sqlite']:
+            output = subprocess.run(
+                [sys.executable, __file__, '--child', kind, str(folder)],
+                capture_output=True, text=True, check=True).stdout
+            result = json.loads(output)
+            print(f'{kind:6} open {result["open"]:7.3f} s  '
+                  f'find and get {result["latency"]["median"]:7.1f} us median, '
+                  f'{result["latency"]["p99"]:7.1f} us p99  '
+                  f'profiling {result["profiling"]:6.2f} ms  '
+                  f'memory {result["memory"]:7.1f} MiB')
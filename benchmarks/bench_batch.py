@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Compare profile_many with calling profiling in a loop on a token batch
+
+The loop is timed on a sample of the batch and extrapolated to its size.
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from bench_cache import workload
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    words = workload(size)
+    p = CPVI()
+
+    sample = words[:2000]
+    start = timer()
+    for word in sample:
+        p.profiling(word)
+    loop = (timer() - start) * size / len(sample)
+
+    report = {}
+    start = timer()
+    for profile in p.profile_many(words, report=report):
+        pass
+    batch = timer() - start
+
+    print(f'profiling loop: {loop:8.2f} s (extrapolated from {len(sample)})')
+    print(f'profile_many:   {batch:8.2f} s ({loop / batch:.1f}x)')
+    print({route: len(keys) for route, keys in report.items()})
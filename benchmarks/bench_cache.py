@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Measure profiling with and without the LRU cache on a Zipfian workload
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import random
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.lexicon import lexicon
+
+
+def workload(size, seed=0):
+    # irregular gerunds plus made-up regular stems, drawn with Zipf weights
+    words = list(lexicon.irregulars) + [f'{w}{c}' for w in ['چرخ', 'پوش', 'ترس']
+                                        for c in 'بپتسشلمن']
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    return random.Random(seed).choices(words, weights, k=size)
+
+
+def run(words, cache_size):
+    p = CPVI(cache_size)
+    start = timer()
+    for word in words:
+        p.profiling(word)
+    return len(words) / (timer() - start), p.cache
+
+
+if __name__ == '__main__':
+    words = workload(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
+    rate, _ = run(words, 0)
+    print(f'no cache:        {rate:8.1f} profiles/s')
+    for size in [16, 128]:
+        rate, cache = run(words, size)
+        print(f'cache size {size:<4} {rate:8.1f} profiles/s {cache.info()}')
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Time profiling regular verbs and split the time between the verb-specific
+work and the per-call overhead
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import cProfile
+import pstats
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+
+WORDS = [('چرخ', 'ʧærx'), ('پوش', 'puʃ'), ('رساندن', 'resɒndæn'),
+         ('ترس', 'tærs'), ('خند', 'xænd')]
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    p = CPVI()
+    p.profiling(*WORDS[0])
+    start = timer()
+    for _ in range(repeat):
+        for word, ipa in WORDS:
+            p.profiling(word, ipa)
+    elapsed = timer() - start
+    print(f'profiling: {1000 * elapsed / repeat / len(WORDS):8.3f} ms/verb')
+
+    # the functions that take most of a call
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for word, ipa in WORDS * 10:
+        p.profiling(word, ipa)
+    profiler.disable()
+    pstats.Stats(profiler).sort_stats('tottime').print_stats(8)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Compare deriving the stems of a large list of candidate verbs at once with
+derive_many against deriving them word by word, and check that both give
+the same properties
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import random
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+
+# made-up Persian words and IPA forms, some of them alternative
+LETTERS = 'ابپتسشکگلمنرزدو'
+SOUNDS = 'bptsʃcɈlmnrzdvæeoɒui'
+
+
+def candidates(size, seed=0):
+    generator = random.Random(seed)
+    items = []
+    for _ in range(size):
+        word = ''.join(generator.choices(LETTERS, k=generator.randint(2, 6)))
+        sound = ''.join(generator.choices(SOUNDS, k=generator.randint(2, 7)))
+        if generator.random() < 0.3:
+            word, sound = f'{word}اندن', f'{sound}ɒndæn'
+        items.append((word, sound))
+    return items
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    items = candidates(size)
+    p = CPVI()
+
+    start = timer()
+    single = []
+    for word, API_form in items:
+        profile = p.profiling(word, API_form, lazy=True)
+        profile['paradigm'] = ''
+        single.append(profile)
+    profiled = timer() - start
+
+    start = timer()
+    singletons = [p.derive_many([item])[0] for item in items]
+    one = timer() - start
+
+    start = timer()
+    batch = p.derive_many(items)
+    many = timer() - start
+
+    print(f'{size} candidates, same properties: {single == batch == singletons}')
+    print(f'profiling(lazy=True): {size / profiled:10.0f} words/s')
+    print(f'derive_many per word: {size / one:10.0f} words/s')
+    print(f'derive_many:          {size / many:10.0f} words/s')
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Compare exporting rows from the paradigm assembly with walking the nested
+dictionaries of profiling, for the irregulars and a large regular list
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import io
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.analyzer import lemma, walk
+from CPVI.export import export, exporting
+from CPVI.lexicon import lexicon
+
+# made-up regular stems
+REGULARS = [f'{a}{b}{c}' for a in 'بپتسشکگلمن' for b in 'ارزسشلمن'
+            for c in 'بپتخدرزسشکگلمن']
+
+
+def walking(items):
+    # the rows made by walking the paradigms returned by profiling
+    p = CPVI()
+    for word in items:
+        profile = p.profiling(word)
+        gerund = lexicon.index.get(word) or lemma(profile)
+        for path, form in walk(profile['paradigm']):
+            yield (gerund,) + path + (form,)
+
+
+def rate(rows):
+    start = timer()
+    count = sum(1 for _ in rows)
+    return count, count / (timer() - start)
+
+
+if __name__ == '__main__':
+    sets = {'irregulars': list(lexicon.irregulars), 'regulars': REGULARS}
+    for name, items in sets.items():
+        count, walked = rate(walking(items))
+        _, exported = rate(exporting(items))
+        print(f'{name:10} {len(items):5d} verbs {count:8d} rows  '
+              f'walk {walked:9.0f} rows/s  export {exported:9.0f} rows/s')
+
+    for fmt in ['csv', 'tsv', 'jsonl']:
+        start = timer()
+        count = export(REGULARS, io.StringIO(), fmt)
+        print(f'{fmt:10} {count / (timer() - start):9.0f} rows/s written')
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Compare the compiled transducer with inflector for generation, and with
+profiling and walking the paradigm of an unseen verb for analysis
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.analyzer import walk
+from CPVI.fst import Compiled
+from CPVI.inflection import inflector
+from CPVI.lexicon import lexicon, thaw
+
+# made-up regular verbs
+REGULARS = [f'{a}{b}{c}' for a in 'بپتسشکگلمن' for b in 'ارزسشلمن'
+            for c in 'بپتخدرزسشکگلمن'][:200]
+
+
+if __name__ == '__main__':
+    start = timer()
+    compiled = Compiled()
+    print(f'compile:  {timer() - start:8.3f} s, {len(compiled)} states')
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / 'rules.fst.gz'
+        compiled.save(path)
+        size = os.path.getsize(path)
+        start = timer()
+        Compiled.load(path)
+        print(f'load:     {timer() - start:8.3f} s, {size / 1024:.1f} KiB on disk')
+
+    profiles = []
+    for props in lexicon.irregulars.values():
+        profile = thaw(props)
+        if not profile['paradigm']:
+            profiles.append(profile)
+
+    start = timer()
+    for profile in profiles:
+        inflector(dict(profile), '\u200c')
+    inflected = timer() - start
+    start = timer()
+    for profile in profiles:
+        compiled.paradigm(profile)
+    generated = timer() - start
+    print(f'paradigm: inflector {len(profiles) / inflected:8.0f} verbs/s  '
+          f'transducer {len(profiles) / generated:8.0f} verbs/s')
+
+    # a single cell does not need the rest of the paradigm
+    start = timer()
+    for _ in range(10000):
+        compiled.generate('آور', 'formal', 'Persian', 'negative', 'past',
+                          'continuous', 'p3')
+    print(f'cell:     inflector {len(profiles) / inflected:8.0f} cells/s  '
+          f'transducer {10000 / (timer() - start):8.0f} cells/s')
+
+    # analyze forms of verbs that are not in any index: the transducer
+    # against profiling a candidate verb and searching its paradigm
+    p = CPVI()
+    forms = []
+    for word in REGULARS:
+        forms += [form for _, form in walk(p.profiling(word)['paradigm'])]
+    sample = random.Random(0).sample(forms, 2000)
+    start = timer()
+    for form in sample:
+        compiled.analyze(form)
+    analyzed = timer() - start
+
+    words = random.Random(0).choices(REGULARS, k=50)
+    start = timer()
+    for word in words:
+        paradigm = p.profiling(word)['paradigm']
+        for _, form in walk(paradigm):
+            pass
+    searched = timer() - start
+    print(f'analysis: transducer {len(sample) / analyzed:8.0f} forms/s  '
+          f'profile and walk {len(words) / searched:8.0f} candidates/s')
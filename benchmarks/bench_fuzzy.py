@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Time the normalized and fuzzy lookups of irregulars against comparing a
+token with every indexed form, and check that the spelling variants of
+every form are found
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import random
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.fuzzy import Neighborhood, canonical, editing
+from CPVI.lexicon import lexicon
+
+# Persian letters used to make misspellings and a large vocabulary
+LETTERS = 'ابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی'
+
+
+def variants(form):
+    # the spellings of a form found in real text
+    arabic = form.replace('ی', 'ي').replace('ک', 'ك')
+    return [arabic, f'می\u200c{form}', f'می {form}', f'مي{arabic}',
+            f'نمی{form}']
+
+
+def misspelling(form, random):
+    n = random.randrange(len(form))
+    return form[:n] + random.choice(LETTERS) + form[n + 1:]
+
+
+def rate(function, tokens):
+    start = timer()
+    for token in tokens:
+        function(token)
+    return len(tokens) / (timer() - start)
+
+
+if __name__ == '__main__':
+    p = CPVI()
+    index = lexicon.index
+    forms = [form for form in index if form]
+    # forms that are the same without their diacritics, or with می, like
+    # میر, are found as the first entry of the file
+    missed = [variant for form in forms for variant in variants(form)
+              if p.lookup(variant) != index[form]]
+    print(f'variants: {len(forms) * 5 - len(missed)} of {len(forms) * 5} '
+          f'found as the entry of the form')
+
+    generator = random.Random(0)
+    tokens = ([generator.choice(variants(form)) for form in generator.choices(forms, k=20000)]
+              + [misspelling(form, generator) for form in generator.choices(forms, k=20000)])
+    generator.shuffle(tokens)
+
+    lexicon.neighborhood
+    print(f'exact:    {rate(index.get, tokens):10.0f} tokens/s')
+    print(f'variants: {rate(p.lookup, tokens):10.0f} tokens/s')
+    print(f'fuzzy 1:  {rate(lambda token: p.lookup(token, 1), tokens):10.0f} tokens/s')
+    print(f'fuzzy 2:  {rate(lambda token: p.suggest(token, 2), tokens[:2000]):10.0f} tokens/s')
+
+    keys = list(lexicon.normalized)
+    scan = lambda token: min(keys, key=lambda key: editing(canonical(token), key))
+    print(f'scan:     {rate(scan, tokens[:200]):10.0f} tokens/s')
+
+    # the neighborhood does not compare a query with every word, so it
+    # stays fast for a vocabulary much larger than the irregulars
+    vocabulary = {''.join(generator.choices(LETTERS, k=generator.randint(3, 7)))
+                  for _ in range(100000)}
+    start = timer()
+    neighborhood = Neighborhood(vocabulary, distance=1)
+    print(f'build:    {timer() - start:10.2f} s for {len(neighborhood)} words')
+    queries = [misspelling(word, generator) for word in generator.sample(sorted(vocabulary), 20000)]
+    print(f'search:   {rate(neighborhood.search, queries):10.0f} tokens/s '
+          f'in {len(neighborhood)} words')
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Measure the profiling throughput with a cold and a shared lexicon
+
+The cold run reloads the lexicon before every call, which is what every call
+used to pay when the data files were parsed inside `profiling`, `auxiliary`,
+and `conj`.
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.lexicon import lexicon
+
+WORDS = [('گفت', 'Ɉoft'), ('آمد', 'ʔɒmæd'), ('رساندن', 'resɒndæn'),
+         ('چرخ', 'ʧærx'), ('پوش', 'puʃ'), ('ترس', '')]
+
+
+def run(repeat, cold):
+    p = CPVI()
+    start = timer()
+    for _ in range(repeat):
+        for word, ipa in WORDS:
+            if cold:
+                lexicon.reload()
+            p.profiling(word, ipa)
+    return repeat * len(WORDS) / (timer() - start)
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f'cold lexicon:   {run(repeat, True):8.1f} profiles/s')
+    print(f'shared lexicon: {run(repeat, False):8.1f} profiles/s')
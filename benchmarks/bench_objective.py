@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Measure the cost of the objective paradigm: not accessed, one branch
+accessed, and fully expanded
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.analyzer import walk
+
+WORDS = [('چرخ', 'ʧærx'), ('پوش', 'puʃ'), ('رساندن', 'resɒndæn'),
+         ('آمد', 'ʔɒmæd'), ('ترس', 'tærs')]
+
+
+def run(repeat, access=None, **kwargs):
+    p = CPVI()
+    p.profiling(*WORDS[0])
+    start = timer()
+    for _ in range(repeat):
+        profiles = [p.profiling(word, ipa, **kwargs) for word, ipa in WORDS]
+        if access is not None:
+            for profile in profiles:
+                access(profile['objective paradigm'])
+    elapsed = timer() - start
+
+    tracemalloc.start()
+    profiles = [p.profiling(word, ipa, **kwargs) for word, ipa in WORDS]
+    if access is not None:
+        for profile in profiles:
+            access(profile['objective paradigm'])
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed / (repeat * len(WORDS)) * 1000, size / len(WORDS) / 1024
+
+
+if __name__ == '__main__':
+    cases = {
+        'without': ({}, None),
+        'not accessed': ({'objective': True}, None),
+        'one branch': ({'objective': True},
+                       lambda o: o['formal']['Persian']['affirmative']),
+        'expanded': ({'objective': True}, lambda o: sum(1 for _ in walk(o)))}
+    run(5)
+    for name, (kwargs, access) in cases.items():
+        ms, kib = run(20, access, **kwargs)
+        print(f'{name:13} {ms:8.2f} ms/profile {kib:9.1f} KiB/profile')
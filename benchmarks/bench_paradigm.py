@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Compare the memory kept by nested-dictionary and compact paradigms
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.lexicon import lexicon
+
+
+def resident(compact):
+    # the memory kept by the profiles of every irregular
+    p = CPVI()
+    p.profiling('گفتن')
+    tracemalloc.start()
+    start = timer()
+    profiles = [p.profiling(entry, compact=compact)
+                for entry in lexicon.irregulars]
+    elapsed = timer() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(profiles) / 1024, len(profiles) / elapsed
+
+
+if __name__ == '__main__':
+    for name, compact in [('nested dict', False), ('Paradigm', True)]:
+        kb, rate = resident(compact)
+        print(f'{name:12} {kb:8.1f} KiB/profile {rate:8.1f} profiles/s')
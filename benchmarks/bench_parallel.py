@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Measure how profile_parallel scales with the number of worker processes
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI.parallel import profile_parallel
+from bench_cache import workload
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    words = workload(size)
+    print(f'{os.cpu_count()} processors, {size} items')
+    for workers in [1, 2, 4, 8]:
+        start = timer()
+        profile_parallel(words, workers=workers, chunksize=64)
+        print(f'{workers} workers: {size / (timer() - start):8.1f} profiles/s')
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Compare the full paradigm with a selected slice and a lazy paradigm
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+
+WORDS = [('چرخ', 'ʧærx'), ('پوش', 'puʃ'), ('رساندن', 'resɒndæn'),
+         ('آمد', 'ʔɒmæd'), ('ترس', 'tærs')]
+SLICE = {'formality': 'formal', 'alphabet': 'Persian',
+         'polarity': 'affirmative', 'tense': 'present', 'aspect': 'simple'}
+
+
+def run(repeat, **kwargs):
+    p = CPVI()
+    p.profiling(*WORDS[0])
+    start = timer()
+    for _ in range(repeat):
+        profiles = [p.profiling(word, ipa, **kwargs) for word, ipa in WORDS]
+        if kwargs.get('lazy'):
+            for profile in profiles:
+                profile['paradigm']['formal']['Persian']['affirmative']
+    elapsed = timer() - start
+
+    # the memory kept by one round of profiles
+    tracemalloc.start()
+    profiles = [p.profiling(word, ipa, **kwargs) for word, ipa in WORDS]
+    if kwargs.get('lazy'):
+        for profile in profiles:
+            profile['paradigm']['formal']['Persian']['affirmative']
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return repeat * len(WORDS) / elapsed, size / len(WORDS) / 1024
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    for name, kwargs in [('full paradigm', {}), ('selected slice', {'select': SLICE}),
+                         ('lazy, one branch', {'lazy': True})]:
+        rate, kb = run(repeat, **kwargs)
+        print(f'{name:17} {rate:8.1f} profiles/s {kb:8.1f} KiB/profile')
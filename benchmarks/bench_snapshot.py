@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Compare the cold start of parsing the JSON files with opening the binary
+snapshot, each followed by the first lookup of an irregular verb
+
+Every case runs in a fresh interpreter, so nothing is shared between runs.
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+
+ROOT = Path(__file__).parents[1]
+sys.path.insert(0, str(ROOT))
+
+from CPVI.snapshot import convert
+
+CASES = {
+    'json': '''
+from CPVI.lexicon import lexicon
+start = timer()
+entry = lexicon.index['گفت']
+profile = thaw(lexicon.irregulars[entry])
+profile['paradigm'] = lexicon.paradigm(entry, '\\u200c')
+''',
+    'snapshot': '''
+from CPVI.snapshot import Snapshot
+start = timer()
+profile = Snapshot(PATH).profile('گفت', '\\u200c')
+'''}
+
+TEMPLATE = '''
+from timeit import default_timer as timer
+import sys
+sys.path.insert(0, ROOT)
+from CPVI.lexicon import thaw
+{case}
+elapsed = timer() - start
+print(elapsed)
+'''
+
+
+def run(case, path, repeat=5):
+    code = (TEMPLATE.format(case=case).replace('ROOT', repr(str(ROOT)))
+            .replace('PATH', repr(str(path))))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], check=True,
+                                capture_output=True, text=True).stdout
+        times.append(float(output))
+    return min(times) * 1000
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / 'lexicon.snap'
+        info = convert(path)
+        print(f"snapshot: {info['bytes'] / 2 ** 20:.2f} MiB, "
+              f"{info['strings']} strings, {info['entries']} entries")
+        for name, case in CASES.items():
+            print(f'{name:9} {run(case, path):8.2f} ms to the first profile')
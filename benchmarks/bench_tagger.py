@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Measure the throughput of the corpus tagger on a synthetic corpus
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import io
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI.analyzer import Analyzer
+from CPVI.tagger import tag
+
+
+def corpus(path, lines, seed=0):
+    # mix inflected forms of irregulars with words that are not verbs
+    forms = list(Analyzer(irregulars=True).forms)
+    words = ['کتاب', 'خانه', 'به', 'از', 'که', 'این', 'آن', 'را', 'با', 'در']
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as file:
+        for _ in range(lines):
+            tokens = rng.choices(words, k=12) + rng.choices(forms, k=3)
+            rng.shuffle(tokens)
+            file.write(' '.join(tokens) + '.\n')
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / 'corpus.txt'
+        corpus(path, 20000)
+        size = path.stat().st_size
+
+        start = timer()
+        stats = tag(path, io.StringIO())
+        print(f"tag:    {stats['tokens/s']:10.0f} tokens/s, "
+              f"{size / (timer() - start) / 2 ** 20:6.2f} MiB/s, "
+              f"{stats['verbs']} verb forms")
+
+        start = timer()
+        stats = tag(path, io.StringIO(), offset=size // 2)
+        print(f"resume: {stats['tokens']:10d} tokens from offset {size // 2}, "
+              f"{timer() - start:6.2f} s")
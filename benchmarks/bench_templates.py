@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Time inflector and a single concatenation with and without templates
+"""
+
+from pathlib import Path
+from timeit import timeit
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.inflection import inflector
+from CPVI.lexicon import lexicon
+from CPVI.utils import concatenate, Template
+
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    profile = CPVI().profiling('چرخ', 'ʧærx')
+    profile['paradigm'] = ''
+
+    def inflect():
+        inflector(dict(profile), '\u200c')
+
+    print(f'inflector:   {1000 * timeit(inflect, number=number) / number:8.3f} ms')
+
+    conj = lexicon.conjugations['subjective']['informal']['Persian']['past']
+    template = Template(None, '\u200c', conj)
+    number *= 100
+    plain = timeit(lambda: concatenate('چرخیده', '\u200c', conj), number=number)
+    compiled = timeit(lambda: template('چرخیده'), number=number)
+    print(f'concatenate: {1e6 * plain / number:8.3f} us')
+    print(f'Template:    {1e6 * compiled / number:8.3f} us')
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Measure how profiling with one shared CPVI instance scales with the number
+of threads
+
+With the GIL the throughput stays about the same; run it with a
+free-threaded build of CPython (python3.13t) to see the threads run in
+parallel.
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import os
+import sys
+import threading
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from bench_cache import workload
+
+
+def running(p, words, threads):
+    # split the words between the threads and profile them
+    def work(part):
+        for word in part:
+            p.profiling(word)
+
+    workers = [threading.Thread(target=work, args=(words[n::threads],))
+               for n in range(threads)]
+    start = timer()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return len(words) / (timer() - start)
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    words = workload(size)
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'{os.cpu_count()} processors, {size} items, '
+          f'GIL {"enabled" if gil else "disabled"}')
+    for cache_size in [0, 1024]:
+        for threads in [1, 2, 4, 8, 16]:
+            p = CPVI(cache_size=cache_size)
+            rate = running(p, words, threads)
+            print(f'cache {cache_size:4d}, {threads:2d} threads: '
+                  f'{rate:8.1f} profiles/s')
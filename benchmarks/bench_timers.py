@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Measure the overhead of the stage timers when they are disabled and enabled
+"""
+
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.timers import timers
+
+WORDS = [('چرخ', 'ʧærx'), ('پوش', 'puʃ'), ('رساندن', 'resɒndæn'),
+         ('گفت', 'Ɉoft'), ('ترس', 'tærs')]
+
+
+def run(p, repeat=7, number=20):
+    def call():
+        for word, ipa in WORDS:
+            p.profiling(word, ipa)
+    call()
+    best = min(timeit.repeat(call, number=number, repeat=repeat))
+    return best / number / len(WORDS) * 1e6
+
+
+if __name__ == '__main__':
+    p = CPVI()
+    timers.disable()
+    disabled = run(p)
+    timers.enable()
+    enabled = run(p)
+    timers.disable()
+    print(f'disabled: {disabled:8.1f} us/profile')
+    print(f'enabled:  {enabled:8.1f} us/profile ({enabled / disabled - 1:+.1%})')
+    for stage, counter in p.stats()['stages'].items():
+        print(f"  {stage:9} {counter['calls']:7d} calls {counter['mean'] * 1e6:9.1f} us/call")
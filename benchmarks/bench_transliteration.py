@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Measure how often the transliterator reads the stems of an irregular verb
+right when the verb is left out of its table, and how fast it reads a large
+list of words next to derive_many
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import sys
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.lexicon import lexicon
+from CPVI.transliteration import Transliterator, stem_pairs
+from bench_derive import candidates
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    irregulars = lexicon.irregulars
+
+    start = timer()
+    Transliterator(CPVI.IPA, stem_pairs(irregulars))
+    print(f'build: {timer() - start:.3f} s')
+
+    # leave every verb out and read its stems
+    right = first = total = 0
+    for gerund in irregulars:
+        others = {key: entry for key, entry in irregulars.items()
+                  if key != gerund}
+        transliterator = Transliterator(CPVI.IPA, stem_pairs(others))
+        for persian, sound in stem_pairs({gerund: irregulars[gerund]}):
+            readings = [reading for reading, _ in
+                        transliterator.candidates(persian, 3)]
+            right += sound in readings
+            first += readings[:1] == [sound]
+            total += 1
+    print(f'held-out stems: {first / total:.1%} read right, '
+          f'{right / total:.1%} among the best three')
+
+    words = [word for word, _ in candidates(size)]
+    p = CPVI(transliterate=True)
+    transliterator = Transliterator(CPVI.IPA, stem_pairs(irregulars))
+    start = timer()
+    transliterator.transliterate_many(words)
+    many = timer() - start
+    start = timer()
+    p.derive_many(words)
+    derived = timer() - start
+    print(f'transliterate_many:          {size / many:10.0f} words/s')
+    print(f'derive_many (transliterate): {size / derived:10.0f} words/s')
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Compare applying a change set with update against rebuilding every
+paradigm, on a copy of the data files, and check that both give the same
+paradigms
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+import gzip
+import json
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.build import build
+from CPVI.lexicon import lexicon, thaw, ARTIFACT
+from CPVI.update import update
+
+
+def paradigms():
+    with gzip.open(lexicon.path / ARTIFACT, 'rb') as file:
+        return json.load(file)['paradigms']
+
+
+def edits():
+    # an edit of an ordinary entry and an edit of an auxiliary
+    irregulars = thaw(lexicon.irregulars)
+    ordinary = irregulars['رفتن']
+    ordinary['informal Persian past stem'] = 'رف'
+    auxiliary = irregulars['بودن']
+    auxiliary['paradigm']['formal']['Persian']['affirmative']['past']['simple']['s1'] = 'بودمی'
+    return {'ordinary': {'رفتن': ordinary}, 'auxiliary': {'بودن': auxiliary}}
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as folder:
+        # work on a copy so that the data files of the package are untouched
+        shutil.copytree(lexicon.path, Path(folder) / 'data')
+        lexicon.path = Path(folder) / 'data'
+        lexicon.reload()
+        build()
+
+        p = CPVI(cache_size=1024)
+        for word in list(lexicon.index)[:300]:
+            p.profiling(word)
+
+        for name, changes in edits().items():
+            report = update(changes, [p.cache])
+            incremental = paradigms()
+            start = timer()
+            build()
+            full = timer() - start
+            same = incremental == paradigms()
+            print(f'{name:10} update {report["seconds"]:6.2f} s  '
+                  f'({report["rebuilt"]:3d} rebuilt, {report["reused"]:3d} '
+                  f'reused, {report["evicted"]:3d} of {len(p.cache) + report["evicted"]} '
+                  f'cached profiles evicted)  full build {full:6.2f} s  '
+                  f'same paradigms: {same}')
+            for word in list(lexicon.index)[:300]:
+                p.profiling(word)
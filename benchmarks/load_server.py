@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Load-test a local inflection service with and without request coalescing
+
+Every round fires a burst of concurrent requests where a few popular verbs
+are requested many times, like a service behind a busy front end.
+"""
+
+from pathlib import Path
+from timeit import default_timer as timer
+from urllib.parse import urlencode
+import asyncio
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = Path(__file__).parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def workload(size, seed=0):
+    # made-up regular stems drawn with Zipf weights; regulars are inflected
+    # on every request, unlike the precomputed irregulars
+    words = [f'{w}{c}' for w in ['چرخ', 'پوش', 'ترس', 'خور', 'رقص']
+             for c in 'بپتسشلمن']
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    return random.Random(seed).choices(words, weights, k=size)
+
+
+def port():
+    # a free port of the local host
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def request(host, number, target):
+    reader, writer = await asyncio.open_connection(host, number)
+    writer.write(f'GET {target} HTTP/1.1\r\nHost: {host}\r\n'
+                 f'Connection: close\r\n\r\n'.encode('latin-1'))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response.partition(b'\r\n\r\n')[2]
+
+
+async def burst(host, number, targets):
+    latencies = []
+
+    async def timed(target):
+        start = timer()
+        await request(host, number, target)
+        latencies.append((timer() - start) * 1000)
+
+    await asyncio.gather(*(timed(target) for target in targets))
+    return latencies
+
+
+def percentile(latencies, q):
+    latencies = sorted(latencies)
+    return latencies[min(len(latencies) - 1, int(q / 100 * len(latencies)))]
+
+
+def run(coalesce, rounds, size):
+    number = port()
+    command = [sys.executable, '-m', 'CPVI', 'serve', '--port', str(number)]
+    if not coalesce:
+        command.append('--no-coalesce')
+    server = subprocess.Popen(command, cwd=ROOT)
+    try:
+        for _ in range(100):
+            try:
+                socket.create_connection(('127.0.0.1', number)).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+
+        rng = random.Random(0)
+        items = workload(size * rounds, 0)
+        latencies = []
+        for n in range(rounds):
+            targets = ['/profile?' + urlencode({'word': word})
+                       for word in items[n * size:(n + 1) * size]]
+            rng.shuffle(targets)
+            latencies += asyncio.run(burst('127.0.0.1', number, targets))
+        stats = json.loads(asyncio.run(request('127.0.0.1', number, '/stats')))
+    finally:
+        server.terminate()
+        server.wait()
+    return latencies, stats
+
+
+if __name__ == '__main__':
+    for coalesce in [False, True]:
+        latencies, stats = run(coalesce, rounds=5, size=200)
+        print(f"coalesce={str(coalesce):5}  p50 {percentile(latencies, 50):8.1f} ms"
+              f"  p99 {percentile(latencies, 99):8.1f} ms"
+              f"  computations {stats['computations']:5d}"
+              f"  coalesced {stats['coalesced']:5d}")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Profile the same verbs from many threads with one shared CPVI instance and
+check that every thread gets the profiles of a single-threaded run and that
+the shared lexicon is left as it was read from the data files
+
+    python benchmarks/stress_threads.py --threads 16 --rounds 3
+
+Run it with a free-threaded build of CPython (python3.13t) to test without
+the GIL; the script exits with status 1 if any check fails.
+"""
+
+from pathlib import Path
+import argparse
+import json
+import random
+import sys
+import threading
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from CPVI import CPVI
+from CPVI.lexicon import lexicon, freeze
+
+# irregulars, including the ones that come with their paradigms, and
+# alternative and regular verbs
+VERBS = [('بودن', ''), ('داشتن', ''), ('خواستن', ''), ('گفت', 'Ɉoft'),
+         ('آمد', 'ʔɒmæd'), ('رفت', ''), ('رساندن', 'resɒndæn'),
+         ('چرخ', 'ʧærx'), ('آزما', 'ʔɒzmɒ')]
+
+# the options of profiling that build the paradigm in different ways
+OPTIONS = [{}, {'lazy': True}, {'select': {'formality': 'formal'}},
+           {'compact': True}, {'objective': True}]
+
+
+def dumping(profile):
+    # a canonical text of a profile, reading every lazy branch
+    paradigm = profile['paradigm']
+    if hasattr(paradigm, 'to_dict'):
+        paradigm = paradigm.to_dict()
+    profile = dict(profile, paradigm=paradigm)
+    objective = profile.get('objective paradigm')
+    if objective is not None:
+        profile['objective paradigm'] = {
+            frmlty: {alphabet: dict(polarities.items())
+                     for alphabet, polarities in alphabets.items()}
+            for frmlty, alphabets in objective.items()}
+    return json.dumps(profile, ensure_ascii=False, sort_keys=True, default=dict)
+
+
+def cases():
+    return [(word, API_form, space, n) for word, API_form in VERBS
+            for space in ['\u200c', ' ', ''] for n in range(len(OPTIONS))]
+
+
+def working(p, expected, rounds, seed, failures):
+    generator = random.Random(seed)
+    for _ in range(rounds):
+        order = cases()
+        generator.shuffle(order)
+        for word, API_form, space, n in order:
+            try:
+                profile = p.profiling(word, API_form, space, **OPTIONS[n])
+                if dumping(profile) != expected[word, API_form, space, n]:
+                    failures.append(('different', word, space, n))
+                # change the returned profile to catch shared objects
+                if isinstance(profile['paradigm'], dict):
+                    profile['paradigm'].clear()
+                profile['present dual'] = None
+            except Exception as error:
+                failures.append(('error', word, space, n, repr(error)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Profile the same verbs from many threads')
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--cache-size', type=int, default=64,
+        help='the cache of the shared instance; 0 disables it')
+    args = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}')
+
+    expected = {case: dumping(CPVI().profiling(case[0], case[1], case[2],
+                                               **OPTIONS[case[3]]))
+                for case in cases()}
+
+    p = CPVI(cache_size=args.cache_size)
+    failures = []
+    threads = [threading.Thread(target=working,
+                                args=(p, expected, args.rounds, seed, failures))
+               for seed in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    calls = args.threads * args.rounds * len(expected)
+    print(f'{calls} calls from {args.threads} threads, {len(failures)} failures')
+    for failure in failures[:10]:
+        print(' ', failure)
+
+    # the shared lexicon should equal the data files
+    for name in ['irregulars', 'conjugations']:
+        with open(lexicon.path / f'{name}.json', 'r', encoding='utf-8') as file:
+            if freeze(json.load(file)) != getattr(lexicon, name):
+                failures.append(('changed', name))
+                print(f'the shared {name} changed')
+
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Time the whole inflection pipeline and save the results as JSON
+
+    python benchmarks/suite.py -o results.json
+    python benchmarks/suite.py -o new.json --compare results.json
+
+With --compare, every timing and memory result is checked against the
+previous run and the script exits with status 1 if any of them is slower
+(or larger) by more than the threshold.
+"""
+
+from pathlib import Path
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+ROOT = Path(__file__).parents[1]
+sys.path.insert(0, str(ROOT))
+
+from CPVI import CPVI
+from CPVI.inflection import inflector
+from CPVI.lexicon import lexicon
+from CPVI.utils import concatenate, prefixing
+
+# an input of every route of profiling
+INPUTS = {'irregular': ('گفت', 'Ɉoft'),
+          'alternative': ('رساندن', 'resɒndæn'),
+          'regular': ('چرخ', 'ʧærx')}
+
+SPACES = {'zwnj': '\u200c', 'space': ' ', 'none': ''}
+
+PERSONS = {'s1': 'م', 's2': 'ی', 's3': 'د', 'p1': 'یم', 'p2': 'ید', 'p3': 'ند'}
+
+
+def timing(function, number, repeat):
+    # the fastest of the repeats, in microseconds per call
+    function()
+    best = min(timeit.repeat(function, number=number, repeat=repeat))
+    return best / number * 1e6
+
+
+def memory(function):
+    # the size of the objects kept by a call, in KiB
+    function()
+    tracemalloc.start()
+    kept = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / 1024
+
+
+def cases():
+    """
+    Make the benchmark cases
+
+    Returns
+    -------
+    dict
+        a dictionary mapping the names of the cases to functions
+    """
+    p = CPVI()
+    functions = {}
+    for route, (word, API_form) in INPUTS.items():
+        for name, space in SPACES.items():
+            functions[f'profiling/{route}/ipa/{name}'] = (
+                lambda w=word, a=API_form, s=space: p.profiling(w, a, s))
+            functions[f'profiling/{route}/no-ipa/{name}'] = (
+                lambda w=word, s=space: p.profiling(w, '', s))
+
+    # inflect the regular profile without the lookup and the regexes
+    profile = p.profiling(*INPUTS['regular'])
+    profile['paradigm'] = ''
+    for name, space in SPACES.items():
+        functions[f'inflector/regular/{name}'] = (
+            lambda s=space: inflector(dict(profile), s))
+    functions['concatenate'] = lambda: concatenate('می', '\u200c', 'چرخ', PERSONS)
+    functions['prefixing/persian'] = lambda: prefixing('نمی', 'آورد', '')
+    functions['prefixing/ipa'] = lambda: prefixing('be', 'ʔɒvær', '')
+    return functions
+
+
+def run(number, repeat):
+    """
+    Run every case
+
+    Parameters
+    ----------
+    number : int
+        the number of calls per repeat
+    repeat : int
+        the number of repeats; the fastest one is kept
+
+    Returns
+    -------
+    dict
+        the metadata of the run, the microseconds per call of every case,
+        and the KiB kept by a profile of every route
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                cwd=ROOT, capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    results = {'meta': {'python': platform.python_version(),
+                        'platform': platform.platform(), 'commit': commit,
+                        'lexicon': lexicon.version,
+                        'number': number, 'repeat': repeat},
+               'time': {}, 'memory': {}}
+    for name, function in cases().items():
+        # the functions are much faster than profiling, so call them more
+        calls = number if name.startswith(('profiling', 'inflector')) else number * 100
+        results['time'][name] = timing(function, calls, repeat)
+
+    p = CPVI()
+    for route, (word, API_form) in INPUTS.items():
+        results['memory'][f'profile/{route}'] = memory(
+            lambda: p.profiling(word, API_form))
+    return results
+
+
+def compare(base, new, threshold):
+    """
+    Compare two runs
+
+    Parameters
+    ----------
+    base : dict
+        the results of the previous run
+    new : dict
+        the results of this run
+    threshold : float
+        the largest accepted increase, as a fraction of the previous result
+
+    Returns
+    -------
+    list
+        the names of the results that regressed
+    """
+    regressions = []
+    for kind, unit in [('time', 'us'), ('memory', 'KiB')]:
+        for name, value in new[kind].items():
+            old = base.get(kind, {}).get(name)
+            if old is None:
+                print(f'{kind:6} {name:36} {value:10.2f} {unit:3}  (new)')
+                continue
+            change = value / old - 1 if old else 0
+            flag = 'REGRESSION' if change > threshold else ''
+            print(f'{kind:6} {name:36} {value:10.2f} {unit:3} {change:+8.1%} {flag}')
+            if flag:
+                regressions.append(f'{kind}/{name}')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Time the inflection pipeline and save the results')
+    parser.add_argument('-o', '--output', help='the path of the JSON results')
+    parser.add_argument('--compare', help='the JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.25,
+        help='the accepted slowdown as a fraction (default 0.25)')
+    parser.add_argument('--number', type=int, default=20,
+        help='the number of profiling calls per repeat')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='the number of repeats; the fastest one is kept')
+    args = parser.parse_args()
+
+    results = run(args.number, args.repeat)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+
+    if not args.compare:
+        for kind, unit in [('time', 'us'), ('memory', 'KiB')]:
+            for name, value in results[kind].items():
+                print(f'{kind:6} {name:36} {value:10.2f} {unit}')
+        sys.exit(0)
+
+    with open(args.compare, 'r', encoding='utf-8') as file:
+        base = json.load(file)
+    regressions = compare(base, results, args.threshold)
+    if regressions:
+        print(f'{len(regressions)} results are more than {args.threshold:.0%} '
+              f'slower or larger: {", ".join(regressions)}')
+        sys.exit(1)
@@ -31,7 +31,7 @@ setup(
     ],
     packages=["CPVI"],
     package_dir={'CPVI': 'CPVI'},
-    package_data={'CPVI': ['data/*.json']},
+    package_data={'CPVI': ['data/*.json', 'data/*.json.gz']},
     install_requires=["pathlib"]
 )
 
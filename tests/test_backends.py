@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+from CPVI import CPVI
+from CPVI.backends import Backend, JSONBackend, SQLiteBackend
+from CPVI.export import exporting
+from CPVI.lexicon import KEYS, FrozenDict, lexicon
+import pytest
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteBackend(tmp_path / 'verbs.db')
+    backend.upsert({gerund: lexicon.irregulars[gerund]
+                    for gerund in ['گفتن', 'آمدن']}, paradigms=False)
+    yield backend
+    backend.close()
+
+
+def test_keys():
+    assert all(list(props) == KEYS for props in lexicon.irregulars.values())
+
+
+def test_sqlite(backend, monkeypatch):
+    expected = [CPVI().profiling(word) for word in ['گفت', 'چرخید']]
+    derived = CPVI().derive_many(['چرخید'])
+    # the irregulars of the data files are not read through another backend
+    lexicon.irregulars
+    monkeypatch.setitem(lexicon._data, 'irregulars', FrozenDict())
+    p = CPVI(backend=backend)
+    assert [p.profiling(word) for word in ['گفت', 'چرخید']] == expected
+    assert p.derive_many(['چرخید']) == derived
+
+
+def test_export(backend):
+    # words are resolved through the backend, like profiling resolves them
+    assert list(exporting(['گفت', 'آمدن'], backend=backend)) == \
+        list(exporting(['گفت', 'آمدن']))
+    lemmas = {row[0] for row in exporting(['رفت'], backend=backend)}
+    assert lemmas and 'رفتن' not in lemmas
+
+
+def test_abstract():
+    # an incomplete backend fails when it is made, not while profiling
+    class Incomplete(Backend):
+        def find(self, word):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+    assert CPVI(backend=JSONBackend()).profiling('گفت')
+
+
+def test_prefixes(backend):
+    # both backends remove a prefix the same way
+    default = JSONBackend()
+    for word in ['مي گفت', 'می\u200cآمد', 'میگفت', 'میراندن', 'نمیر',
+                 'می گفتن', 'آمد']:
+        assert backend.find(word) == default.find(word)
+    assert backend.find('مي گفت') == 'گفتن'
+    assert backend.find('میگفت') is None
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+from CPVI import CPVI
+
+ITEMS = ['گفت', ('رساندن', 'resɒndæn'), 'گفت', ('چرخ', 'ʧærx'), 'آمد'] * 3
+
+
+def test_memo():
+    # the profiles do not depend on how many items are kept for duplicates
+    p = CPVI()
+    expected = [p.profiling(item) if isinstance(item, str) else
+                p.profiling(*item) for item in ITEMS]
+    for memo in [0, 1, 2, 1024]:
+        assert list(p.profile_many(ITEMS, memo=memo)) == expected
+
+
+def test_report():
+    # every distinct item is reported once, even when it was not kept
+    for memo in [0, 1, 1024]:
+        report = {}
+        list(CPVI().profile_many(ITEMS, report=report, memo=memo))
+        assert report == {'irregular': [('گفت', ''), ('آمد', '')],
+                          'alternative': [('رساندن', 'resɒndæn')],
+                          'regular': [('چرخ', 'ʧærx')]}
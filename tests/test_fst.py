@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+from CPVI.fst import Compiled
+import pytest
+
+
+@pytest.fixture(scope='module')
+def compiled():
+    return Compiled('\u200c')
+
+
+def test_kinds(compiled):
+    # خوردم is the simple past of the past stem خورد; read as a present
+    # stem, خورد would make the literary present خوردم
+    stems = {('خور', 'present'), ('خورد', 'past')}
+    analyses = compiled.analyze('خوردم', stems=stems)
+    assert analyses
+    assert {analysis['kind'] for analysis in analyses} == {'past'}
+    assert ('past', 'simple') in {(analysis['tense'], analysis['aspect'])
+                                  for analysis in analyses}
+    analyses = compiled.analyze('خوردم', stems={('خورد', 'present')})
+    assert {analysis['kind'] for analysis in analyses} == {'present'}
+
+
+def test_present(compiled):
+    analyses = compiled.analyze('بیاورم', stems={('آور', 'present')})
+    assert analyses[0]['kind'] == 'present'
+    assert analyses[0]['aspect'] == 'subjunctive'
+    assert compiled.analyze('بیاورم', stems={('آور', 'past')}) == []
+
+
+def test_load(compiled, tmp_path):
+    path = tmp_path / 'rules.fst.gz'
+    compiled.save(path)
+    loaded = Compiled.load(path)
+    assert loaded.kinds == compiled.kinds
+    assert loaded.analyze('خوردم') == compiled.analyze('خوردم')
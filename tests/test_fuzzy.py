@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+from CPVI import CPVI
+from CPVI.fuzzy import finding
+from CPVI.lexicon import lexicon
+
+
+def test_prefixes():
+    # a prefix written apart from a stem is removed
+    assert finding('مي گفت', lexicon.normalized) == 'گفتن'
+    assert finding('نمی\u200cرفت', lexicon.normalized) == 'رفتن'
+    # words that begin with the letters of a prefix are left alone, and a
+    # prefix is never written before a gerund
+    for word in ['میراندن', 'میران', 'نمیر', 'میگفت', 'می راندن']:
+        assert finding(word, lexicon.normalized) is None
+
+
+def test_profiling():
+    p = CPVI()
+    profile = p.profiling('میراندن')
+    assert profile['regularity'] == 'Alternative'
+    assert profile['formal Persian present stem'] == 'میران'
+    assert p.profiling('میران')['regularity'] == 'Alternative'
+    assert p.profiling('نمیر')['regularity'] == 'Regular'
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+from CPVI import CPVI
+from CPVI.utils import LazyDict
+import json
+
+
+def lazy_branch():
+    # a lazy branch of a regular verb and the same branch inflected eagerly
+    lazy = CPVI().profiling('چرخ', 'ʧærx', lazy=True)['paradigm']
+    eager = CPVI().profiling('چرخ', 'ʧærx')['paradigm']
+    return lazy['formal']['Persian'], eager['formal']['Persian']
+
+
+def pending(value):
+    # True if a value or any value nested in it is not computed
+    if isinstance(value, LazyDict._Pending):
+        return True
+    if isinstance(value, dict):
+        return any(pending(val) for val in dict.values(value))
+    return False
+
+
+def test_dict():
+    lazy, eager = lazy_branch()
+    assert isinstance(lazy, LazyDict)
+    copied = dict(lazy)
+    assert copied == eager and not pending(copied)
+
+
+def test_unpacking():
+    lazy, eager = lazy_branch()
+    merged = {**lazy}
+    assert merged == eager and not pending(merged)
+    assert not pending({} | lazy) and not pending(lazy | {})
+
+
+def test_copy():
+    lazy, eager = lazy_branch()
+    copied = lazy.copy()
+    assert type(copied) is dict and copied == eager and not pending(copied)
+
+
+def test_pop():
+    lazy, eager = lazy_branch()
+    assert lazy.pop('negative') == eager['negative']
+    assert 'negative' not in lazy
+    assert lazy.pop('negative', None) is None
+    assert lazy.setdefault('affirmative') == eager['affirmative']
+    key, value = lazy.popitem()
+    assert value == eager[key] and not pending(value)
+
+
+def test_json():
+    lazy, eager = lazy_branch()
+    assert json.loads(json.dumps(lazy)) == eager
+
+
+def test_objective():
+    profile = CPVI().profiling('گفت', 'Ɉoft', objective=True)
+    branch = profile['objective paradigm']['formal']['Persian']
+    copied = dict(branch)
+    assert not pending(copied) and copied == branch.copy()
+    assert branch.pop('affirmative') == copied['affirmative']
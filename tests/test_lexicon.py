@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+from CPVI.lexicon import ARTIFACT, Lexicon
+import shutil
+
+
+def test_truncated(tmp_path):
+    # a truncated artifact is ignored, like a missing one
+    lexicon = Lexicon()
+    shutil.copytree(lexicon.path, tmp_path / 'data')
+    path = tmp_path / 'data' / ARTIFACT
+    raw = path.read_bytes()
+    path.write_bytes(raw[:len(raw) // 2])
+    truncated = Lexicon(tmp_path / 'data')
+    assert truncated.paradigm('گفتن', '\u200c') is None
+    assert lexicon.paradigm('گفتن', '\u200c') is not None
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from CPVI import CPVI
+from CPVI.paradigm import ABSENT, DICT, LIST, NONE, Paradigm
+import json
+
+
+def test_shapes():
+    assert len({ABSENT, NONE, DICT, LIST}) == 4
+
+
+def test_round_trip():
+    # dual branches, and an aspect that is an empty list of them
+    for word in ['گفت', 'داشت', 'رساندن']:
+        paradigm = CPVI().profiling(word)['paradigm']
+        assert Paradigm(paradigm).to_dict() == paradigm
+    paradigm = CPVI().profiling('گفت')['paradigm']
+    paradigm['formal']['Persian']['affirmative']['past']['simple'] = []
+    compact = Paradigm(paradigm)
+    assert compact.to_dict() == paradigm
+    assert compact['formal']['Persian']['affirmative']['past']['simple'] == []
+
+
+def test_order():
+    # the paradigms written in irregulars.json keep the order of their keys
+    for word in ['بودن', 'شدن', 'داشتن', 'گفتن', 'خواستن', 'ایستادن']:
+        paradigm = CPVI().profiling(word)['paradigm']
+        compact = Paradigm(paradigm)
+        assert json.dumps(compact.to_dict()) == json.dumps(paradigm)
+        assert list(compact) == list(paradigm)
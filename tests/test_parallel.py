@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+from CPVI import CPVI
+from CPVI.backends import SQLiteBackend
+from CPVI.lexicon import lexicon
+from CPVI.parallel import profile_parallel
+
+ITEMS = ['گفت', ('چرخ', 'ʧærx'), ('آمد', 'Q'), 'رفت', ('رساندن', 'resɒndæn')]
+
+
+def test_order():
+    # the profiles come back in the order of the items, and a bad item gets
+    # its error without stopping the others
+    results = profile_parallel(ITEMS, workers=2, chunksize=1)
+    p = CPVI()
+    assert isinstance(results[2], TypeError)
+    for item, result in zip(ITEMS[:2] + ITEMS[3:], results[:2] + results[3:]):
+        assert result == (p.profiling(item) if isinstance(item, str) else
+                          p.profiling(*item))
+
+
+def test_options(tmp_path):
+    # the workers profile with the backend and the options of the caller
+    backend = SQLiteBackend(tmp_path / 'verbs.db')
+    backend.upsert({'گفتن': lexicon.irregulars['گفتن']}, paradigms=False)
+    p = CPVI(transliterate=True, backend=backend)
+    items = ['گفت', 'رفت', 'چرخید']
+    assert profile_parallel(items, workers=2, transliterate=True,
+                            backend=backend) == \
+        [p.profiling(item) for item in items]
+    assert profile_parallel(['رفت'], workers=1)[0] != p.profiling('رفت')
+    backend.close()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+from CPVI.server import Service
+import asyncio
+import json
+
+
+async def exchanging(requests):
+    # send every request on one connection and read what comes back
+    service = Service(workers=1)
+    server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b''.join(requests))
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 30)
+        writer.close()
+    service.executor.shutdown()
+    return response
+
+
+def test_content_length():
+    # a malformed length gets a 400 response before the connection closes
+    for length in [b'abc', b'-5', b'1.5']:
+        response = asyncio.run(exchanging([
+            b'GET /stats HTTP/1.1\r\nContent-Length: ' + length + b'\r\n\r\n',
+            b'GET /stats HTTP/1.1\r\n\r\n']))
+        head, _, body = response.partition(b'\r\n\r\n')
+        assert head.startswith(b'HTTP/1.1 400 ')
+        assert b'Connection: close' in head
+        assert 'Content-Length' in json.loads(body)['error']
+
+
+def test_body():
+    # a well-formed body is skipped and the connection is kept alive
+    response = asyncio.run(exchanging([
+        b'GET /stats HTTP/1.1\r\nContent-Length: 3\r\n\r\nabc',
+        b'GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n']))
+    assert response.count(b'HTTP/1.1 200 ') == 2
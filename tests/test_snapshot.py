@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+from CPVI.lexicon import lexicon
+from CPVI.snapshot import Snapshot, convert
+import pytest
+import shutil
+
+
+def test_version(tmp_path):
+    path = tmp_path / 'lexicon.snap'
+    convert(path)
+    with Snapshot(path) as snapshot:
+        assert snapshot.version == lexicon.version
+        assert snapshot.profile('گفت')['paradigm']
+
+    # a snapshot of the old data files is rejected once they change
+    shutil.copytree(lexicon.path, tmp_path / 'data')
+    irregulars = tmp_path / 'data' / 'irregulars.json'
+    irregulars.write_bytes(irregulars.read_bytes() + b'\n')
+    with pytest.raises(ValueError):
+        Snapshot(path, tmp_path / 'data')
+    convert(path, tmp_path / 'data')
+    with Snapshot(path, tmp_path / 'data') as snapshot:
+        assert snapshot.version != lexicon.version
+
+
+def test_short(tmp_path):
+    # a truncated or empty file is rejected like any other file
+    path = tmp_path / 'lexicon.snap'
+    convert(path)
+    for size in [40, 0]:
+        path.write_bytes(path.read_bytes()[:size])
+        with pytest.raises(ValueError):
+            Snapshot(path)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+from CPVI.lexicon import lexicon
+from CPVI.tagger import indexing, reading, tag, tokenizing
+import io
+import json
+
+CORPUS = ('او دیروز به خانه رفت و گفت که نمی\u200cآید.\n'
+          'ما فردا خواهیم رفت، اما آنها نگفته بودند که می\u200cروند.\n'
+          'او رفت' + ' و گفت' * 3000 + '.\n')
+
+
+def tagging(path, offset=0):
+    output = io.StringIO()
+    tag(path, output, offset)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def tokens(raw, offset=0, size=1 << 16):
+    return [(start, line[begin:end]) for start, line, begin, end
+            in tokenizing(reading(io.BytesIO(raw), offset, size))]
+
+
+def test_chunks():
+    raw = CORPUS.encode('utf-8')
+    whole = tokens(raw)
+    for size in [1, 3, 7, 64]:
+        assert tokens(raw, size=size) == whole
+    # the offsets are the byte offsets of the tokens
+    assert all(raw[start:].decode('utf-8').startswith(token)
+               for start, token in whole)
+
+
+def test_resume(tmp_path):
+    path = tmp_path / 'corpus.txt'
+    path.write_bytes(CORPUS.encode('utf-8'))
+    records = tagging(path)
+    assert records
+    # resuming from any written offset, even in the middle of a line, tags
+    # the rest of the corpus again
+    for n in [1, 2, 5, len(records) - 1]:
+        assert tagging(path, records[n]['offset']) == records[n:]
+
+
+def test_inside_token():
+    raw = CORPUS.encode('utf-8')
+    whole = tokens(raw)
+    start, token = whole[4]
+    # an offset inside a token or a character skips the rest of the token
+    for offset in range(start + 1, start + len(token.encode('utf-8'))):
+        assert tokens(raw, offset) == whole[5:]
+
+
+def test_generator():
+    verbs = (verb for verb in [('چرخید', 'ʧærxid')])
+    analyzer = indexing(verbs)
+    assert analyzer.analyze('می\u200cچرخیدم')
+    assert analyzer.analyze('میچرخیدم')
+
+
+def test_without_artifact(monkeypatch):
+    # the unspaced forms of irregulars are inflected when the artifact is
+    # missing or stale
+    monkeypatch.setattr(lexicon, '_artifact', {})
+    analyzer = indexing()
+    assert analyzer.analyze('می\u200cکردم')
+    assert analyzer.analyze('میکردم')
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+from CPVI import CPVI
+from CPVI.lexicon import lexicon
+from CPVI.transliteration import Transliterator, stem_pairs
+
+
+def test_held_out():
+    # leave every verb out and read its stems with the others
+    irregulars = lexicon.irregulars
+    first = among = total = 0
+    for gerund in irregulars:
+        others = {key: entry for key, entry in irregulars.items()
+                  if key != gerund}
+        transliterator = Transliterator(CPVI.IPA, stem_pairs(others))
+        for persian, sound in stem_pairs({gerund: irregulars[gerund]}):
+            readings = [reading for reading, _ in
+                        transliterator.candidates(persian, 3)]
+            first += readings[:1] == [sound]
+            among += sound in readings
+            total += 1
+    assert first / total >= 0.54
+    assert among / total >= 0.61
+
+
+def test_medial():
+    # a و between two consonant letters is read as a vowel, and the
+    # misspelled IPA forms of جویدن do not teach ج to read j
+    transliterator = Transliterator(CPVI.IPA, stem_pairs(lexicon.irregulars))
+    assert transliterator.transliterate('پوش') in ['puʃ', 'poʃ']
+    assert transliterator.transliterate('نوش') in ['nuʃ', 'noʃ']
+    assert transliterator.transliterate('جنگ').startswith('ʤ')
+    assert transliterator.transliterate_many(['پوش', 'جنگ']) == \
+        [reading for reading, _ in (transliterator.candidates('پوش', 1) +
+                                    transliterator.candidates('جنگ', 1))]
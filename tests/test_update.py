@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+from CPVI.build import replacing
+from CPVI.lexicon import lexicon, thaw
+from CPVI.update import splicing, update
+import json
+import os
+import pytest
+import shutil
+import stat
+
+
+@pytest.fixture
+def data(tmp_path):
+    # work on a copy so that the data files of the package are untouched
+    path = lexicon.path
+    shutil.copytree(path, tmp_path / 'data')
+    lexicon.path = tmp_path / 'data'
+    lexicon.reload()
+    yield tmp_path / 'data'
+    lexicon.path = path
+    lexicon.reload()
+
+
+def test_splicing():
+    text = (lexicon.path / 'irregulars.json').read_text(encoding='utf-8')
+    old = json.loads(text)
+    assert splicing(text, old) == text
+    new = dict(old, **{'رفتن': dict(old['رفتن'], regularity='regular')})
+    new.pop('بودن')
+    spliced = splicing(text, new)
+    assert json.loads(spliced) == new and list(json.loads(spliced)) == list(new)
+    # the unchanged entries keep their formatting
+    start = text.index('"گفتن"')
+    end = text.index('"گرفتن"')
+    assert text[start:end] in spliced
+
+
+def test_update(data):
+    props = thaw(lexicon.irregulars['رفتن'])
+    props['informal Persian past stem'] = 'رف'
+    before = (data / 'irregulars.json').read_text(encoding='utf-8')
+    update({'رفتن': props})
+    after = (data / 'irregulars.json').read_text(encoding='utf-8')
+    assert lexicon.irregulars['رفتن']['informal Persian past stem'] == 'رف'
+    assert len(after.splitlines()) - len(before.splitlines()) < 60
+
+
+def test_crash(data, monkeypatch):
+    # a failure while the file is replaced leaves the old file whole
+    before = (data / 'irregulars.json').read_bytes()
+    files = sorted(os.listdir(data))
+
+    def failing(*args):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(os, 'replace', failing)
+    with pytest.raises(OSError):
+        update({'رفتن': None})
+    assert (data / 'irregulars.json').read_bytes() == before
+    assert sorted(os.listdir(data)) == files
+
+
+def test_permissions(tmp_path):
+    # a replaced file keeps its permissions, and a new one is not private
+    path = tmp_path / 'irregulars.json'
+    path.write_bytes(b'{}')
+    path.chmod(0o640)
+    replacing(path, b'{"a": 1}')
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    replacing(tmp_path / 'new.json', b'{}')
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE((tmp_path / 'new.json').stat().st_mode) == 0o666 & ~umask